@@ -0,0 +1,164 @@
+"""Compare DOCX extraction paths of FileTextExtractor.
+
+- dom:       copy the stream to a temp file, then build the python-docx Document (previous implementation)
+- streaming: iterparse word/document.xml straight from the zip (current)
+
+Each document carries an incompressible media part to mimic scripts with embedded images.
+Peak memory is the peak-RSS growth of a fresh child process, because tracemalloc does not see
+lxml's allocations.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_docx_extractor --paragraphs 50000 --media-mb 20
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import zipfile
+from collections.abc import Callable, Iterator
+from io import BytesIO
+from typing import BinaryIO
+from xml.sax.saxutils import escape
+
+from docx import Document
+
+from benchmarks.bench_script_chunker import time_best
+from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+LINES = (
+    "第{index}场 日 内 客厅",
+    "张三：（推门而入）你怎么还在这里？我们说好八点出发的。",
+    "李四：路上堵车了。Give me five minutes, I'll be right there!",
+    "【旁白】窗外的雨越下越大，他们谁也没有再说话。",
+)
+
+
+def build_docx(paragraph_count: int, media_mb: float) -> bytes:
+    template = BytesIO()
+    Document().save(template)
+
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(LINES[index % len(LINES)].format(index=index))}</w:t></w:r></w:p>'
+        for index in range(paragraph_count)
+    )
+    document_xml = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NAMESPACE}"><w:body>{paragraphs}<w:sectPr/></w:body></w:document>'
+    )
+
+    output = BytesIO()
+    with zipfile.ZipFile(template) as source, zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            if item.filename == "word/document.xml":
+                target.writestr(item.filename, document_xml)
+            else:
+                target.writestr(item, source.read(item.filename))
+        target.writestr("word/media/image1.png", os.urandom(int(media_mb * 1024 * 1024)))
+    return output.getvalue()
+
+
+def iter_dom_paragraphs(file_stream: BinaryIO) -> Iterator[str]:
+    fd, temp_path = tempfile.mkstemp(suffix=".docx")
+    os.close(fd)
+    try:
+        with open(temp_path, "wb") as temp_file:
+            while chunk := file_stream.read(1024 * 1024):
+                temp_file.write(chunk)
+        document = Document(temp_path)
+        for paragraph in document.paragraphs:
+            paragraph_text = paragraph.text.strip()
+            if paragraph_text:
+                yield paragraph_text
+                yield "\n"
+    finally:
+        os.remove(temp_path)
+
+
+def iter_streaming_paragraphs(file_stream: BinaryIO) -> Iterator[str]:
+    return FileTextExtractor().iter_text_segments_from_stream(file_stream, "docx")
+
+
+class ForwardOnlyStream:
+    def __init__(self, data: bytes):
+        self._stream = BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
+IMPLEMENTATIONS: dict[str, Callable[[BinaryIO], Iterator[str]]] = {
+    "dom": iter_dom_paragraphs,
+    "streaming": iter_streaming_paragraphs,
+}
+STREAM_KINDS: dict[str, Callable[[bytes], BinaryIO]] = {
+    "seekable": BytesIO,
+    "forward-only": ForwardOnlyStream,
+}
+
+
+def consume(name: str, stream_kind: str, data: bytes) -> int:
+    return sum(len(segment) for segment in IMPLEMENTATIONS[name](STREAM_KINDS[stream_kind](data)))
+
+
+def _peak_rss_kib() -> int:
+    # ru_maxrss survives exec on Linux and would report the parent's peak; VmHWM is per address space.
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _peak_rss_child(name: str, stream_kind: str, data_path: str, queue) -> None:
+    with open(data_path, "rb") as data_file:
+        data = data_file.read()
+    baseline_kib = _peak_rss_kib()
+    consume(name, stream_kind, data)
+    queue.put(_peak_rss_kib() - baseline_kib)
+
+
+def measure_peak_rss_kib(name: str, stream_kind: str, data_path: str) -> int:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_peak_rss_child, args=(name, stream_kind, data_path, queue))
+    process.start()
+    peak_kib = queue.get()
+    process.join()
+    return peak_kib
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, default=50000)
+    parser.add_argument("--media-mb", type=float, default=20.0, help="size of the embedded media part")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = build_docx(args.paragraphs, args.media_mb)
+    fd, data_path = tempfile.mkstemp(suffix=".docx")
+    with os.fdopen(fd, "wb") as data_file:
+        data_file.write(data)
+
+    print(f"paragraphs={args.paragraphs} media_mb={args.media_mb} docx_bytes={len(data)} repeat={args.repeat}")
+    try:
+        expected = consume("dom", "seekable", data)
+        for stream_kind in STREAM_KINDS:
+            for name in IMPLEMENTATIONS:
+                seconds, chars = time_best(lambda: consume(name, stream_kind, data), args.repeat)
+                if chars != expected:
+                    raise SystemExit(f"{name} extracted {chars} characters, expected {expected}")
+                peak_kib = measure_peak_rss_kib(name, stream_kind, data_path)
+                print(f"{stream_kind:>12} {name:>9}: {seconds * 1000:8.1f}ms  peak_rss=+{peak_kib / 1024:.1f}MiB")
+    finally:
+        os.remove(data_path)
+
+
+if __name__ == "__main__":
+    main()
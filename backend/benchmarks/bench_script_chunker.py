@@ -0,0 +1,135 @@
+"""Compare split-point search strategies of ScriptSentenceWindowTextSplitter.
+
+- slice:   copy the window, then rfind each sentence ending (previous implementation)
+- bounded: rfind each sentence ending within [start, end) of the full text (current)
+- index:   one compiled character-class scan for all endings, then bisect per chunk
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_script_chunker --size-mb 4
+"""
+
+import argparse
+import bisect
+import random
+import re
+import time
+from collections.abc import Callable
+
+from src.modules.scripts.infrastructure.services.script_chunker import ScriptSentenceWindowTextSplitter
+
+
+class SliceRfindTextSplitter(ScriptSentenceWindowTextSplitter):
+    def _find_split_end(self, text: str, start: int, raw_end: int) -> int:
+        safe_end = min(raw_end, len(text))
+        if safe_end > start and text[safe_end - 1] in self.SENTENCE_ENDINGS:
+            return safe_end
+        window = text[start:safe_end]
+        nearest = max(window.rfind(symbol) for symbol in self.SENTENCE_ENDINGS)
+        if nearest != -1:
+            return start + nearest + 1
+        return safe_end
+
+
+class BoundaryIndexTextSplitter(ScriptSentenceWindowTextSplitter):
+    PATTERN = re.compile("[" + re.escape("".join(ScriptSentenceWindowTextSplitter.SENTENCE_ENDINGS)) + "]")
+
+    def _split_with_indices(self, text: str) -> list[tuple[str, int, int]]:
+        if not text.strip():
+            return []
+
+        sentence_ends = [match.end() for match in self.PATTERN.finditer(text)]
+        chunks: list[tuple[str, int, int]] = []
+        text_length = len(text)
+        start = 0
+        while start < text_length:
+            if text_length - start <= self._chunk_size:
+                split_end = text_length
+            else:
+                raw_end = start + self._chunk_size
+                position = bisect.bisect_right(sentence_ends, raw_end) - 1
+                split_end = sentence_ends[position] if position >= 0 and sentence_ends[position] > start else raw_end
+
+            raw_chunk = text[start:split_end]
+            trimmed_chunk = raw_chunk.strip()
+            if trimmed_chunk:
+                leading_ws = len(raw_chunk) - len(raw_chunk.lstrip())
+                trailing_ws = len(raw_chunk) - len(raw_chunk.rstrip())
+                chunks.append((trimmed_chunk, start + leading_ws, split_end - trailing_ws))
+
+            if split_end >= text_length:
+                break
+            next_start = max(split_end - self._chunk_overlap, start + 1)
+            start = split_end if next_start >= split_end else next_start
+        return chunks
+
+
+def build_cjk_text(size_chars: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    alphabet = "他她我们走到门口看着窗外的雨夜城市灯光忽然安静下来心里想起很久以前的事情"
+    endings = "。！？；"
+    parts: list[str] = []
+    total = 0
+    while total < size_chars:
+        sentence = "".join(rng.choice(alphabet) for _ in range(rng.randint(8, 60))) + rng.choice(endings)
+        if rng.random() < 0.1:
+            sentence += "\n"
+        parts.append(sentence)
+        total += len(sentence)
+    return "".join(parts)[:size_chars]
+
+
+def build_latin_text(size_chars: int, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    words = ["the", "door", "opens", "slowly", "rain", "falls", "over", "city", "lights", "she", "waits"]
+    endings = ".!?;"
+    parts: list[str] = []
+    total = 0
+    while total < size_chars:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(4, 30))) + rng.choice(endings) + " "
+        parts.append(sentence)
+        total += len(sentence)
+    return "".join(parts)[:size_chars]
+
+
+def time_best(function: Callable[[], object], repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    result: object = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=4.0, help="approximate text size in MB of characters")
+    parser.add_argument("--chunk-size", type=int, default=1200)
+    parser.add_argument("--overlap", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    size_chars = int(args.size_mb * 1024 * 1024)
+    splitters = {
+        "slice": SliceRfindTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.overlap),
+        "bounded": ScriptSentenceWindowTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.overlap),
+        "index": BoundaryIndexTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.overlap),
+    }
+
+    print(f"chars={size_chars} chunk_size={args.chunk_size} overlap={args.overlap} repeat={args.repeat}")
+    for label, text in (("cjk", build_cjk_text(size_chars)), ("latin", build_latin_text(size_chars))):
+        timings: dict[str, float] = {}
+        reference = None
+        for name, splitter in splitters.items():
+            seconds, chunks = time_best(lambda: splitter._split_with_indices(text), args.repeat)
+            if reference is None:
+                reference = chunks
+            elif chunks != reference:
+                raise SystemExit(f"{label}: {name} splitter disagrees with slice splitter")
+            timings[name] = seconds
+        summary = " ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in timings.items())
+        print(f"{label:>6}: chunks={len(reference)} {summary}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Throughput and peak memory of the streaming splitter against the previous copy-based buffer.
+
+The previous implementation appended every segment with ``buffer += segment`` and dropped
+each emitted chunk with ``buffer = buffer[next_start:]``, copying the unread buffer every
+time. The current one keeps a cursor into the buffer and only compacts when new segments
+are merged in.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_script_splitter_streaming --size-mb 10
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+
+from benchmarks.bench_script_chunker import build_cjk_text, build_latin_text
+from src.modules.scripts.infrastructure.services.script_chunker import ScriptSentenceWindowTextSplitter
+
+
+class CopyingBufferTextSplitter(ScriptSentenceWindowTextSplitter):
+    def _iter_split_streaming_with_indices(self, text_segments: Iterable[str]) -> Iterator[tuple[str, int, int]]:
+        buffer = ""
+        buffer_start_index = 0
+        for segment in text_segments:
+            if not segment:
+                continue
+            buffer += segment
+            while len(buffer) > self._chunk_size:
+                split_end = self._find_split_end(buffer, 0, self._chunk_size)
+                yield from self._emit(buffer[:split_end], buffer_start_index)
+                next_start = max(split_end - self._chunk_overlap, 1)
+                buffer = buffer[next_start:]
+                buffer_start_index += next_start
+        if buffer:
+            yield from self._emit(buffer, buffer_start_index)
+
+    @staticmethod
+    def _emit(raw_chunk: str, start_index: int) -> Iterator[tuple[str, int, int]]:
+        trimmed_chunk = raw_chunk.strip()
+        if trimmed_chunk:
+            leading_ws = len(raw_chunk) - len(raw_chunk.lstrip())
+            trailing_ws = len(raw_chunk) - len(raw_chunk.rstrip())
+            yield trimmed_chunk, start_index + leading_ws, start_index + len(raw_chunk) - trailing_ws
+
+
+def iter_segments(text: str, segment_size: int) -> Iterator[str]:
+    for start in range(0, len(text), segment_size):
+        yield text[start:start + segment_size]
+
+
+def run_once(splitter: ScriptSentenceWindowTextSplitter, text: str, segment_size: int) -> tuple[int, int]:
+    chunk_count = 0
+    checksum = 0
+    for _, start_index, end_index in splitter._iter_split_streaming_with_indices(iter_segments(text, segment_size)):
+        chunk_count += 1
+        checksum = (checksum * 31 + start_index * 7 + end_index) % 1_000_000_007
+    return chunk_count, checksum
+
+
+def measure(
+    splitter: ScriptSentenceWindowTextSplitter,
+    text: str,
+    segment_size: int,
+    repeat: int,
+) -> tuple[float, int, tuple[int, int]]:
+    best = float("inf")
+    result = (0, 0)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run_once(splitter, text, segment_size)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run_once(splitter, text, segment_size)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak_bytes, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=10.0, help="approximate text size in MB of characters")
+    parser.add_argument("--chunk-size", type=int, default=1200)
+    parser.add_argument("--overlap", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument(
+        "--segment-sizes",
+        default="32,4096,65536,0",
+        help="comma separated segment sizes in characters; 0 streams the whole text as one segment",
+    )
+    parser.add_argument(
+        "--legacy-max-mb",
+        type=float,
+        default=4.0,
+        help="skip the copy-based splitter above this size; it is quadratic for large segments",
+    )
+    args = parser.parse_args()
+
+    size_chars = int(args.size_mb * 1024 * 1024)
+    current = ScriptSentenceWindowTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.overlap)
+    legacy = CopyingBufferTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.overlap)
+    segment_sizes = [int(value) for value in args.segment_sizes.split(",") if value.strip()]
+
+    print(f"chars={size_chars} chunk_size={args.chunk_size} overlap={args.overlap} repeat={args.repeat}")
+    for label, text in (("cjk", build_cjk_text(size_chars)), ("latin", build_latin_text(size_chars))):
+        for segment_size in segment_sizes:
+            effective_segment_size = segment_size or len(text)
+            seconds, peak_bytes, result = measure(current, text, effective_segment_size, args.repeat)
+            line = (
+                f"{label:>6} segment={segment_size or 'whole':>6}: chunks={result[0]} "
+                f"offset={seconds * 1000:.0f}ms ({size_chars / seconds / 1e6:.1f}M chars/s) "
+                f"peak={peak_bytes / 1024:.0f}KiB"
+            )
+            if args.size_mb <= args.legacy_max_mb:
+                legacy_seconds, legacy_peak_bytes, legacy_result = measure(
+                    legacy,
+                    text,
+                    effective_segment_size,
+                    args.repeat,
+                )
+                if legacy_result != result:
+                    raise SystemExit(f"{label}: splitters disagree for segment size {segment_size}")
+                line += f" | copying={legacy_seconds * 1000:.0f}ms peak={legacy_peak_bytes / 1024:.0f}KiB"
+            else:
+                line += " | copying=skipped"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,13 @@ class ElasticsearchSettings(BaseSettings):
     url: str = "http://127.0.0.1:9200/"
     script_chunk_index: str = "script_chunks"
     request_timeout_seconds: int = 10
+    connect_timeout_seconds: float = 3.0
+    bulk_request_timeout_seconds: int = 60
+    max_connections: int = 50
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    bulk_batch_size: int = 500
+    bulk_max_bytes: int = 5 * 1024 * 1024
 
     class Config:
         env_prefix = "ELASTICSEARCH_"
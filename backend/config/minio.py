@@ -7,6 +7,10 @@ class MinIOSettings(BaseSettings):
     secret_key: str = "minioadmin"
     bucket_name: str = "scripts"
     secure: bool = False
+    # Host clients use for presigned URLs when it differs from the endpoint the API reaches MinIO on.
+    public_endpoint: str = ""
+    public_secure: bool | None = None
+    region: str = "us-east-1"
 
     class Config:
         env_prefix = "MINIO_"
@@ -19,6 +19,20 @@ class Settings(BaseSettings):
     scripts_chunk_size: int = 1200
     scripts_chunk_overlap: int = 200
     scripts_upload_max_text_length: int = 10000
+    scripts_chunk_job_max_concurrency: int = 2
+    scripts_chunk_job_ttl_seconds: int = 86400
+    scripts_rechunk_max_workers: int = 0
+    scripts_pdf_extract_max_workers: int = 0
+    scripts_chunk_cache_enabled: bool = True
+    scripts_chunk_cache_ttl_seconds: int = 3600
+    scripts_chunk_cache_max_bytes: int = 4 * 1024 * 1024
+    scripts_embedding_enabled: bool = False
+    scripts_embedding_dimensions: int = 256
+    scripts_avatar_cache_max_bytes: int = 16 * 1024 * 1024
+    scripts_avatar_thumbnails_enabled: bool = True
+    scripts_presigned_transfer_enabled: bool = False
+    scripts_presigned_url_ttl_seconds: int = 900
+    scripts_presigned_upload_max_bytes: int = 100 * 1024 * 1024
 
     database: DatabaseSettings = DatabaseSettings()
     redis: RedisSettings = RedisSettings()
@@ -13,6 +13,8 @@ from src.shared.infrastructure.database import (
     create_database_if_not_exists,
     engine,
 )
+from src.modules.scripts.api.dependencies import shutdown_script_chunk_job_runner
+from src.shared.infrastructure.elasticsearch import ElasticsearchClient
 from src.shared.middleware.error_handler import register_exception_handlers
 from src.shared.middleware.logging import LoggingMiddleware, setup_logging
 from src.api.v1.router import router as v1_router
@@ -145,6 +147,134 @@ BEGIN
 END $$;
 """
 
+SCRIPT_CONTENT_HASH_SCHEMA_MIGRATION_SQL = """
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.tables
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts'
+    ) THEN
+        RETURN;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts'
+          AND column_name = 'content_hash'
+    ) THEN
+        ALTER TABLE public.scripts
+            ADD COLUMN content_hash VARCHAR(64);
+    END IF;
+
+    CREATE INDEX IF NOT EXISTS ix_scripts_content_hash ON public.scripts (content_hash);
+END $$;
+"""
+
+SCRIPT_CONFIG_AUTO_CHUNK_SCHEMA_MIGRATION_SQL = """
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.tables
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts_configs'
+    ) THEN
+        RETURN;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts_configs'
+          AND column_name = 'auto_chunk_on_upload'
+    ) THEN
+        ALTER TABLE public.scripts_configs
+            ADD COLUMN auto_chunk_on_upload BOOLEAN NOT NULL DEFAULT FALSE;
+    END IF;
+END $$;
+"""
+
+SCRIPT_BLOB_SCHEMA_MIGRATION_SQL = """
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.tables
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts'
+    ) THEN
+        RETURN;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts'
+          AND column_name = 'chunk_size'
+    ) THEN
+        ALTER TABLE public.scripts
+            ADD COLUMN chunk_size INTEGER;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'scripts'
+          AND column_name = 'chunk_overlap'
+    ) THEN
+        ALTER TABLE public.scripts
+            ADD COLUMN chunk_overlap INTEGER;
+    END IF;
+
+    ALTER TABLE public.scripts DROP CONSTRAINT IF EXISTS scripts_storage_path_key;
+
+    IF EXISTS (
+        SELECT 1
+        FROM pg_indexes
+        WHERE schemaname = 'public'
+          AND tablename = 'scripts'
+          AND indexname = 'ix_scripts_storage_path'
+          AND indexdef LIKE 'CREATE UNIQUE INDEX%'
+    ) THEN
+        DROP INDEX public.ix_scripts_storage_path;
+    END IF;
+
+    CREATE INDEX IF NOT EXISTS ix_scripts_storage_path ON public.scripts (storage_path);
+END $$;
+"""
+
+SCRIPT_CHUNK_FINGERPRINT_SCHEMA_MIGRATION_SQL = """
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.tables
+        WHERE table_schema = 'public'
+          AND table_name = 'script_chunks'
+    ) THEN
+        RETURN;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'script_chunks'
+          AND column_name = 'fingerprint'
+    ) THEN
+        ALTER TABLE public.script_chunks
+            ADD COLUMN fingerprint VARCHAR(64);
+    END IF;
+END $$;
+"""
+
 PROVIDER_USER_SCHEMA_MIGRATION_SQL = """
 DO $$
 DECLARE
@@ -347,11 +477,17 @@ async def lifespan(app: FastAPI):
         await conn.execute(text(SCRIPT_LIBRARY_MAPPING_SCHEMA_MIGRATION_SQL))
         await conn.execute(text(SCRIPT_CHUNK_REFERENCE_SCHEMA_MIGRATION_SQL))
         await conn.execute(text(SCRIPT_LIBRARY_AVATAR_SCHEMA_MIGRATION_SQL))
+        await conn.execute(text(SCRIPT_CONTENT_HASH_SCHEMA_MIGRATION_SQL))
+        await conn.execute(text(SCRIPT_CONFIG_AUTO_CHUNK_SCHEMA_MIGRATION_SQL))
+        await conn.execute(text(SCRIPT_BLOB_SCHEMA_MIGRATION_SQL))
+        await conn.execute(text(SCRIPT_CHUNK_FINGERPRINT_SCHEMA_MIGRATION_SQL))
         await conn.execute(text(PROVIDER_USER_SCHEMA_MIGRATION_SQL))
         await conn.execute(text(SYSTEM_MODEL_CONFIG_SCHEMA_MIGRATION_SQL))
         await conn.run_sync(Base.metadata.create_all)
     await _load_provider_api_keys_from_database()
     yield
+    await shutdown_script_chunk_job_runner()
+    await ElasticsearchClient.close()
 
 app = FastAPI(
     title="WeiMeng Backend",
@@ -1,15 +1,34 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import settings
 from src.modules.scripts.application.services.script_app_service import ScriptAppService
+from src.modules.scripts.application.services.script_chunk_job_runner import ScriptChunkJobRunner
+from src.modules.scripts.application.services.script_chunk_retrieval_service import ScriptChunkRetrievalService
+from src.modules.scripts.infrastructure.repositories.script_chunk_cache import ScriptChunkCache
+from src.modules.scripts.infrastructure.repositories.script_chunk_job_repository import (
+    ScriptChunkJobRepository,
+)
 from src.modules.scripts.infrastructure.repositories.script_repository import ScriptRepository
 from src.modules.scripts.infrastructure.services.elasticsearch_chunk_store import (
     ElasticsearchChunkStore,
 )
 from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+from src.modules.scripts.infrastructure.services.hashing_chunk_embedder import HashingChunkEmbedder
+from src.modules.scripts.infrastructure.services.image_thumbnailer import ImageThumbnailer
+from src.modules.scripts.infrastructure.services.library_avatar_cache import LibraryAvatarCache
+from src.modules.scripts.infrastructure.services.pdf_text_extractor import PdfTextExtractor
+from src.modules.scripts.infrastructure.services.script_chunk_process_pool import ScriptChunkProcessPool
 from src.shared.extensions.storage.minio_provider import MinIOProvider
-from src.shared.infrastructure.database import get_db
+from src.shared.infrastructure.database import AsyncSessionLocal, get_db
+from src.shared.infrastructure.redis import RedisRepository
 
 
 async def get_script_repository(db: AsyncSession = Depends(get_db)) -> ScriptRepository:
@@ -20,12 +39,126 @@ async def get_storage_provider() -> MinIOProvider:
     return MinIOProvider()
 
 
-async def get_script_chunk_store() -> ElasticsearchChunkStore:
+@lru_cache(maxsize=1)
+def _get_shared_script_chunk_store() -> ElasticsearchChunkStore:
     return ElasticsearchChunkStore()
 
 
+async def get_script_chunk_store() -> ElasticsearchChunkStore:
+    return _get_shared_script_chunk_store()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_pdf_text_extractor() -> PdfTextExtractor:
+    return PdfTextExtractor(max_workers=settings.scripts_pdf_extract_max_workers or os.cpu_count() or 1)
+
+
 async def get_file_text_extractor() -> FileTextExtractor:
-    return FileTextExtractor()
+    return FileTextExtractor(pdf_text_extractor=_get_shared_pdf_text_extractor())
+
+
+@lru_cache(maxsize=1)
+def _get_shared_script_chunk_cache() -> ScriptChunkCache | None:
+    if not settings.scripts_chunk_cache_enabled:
+        return None
+    return ScriptChunkCache(
+        ttl_seconds=max(1, settings.scripts_chunk_cache_ttl_seconds),
+        max_bytes=max(0, settings.scripts_chunk_cache_max_bytes),
+    )
+
+
+async def get_script_chunk_cache() -> ScriptChunkCache | None:
+    return _get_shared_script_chunk_cache()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_script_chunk_embedder() -> HashingChunkEmbedder | None:
+    if not settings.scripts_embedding_enabled:
+        return None
+    return HashingChunkEmbedder(dimensions=settings.scripts_embedding_dimensions)
+
+
+async def get_script_chunk_embedder() -> HashingChunkEmbedder | None:
+    return _get_shared_script_chunk_embedder()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_script_chunk_retrieval_service() -> ScriptChunkRetrievalService:
+    return ScriptChunkRetrievalService(
+        script_chunk_store=_get_shared_script_chunk_store(),
+        chunk_embedder=_get_shared_script_chunk_embedder(),
+    )
+
+
+async def get_script_chunk_retrieval_service() -> ScriptChunkRetrievalService:
+    return _get_shared_script_chunk_retrieval_service()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_library_avatar_cache() -> LibraryAvatarCache | None:
+    if settings.scripts_avatar_cache_max_bytes <= 0:
+        return None
+    return LibraryAvatarCache(
+        max_bytes=settings.scripts_avatar_cache_max_bytes,
+        max_item_bytes=settings.scripts_avatar_cache_max_bytes // 8,
+    )
+
+
+async def get_library_avatar_cache() -> LibraryAvatarCache | None:
+    return _get_shared_library_avatar_cache()
+
+
+async def get_avatar_thumbnailer() -> ImageThumbnailer | None:
+    if not settings.scripts_avatar_thumbnails_enabled or not ImageThumbnailer.is_available():
+        return None
+    return ImageThumbnailer()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_script_chunk_process_pool() -> ScriptChunkProcessPool:
+    return ScriptChunkProcessPool(max_workers=settings.scripts_rechunk_max_workers or None)
+
+
+@asynccontextmanager
+async def _open_background_script_app_service() -> AsyncIterator[ScriptAppService]:
+    async with AsyncSessionLocal() as session:
+        yield ScriptAppService(
+            script_repository=ScriptRepository(session),
+            storage_provider=MinIOProvider(),
+            script_chunk_store=_get_shared_script_chunk_store(),
+            file_text_extractor=FileTextExtractor(pdf_text_extractor=_get_shared_pdf_text_extractor()),
+            upload_max_text_length=max(1, settings.scripts_upload_max_text_length),
+            chunk_cache=_get_shared_script_chunk_cache(),
+            chunk_embedder=_get_shared_script_chunk_embedder(),
+            chunk_retrieval_service=_get_shared_script_chunk_retrieval_service(),
+            chunk_process_pool=_get_shared_script_chunk_process_pool(),
+        )
+
+
+@lru_cache(maxsize=1)
+def _get_shared_script_chunk_job_runner() -> ScriptChunkJobRunner:
+    return ScriptChunkJobRunner(
+        job_repository=ScriptChunkJobRepository(
+            RedisRepository(),
+            ttl_seconds=max(1, settings.scripts_chunk_job_ttl_seconds),
+        ),
+        service_factory=_open_background_script_app_service,
+        max_concurrency=settings.scripts_chunk_job_max_concurrency,
+        process_pool_max_concurrency=_get_shared_script_chunk_process_pool().max_workers * 2,
+    )
+
+
+async def get_script_chunk_job_runner() -> ScriptChunkJobRunner:
+    return _get_shared_script_chunk_job_runner()
+
+
+async def shutdown_script_chunk_job_runner() -> None:
+    if _get_shared_script_chunk_job_runner.cache_info().currsize:
+        await _get_shared_script_chunk_job_runner().shutdown()
+    if _get_shared_script_chunk_process_pool.cache_info().currsize:
+        await asyncio.to_thread(_get_shared_script_chunk_process_pool().shutdown)
+    if _get_shared_pdf_text_extractor.cache_info().currsize:
+        await asyncio.to_thread(_get_shared_pdf_text_extractor().shutdown)
 
 
 async def get_script_app_service(
@@ -33,6 +166,12 @@ async def get_script_app_service(
     storage_provider: MinIOProvider = Depends(get_storage_provider),
     script_chunk_store: ElasticsearchChunkStore = Depends(get_script_chunk_store),
     file_text_extractor: FileTextExtractor = Depends(get_file_text_extractor),
+    chunk_job_runner: ScriptChunkJobRunner = Depends(get_script_chunk_job_runner),
+    chunk_cache: ScriptChunkCache | None = Depends(get_script_chunk_cache),
+    chunk_embedder: HashingChunkEmbedder | None = Depends(get_script_chunk_embedder),
+    chunk_retrieval_service: ScriptChunkRetrievalService = Depends(get_script_chunk_retrieval_service),
+    avatar_thumbnailer: ImageThumbnailer | None = Depends(get_avatar_thumbnailer),
+    avatar_cache: LibraryAvatarCache | None = Depends(get_library_avatar_cache),
 ) -> ScriptAppService:
     return ScriptAppService(
         script_repository=script_repo,
@@ -40,4 +179,16 @@ async def get_script_app_service(
         script_chunk_store=script_chunk_store,
         file_text_extractor=file_text_extractor,
         upload_max_text_length=max(1, settings.scripts_upload_max_text_length),
+        chunk_job_runner=chunk_job_runner,
+        chunk_cache=chunk_cache,
+        chunk_embedder=chunk_embedder,
+        chunk_retrieval_service=chunk_retrieval_service,
+        avatar_thumbnailer=avatar_thumbnailer,
+        avatar_cache=avatar_cache,
+        presigned_url_ttl=(
+            timedelta(seconds=max(1, settings.scripts_presigned_url_ttl_seconds))
+            if settings.scripts_presigned_transfer_enabled
+            else None
+        ),
+        presigned_upload_max_bytes=max(1, settings.scripts_presigned_upload_max_bytes),
     )
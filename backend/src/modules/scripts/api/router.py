@@ -1,11 +1,24 @@
+import json
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Response, Security, UploadFile, status
+from fastapi import APIRouter, Depends, File, Query, Request, Response, Security, UploadFile, status
+from fastapi.responses import StreamingResponse
 
 from src.modules.scripts.api.dependencies import get_script_app_service
-from src.modules.scripts.application.dto.script_chunk_dto import ScriptChunkResponse
+from src.modules.scripts.application.dto.script_chunk_dto import (
+    ScriptChunkHybridSearchResponse,
+    ScriptChunkJobResponse,
+    ScriptChunkResponse,
+    ScriptChunkSearchResponse,
+    ScriptLibraryRechunkResponse,
+)
 from src.modules.scripts.application.dto.script_dto import (
     CreateScriptLibraryRequest,
+    FinalizeScriptUploadRequest,
+    PresignScriptUploadRequest,
     ScriptContentResponse,
     ScriptDeleteResponse,
     ScriptItemResponse,
@@ -13,11 +26,17 @@ from src.modules.scripts.application.dto.script_dto import (
     ScriptLibraryDeleteResponse,
     ScriptLibraryDetailResponse,
     ScriptLibraryResponse,
+    ScriptPresignedDownloadResponse,
+    ScriptPresignedUploadResponse,
+    ScriptTextRange,
+    ScriptTextStream,
     ScriptUploadResponse,
     UpdateScriptLibraryRequest,
     UpdateScriptLibraryConfigRequest,
 )
 from src.modules.scripts.application.services.script_app_service import ScriptAppService
+from src.modules.scripts.domain.exceptions import ScriptTextRangeNotSatisfiableError
+from src.shared.domain.exceptions import DomainException
 from src.shared.common.dependencies import get_current_user_id
 
 router = APIRouter(
@@ -27,6 +46,8 @@ router = APIRouter(
     responses={401: {"description": "Not authenticated"}},
 )
 
+TEXT_RANGE_PATTERN = re.compile(r"^\s*(bytes|chars)\s*=\s*(\d+)\s*-\s*(\d*)\s*$")
+
 
 @router.post(
     "/libraries",
@@ -102,6 +123,31 @@ async def upload_script(
     return await service.upload_script(library_id, file)
 
 
+@router.post(
+    "/libraries/{library_id}/upload/presign",
+    response_model=ScriptPresignedUploadResponse,
+)
+async def presign_script_upload(
+    library_id: UUID,
+    request: PresignScriptUploadRequest,
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.presign_script_upload(library_id, request)
+
+
+@router.post(
+    "/libraries/{library_id}/upload/finalize",
+    response_model=ScriptUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def finalize_script_upload(
+    library_id: UUID,
+    request: FinalizeScriptUploadRequest,
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.finalize_presigned_script_upload(library_id, request)
+
+
 @router.post(
     "/libraries/{library_id}/avatar",
     response_model=ScriptLibraryResponse,
@@ -118,10 +164,28 @@ async def upload_script_library_avatar(
 @router.get("/libraries/{library_id}/avatar")
 async def get_script_library_avatar(
     library_id: UUID,
+    request: Request,
+    size: int | None = Query(default=None, ge=1, le=4096, description="列表视图所需的头像边长（像素）"),
     service: ScriptAppService = Depends(get_script_app_service),
 ):
-    avatar_bytes, content_type = await service.get_library_avatar(library_id)
-    return Response(content=avatar_bytes, media_type=content_type)
+    avatar = await service.open_library_avatar(library_id, size=size)
+    headers = {"ETag": avatar.etag, "Cache-Control": "private, no-cache"}
+    if avatar.last_modified is not None:
+        headers["Last-Modified"] = _format_http_date(avatar.last_modified)
+    if _is_not_modified(request, avatar.etag, avatar.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    avatar_bytes = await service.read_library_avatar(avatar)
+    return Response(content=avatar_bytes, media_type=avatar.content_type, headers=headers)
+
+
+@router.get("/libraries/{library_id}/avatar/url", response_model=ScriptPresignedDownloadResponse)
+async def get_script_library_avatar_url(
+    library_id: UUID,
+    size: int | None = Query(default=None, ge=1, le=4096, description="列表视图所需的头像边长（像素）"),
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.presign_library_avatar_download(library_id, size=size)
 
 
 @router.get("/libraries/{library_id}/files", response_model=list[ScriptItemResponse])
@@ -144,30 +208,201 @@ async def get_script_text_content(
     return await service.get_script_text_content(library_id, script_id)
 
 
+@router.get(
+    "/libraries/{library_id}/files/{script_id}/download-url",
+    response_model=ScriptPresignedDownloadResponse,
+)
+async def get_script_download_url(
+    library_id: UUID,
+    script_id: UUID,
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.presign_script_download(library_id, script_id)
+
+
+@router.get(
+    "/libraries/{library_id}/files/{script_id}/content/raw",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/plain": {}}, "description": "Full script text"},
+        206: {"content": {"text/plain": {}}, "description": "Requested bytes or chars range"},
+        304: {"description": "Script text not modified"},
+        416: {"description": "Requested range not satisfiable"},
+    },
+)
+async def stream_script_text_content(
+    library_id: UUID,
+    script_id: UUID,
+    request: Request,
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    text_stream = await service.open_script_text_stream(library_id, script_id)
+    headers = {
+        "ETag": text_stream.etag,
+        "Last-Modified": _format_http_date(text_stream.last_modified),
+        "Accept-Ranges": "bytes, chars",
+        "Cache-Control": "private, no-cache",
+    }
+    if _is_not_modified(request, text_stream.etag, text_stream.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    text_range = _parse_text_range(request.headers.get("range"))
+    if text_range is not None and _is_range_current(request, text_stream):
+        try:
+            range_content = await service.read_script_text_range(text_stream, text_range)
+        except ScriptTextRangeNotSatisfiableError as exc:
+            headers["Content-Range"] = f"{exc.unit} */{exc.total}"
+            return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+        total = "*" if range_content.total is None else range_content.total
+        headers["Content-Range"] = f"{range_content.unit} {range_content.start}-{range_content.end}/{total}"
+        return Response(
+            content=range_content.content,
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type="text/plain",
+            headers=headers,
+        )
+
+    return StreamingResponse(service.iter_script_text(text_stream), media_type="text/plain", headers=headers)
+
+
 @router.get(
     "/libraries/{library_id}/files/{script_id}/chunks",
     response_model=list[ScriptChunkResponse],
 )
 async def get_script_chunks(
+    library_id: UUID,
+    script_id: UUID,
+    after_index: int | None = Query(default=None, ge=-1, description="返回切片序号大于该值的切片"),
+    limit: int | None = Query(default=None, ge=1, le=1000, description="每页切片数量"),
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.get_script_chunks(library_id, script_id, after_index=after_index, limit=limit)
+
+
+@router.get(
+    "/libraries/{library_id}/files/{script_id}/chunks/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "One chunk per line"}},
+)
+async def stream_script_chunks(
     library_id: UUID,
     script_id: UUID,
     service: ScriptAppService = Depends(get_script_app_service),
 ):
-    return await service.get_script_chunks(library_id, script_id)
+    batches = await service.stream_script_chunks(library_id, script_id)
+
+    async def _ndjson_stream():
+        try:
+            async for batch in batches:
+                yield "".join(chunk.model_dump_json() + "\n" for chunk in batch)
+        except DomainException as exc:
+            yield (
+                json.dumps(
+                    {
+                        "type": "error",
+                        "code": exc.code,
+                        "message": exc.message,
+                        "detail": exc.detail,
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+            )
+
+    return StreamingResponse(_ndjson_stream(), media_type="application/x-ndjson")
 
 
 @router.post(
     "/libraries/{library_id}/files/{script_id}/chunks",
-    response_model=list[ScriptChunkResponse],
+    response_model=list[ScriptChunkResponse] | ScriptChunkJobResponse,
+    responses={202: {"model": ScriptChunkJobResponse, "description": "Chunk job accepted"}},
 )
 async def execute_script_chunks(
     library_id: UUID,
     script_id: UUID,
+    response: Response,
+    background: bool = Query(default=False, description="后台执行切片任务"),
     service: ScriptAppService = Depends(get_script_app_service),
 ):
+    if background:
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await service.submit_script_chunk_job(library_id, script_id)
     return await service.execute_script_chunks(library_id, script_id)
 
 
+@router.post(
+    "/libraries/{library_id}/rechunk",
+    response_model=ScriptLibraryRechunkResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def rechunk_library(
+    library_id: UUID,
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.rechunk_library(library_id)
+
+
+@router.get(
+    "/libraries/{library_id}/search",
+    response_model=ScriptChunkSearchResponse,
+)
+async def search_library_chunks(
+    library_id: UUID,
+    q: str = Query(..., min_length=1, max_length=500, description="检索关键词"),
+    script_id: UUID | None = Query(default=None, description="仅检索指定剧本"),
+    size: int = Query(default=20, ge=1, le=100, description="每页结果数量"),
+    cursor: str | None = Query(default=None, description="上一页返回的 next_cursor"),
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.search_library_chunks(
+        library_id,
+        q,
+        size=size,
+        script_id=script_id,
+        cursor=cursor,
+    )
+
+
+@router.get(
+    "/libraries/{library_id}/semantic-search",
+    response_model=ScriptChunkSearchResponse,
+)
+async def semantic_search_library_chunks(
+    library_id: UUID,
+    q: str = Query(..., min_length=1, max_length=500, description="语义检索内容"),
+    script_id: UUID | None = Query(default=None, description="仅检索指定剧本"),
+    size: int = Query(default=10, ge=1, le=100, description="返回结果数量"),
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.semantic_search_library_chunks(library_id, q, size=size, script_id=script_id)
+
+
+@router.get(
+    "/libraries/{library_id}/hybrid-search",
+    response_model=ScriptChunkHybridSearchResponse,
+)
+async def hybrid_search_library_chunks(
+    library_id: UUID,
+    q: str = Query(..., min_length=1, max_length=500, description="检索内容"),
+    script_id: UUID | None = Query(default=None, description="仅检索指定剧本"),
+    size: int = Query(default=10, ge=1, le=100, description="返回结果数量"),
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.hybrid_search_library_chunks(library_id, q, size=size, script_id=script_id)
+
+
+@router.get(
+    "/libraries/{library_id}/chunk-jobs/{job_id}",
+    response_model=ScriptChunkJobResponse,
+)
+async def get_script_chunk_job(
+    library_id: UUID,
+    job_id: UUID,
+    service: ScriptAppService = Depends(get_script_app_service),
+):
+    return await service.get_script_chunk_job(library_id, job_id)
+
+
 @router.delete("/libraries/{library_id}/files/{script_id}", response_model=ScriptDeleteResponse)
 async def delete_script_from_library(
     library_id: UUID,
@@ -175,3 +410,55 @@ async def delete_script_from_library(
     service: ScriptAppService = Depends(get_script_app_service),
 ):
     return await service.delete_script_from_library(library_id, script_id)
+
+
+def _parse_text_range(header: str | None) -> ScriptTextRange | None:
+    # Suffix and multi-part ranges need the total length up front; they are ignored and served in full.
+    match = TEXT_RANGE_PATTERN.match(header or "")
+    if match is None:
+        return None
+    unit, start, end = match.group(1), int(match.group(2)), match.group(3)
+    if end and int(end) < start:
+        return None
+    return ScriptTextRange(unit=unit, start=start, end=int(end) if end else None)
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+    if last_modified is None:
+        return False
+    modified_since = _parse_http_date(request.headers.get("if-modified-since"))
+    return modified_since is not None and _to_http_precision(last_modified) <= modified_since
+
+
+def _is_range_current(request: Request, text_stream: ScriptTextStream) -> bool:
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        return if_range == text_stream.etag
+    return _parse_http_date(if_range) == _to_http_precision(text_stream.last_modified)
+
+
+def _parse_http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _to_http_precision(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _format_http_date(value: datetime) -> str:
+    return format_datetime(_to_http_precision(value), usegmt=True)
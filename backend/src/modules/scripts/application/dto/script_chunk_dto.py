@@ -1,5 +1,14 @@
+from datetime import datetime
+from uuid import UUID
+
 from pydantic import BaseModel
 
+from src.modules.scripts.domain.entities.script_chunk_job_entity import ScriptChunkJob
+from src.modules.scripts.domain.entities.script_chunk_search_entity import (
+    ScriptChunkHybridHit,
+    ScriptChunkSearchHit,
+)
+
 
 class ScriptChunkResponse(BaseModel):
     chunk_index: int
@@ -7,3 +16,103 @@ class ScriptChunkResponse(BaseModel):
     start_index: int
     end_index: int
     chunk_size: int
+
+
+class ScriptChunkJobResponse(BaseModel):
+    id: UUID
+    library_id: UUID
+    script_id: UUID
+    status: str
+    extracted_segments: int = 0
+    total_chunks: int = 0
+    indexed_chunks: int = 0
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @classmethod
+    def from_entity(cls, job: ScriptChunkJob) -> "ScriptChunkJobResponse":
+        return cls(
+            id=job.id,
+            library_id=job.library_id,
+            script_id=job.script_id,
+            status=job.status.value,
+            extracted_segments=job.extracted_segments,
+            total_chunks=job.total_chunks,
+            indexed_chunks=job.indexed_chunks,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+
+class ScriptLibraryRechunkResponse(BaseModel):
+    library_id: UUID
+    jobs: list[ScriptChunkJobResponse]
+
+
+class ScriptChunkHighlightResponse(BaseModel):
+    text: str
+    start_index: int
+    end_index: int
+
+
+class ScriptChunkSearchHitResponse(BaseModel):
+    script_id: UUID
+    chunk_index: int
+    start_index: int
+    end_index: int
+    score: float
+    content: str
+    highlights: list[ScriptChunkHighlightResponse]
+
+    @classmethod
+    def from_entity(cls, hit: ScriptChunkSearchHit) -> "ScriptChunkSearchHitResponse":
+        return cls(
+            script_id=hit.script_id,
+            chunk_index=hit.chunk_index,
+            start_index=hit.start_index,
+            end_index=hit.end_index,
+            score=hit.score,
+            content=hit.content,
+            highlights=[
+                ScriptChunkHighlightResponse(
+                    text=highlight.text,
+                    start_index=highlight.start_index,
+                    end_index=highlight.end_index,
+                )
+                for highlight in hit.highlights
+            ],
+        )
+
+
+class ScriptChunkSearchResponse(BaseModel):
+    hits: list[ScriptChunkSearchHitResponse]
+    next_cursor: str | None = None
+
+
+class ScriptChunkHybridHitResponse(ScriptChunkSearchHitResponse):
+    lexical_score: float | None = None
+    lexical_rank: int | None = None
+    vector_score: float | None = None
+    vector_rank: int | None = None
+
+    @classmethod
+    def from_entity(cls, hybrid_hit: ScriptChunkHybridHit) -> "ScriptChunkHybridHitResponse":
+        response = ScriptChunkSearchHitResponse.from_entity(hybrid_hit.hit)
+        return cls(
+            **response.model_dump(exclude={"score"}),
+            score=hybrid_hit.score,
+            lexical_score=hybrid_hit.lexical_score,
+            lexical_rank=hybrid_hit.lexical_rank,
+            vector_score=hybrid_hit.vector_score,
+            vector_rank=hybrid_hit.vector_rank,
+        )
+
+
+class ScriptChunkHybridSearchResponse(BaseModel):
+    hits: list[ScriptChunkHybridHitResponse]
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -38,6 +40,9 @@ class ScriptLibraryResponse(BaseModel):
 class ScriptLibraryDetailResponse(ScriptLibraryResponse):
     updated_at: datetime
     script_count: int = 0
+    total_file_size: int = 0
+    chunk_count: int = 0
+    last_script_updated_at: datetime | None = None
 
 
 class ScriptLibraryDeleteResponse(BaseModel):
@@ -49,6 +54,7 @@ class ScriptLibraryConfigResponse(BaseModel):
     library_id: UUID
     chunk_size: int
     overlap: int
+    auto_chunk_on_upload: bool = False
     created_at: datetime
     updated_at: datetime
 
@@ -56,6 +62,7 @@ class ScriptLibraryConfigResponse(BaseModel):
 class UpdateScriptLibraryConfigRequest(BaseModel):
     chunk_size: int = Field(default=500, ge=1, description="切片大小")
     overlap: int = Field(default=50, ge=0, description="切片重叠长度")
+    auto_chunk_on_upload: bool | None = Field(default=None, description="上传后自动切片，不传则保持原设置")
 
 
 class ScriptItemResponse(BaseModel):
@@ -65,6 +72,7 @@ class ScriptItemResponse(BaseModel):
     file_extension: str
     content_type: str
     file_size: int
+    content_hash: str | None = None
     created_at: datetime
     chunk_count: int = 0
 
@@ -77,19 +85,42 @@ class ScriptItemResponse(BaseModel):
             file_extension=script.file_extension,
             content_type=script.content_type,
             file_size=script.file_size,
+            content_hash=script.content_hash,
             created_at=script.created_at,
             chunk_count=chunk_count,
         )
 
 
 class ScriptUploadResponse(ScriptItemResponse):
-    pass
+    chunk_job_id: UUID | None = None
 
 
 class ScriptDeleteResponse(BaseModel):
     message: str
 
 
+class PresignScriptUploadRequest(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255, description="原始文件名")
+    file_size: int = Field(..., gt=0, description="文件字节数")
+
+
+class ScriptPresignedUploadResponse(BaseModel):
+    upload_id: UUID
+    upload_url: str
+    method: str = "PUT"
+    expires_at: datetime
+
+
+class FinalizeScriptUploadRequest(BaseModel):
+    upload_id: UUID
+    filename: str = Field(..., min_length=1, max_length=255, description="原始文件名")
+
+
+class ScriptPresignedDownloadResponse(BaseModel):
+    url: str
+    expires_at: datetime
+
+
 class ScriptContentResponse(BaseModel):
     id: UUID
     library_id: UUID | None = None
@@ -108,3 +139,37 @@ class ScriptContentResponse(BaseModel):
             content=content,
             content_length=len(content),
         )
+
+
+@dataclass(frozen=True)
+class ScriptLibraryAvatar:
+    object_name: str
+    etag: str
+    content_type: str
+    last_modified: datetime | None = None
+
+
+@dataclass(frozen=True)
+class ScriptTextRange:
+    unit: Literal["bytes", "chars"]
+    start: int
+    end: int | None = None
+
+
+@dataclass(frozen=True)
+class ScriptTextStream:
+    script_id: UUID
+    etag: str
+    last_modified: datetime
+    object_name: str
+    # None means the object is an extracted-text sidecar that is already UTF-8.
+    source_extension: str | None
+
+
+@dataclass(frozen=True)
+class ScriptTextRangeContent:
+    unit: Literal["bytes", "chars"]
+    start: int
+    end: int
+    total: int | None
+    content: bytes
@@ -1,42 +1,101 @@
 import asyncio
+import base64
+import bisect
+import json
 import logging
 import mimetypes
+import os
+import shutil
+import tempfile
 import uuid
-from datetime import datetime
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import aclosing, closing
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import BinaryIO
+from urllib.parse import quote
 from uuid import UUID
 
 from fastapi import UploadFile
 
-from src.modules.scripts.application.dto.script_chunk_dto import ScriptChunkResponse
+from src.modules.scripts.application.dto.script_chunk_dto import (
+    ScriptChunkHybridHitResponse,
+    ScriptChunkHybridSearchResponse,
+    ScriptChunkJobResponse,
+    ScriptChunkResponse,
+    ScriptChunkSearchHitResponse,
+    ScriptChunkSearchResponse,
+    ScriptLibraryRechunkResponse,
+)
 from src.modules.scripts.application.dto.script_dto import (
     CreateScriptLibraryRequest,
+    FinalizeScriptUploadRequest,
+    PresignScriptUploadRequest,
     ScriptContentResponse,
     ScriptDeleteResponse,
     ScriptItemResponse,
     ScriptLibraryConfigResponse,
     ScriptLibraryDeleteResponse,
     ScriptLibraryDetailResponse,
+    ScriptLibraryAvatar,
     ScriptLibraryResponse,
+    ScriptPresignedDownloadResponse,
+    ScriptPresignedUploadResponse,
+    ScriptTextRange,
+    ScriptTextRangeContent,
+    ScriptTextStream,
     ScriptUploadResponse,
     UpdateScriptLibraryRequest,
     UpdateScriptLibraryConfigRequest,
 )
+from src.modules.scripts.application.services.script_chunk_job_runner import ScriptChunkJobRunner
+from src.modules.scripts.application.services.script_chunk_retrieval_service import ScriptChunkRetrievalService
+from src.modules.scripts.domain.entities.script_blob_entity import ScriptBlob
 from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.domain.entities.script_chunk_job_entity import ScriptChunkJobProgress
 from src.modules.scripts.domain.entities.script_config_entity import ScriptConfig
 from src.modules.scripts.domain.entities.script_entity import Script
 from src.modules.scripts.domain.entities.script_library_entity import ScriptLibrary
 from src.modules.scripts.domain.exceptions import (
+    ChunkDocumentDeleteError,
     ChunkingError,
+    PresignedTransferUnavailableError,
+    ScriptChunkJobNotFoundException,
     ScriptLibraryAvatarNotFoundException,
     ScriptLibraryNotFoundException,
     ScriptNotFoundException,
+    ScriptTextRangeNotSatisfiableError,
+    SemanticSearchUnavailableError,
     StorageCleanupError,
     TextExtractError,
 )
-from src.modules.scripts.domain.repositories import IScriptChunkStore, IScriptRepository
+from src.modules.scripts.domain.repositories import (
+    IScriptChunkCache,
+    IScriptChunkEmbedder,
+    IScriptChunkStore,
+    IScriptRepository,
+)
 from src.modules.scripts.domain.value_objects.file_format import FileFormat
 from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
-from src.modules.scripts.infrastructure.services.script_chunker import ScriptSentenceWindowTextSplitter
+from src.modules.scripts.infrastructure.services.image_thumbnailer import (
+    THUMBNAIL_CONTENT_TYPE,
+    THUMBNAIL_EXTENSION,
+    ImageThumbnailer,
+)
+from src.modules.scripts.infrastructure.services.library_avatar_cache import LibraryAvatarCache
+from src.modules.scripts.infrastructure.services.script_chunk_pipeline import iter_batches_in_thread
+from src.modules.scripts.infrastructure.services.script_chunk_process_pool import (
+    ScriptChunkProcessPool,
+    iter_split_chunks,
+)
+from src.modules.scripts.infrastructure.services.script_chunker import (
+    ScriptSentenceWindowTextSplitter,
+    ScriptTextChunk,
+)
+from src.modules.scripts.infrastructure.services.script_upload_stream import (
+    ScriptUploadStream,
+    TextLengthCounter,
+)
 from src.shared.domain.exceptions import ValidationException
 from src.shared.extensions.storage.base import IStorageProvider
 
@@ -46,6 +105,71 @@ logger = logging.getLogger(__name__)
 DEFAULT_LIBRARY_CHUNK_SIZE = 500
 DEFAULT_LIBRARY_CHUNK_OVERLAP = 50
 SUPPORTED_LIBRARY_AVATAR_EXTENSIONS = {"jpg", "jpeg", "png", "webp", "gif"}
+LIBRARY_AVATAR_THUMBNAIL_SIZES = (64, 256)
+BLOB_OBJECT_PREFIX = "blobs/"
+STAGED_UPLOAD_OBJECT_PREFIX = "uploads/"
+STAGED_UPLOAD_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+CHUNK_PIPELINE_BATCH_SIZE = 200
+CHUNK_PIPELINE_MAX_PENDING_BATCHES = 4
+CHUNK_STREAM_BATCH_SIZE = 200
+CHUNK_EMBEDDING_BATCH_SIZE = 64
+CHUNK_BULK_INDEX_BATCH_SIZE = 1000
+TEXT_SIDECAR_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+TEXT_SIDECAR_CONTENT_TYPE = "text/plain; charset=utf-8"
+TEXT_STREAM_BATCH_SEGMENTS = 8
+TEXT_STREAM_MAX_PENDING_BATCHES = 4
+TEXT_RANGE_MAX_LENGTH = 4 * 1024 * 1024
+
+ChunkProgressCallback = Callable[[ScriptChunkJobProgress], Awaitable[None]]
+
+
+@dataclass
+class _ChunkRebuild:
+    existing_by_fingerprint: dict[str, ScriptChunk]
+    removed_chunk_refs: list[ScriptChunk]
+    # Content-free refs only; chunk text is dropped once its batch has been indexed.
+    chunk_refs: list[ScriptChunk] = field(default_factory=list)
+    reused_chunk_ids: set[UUID] = field(default_factory=set)
+    embedding_source_ids: dict[UUID, UUID] = field(default_factory=dict)
+
+    @classmethod
+    def from_existing(cls, chunk_refs: list[ScriptChunk]) -> "_ChunkRebuild":
+        return cls(
+            existing_by_fingerprint={chunk.fingerprint: chunk for chunk in chunk_refs if chunk.fingerprint},
+            removed_chunk_refs=[chunk for chunk in chunk_refs if not chunk.fingerprint],
+        )
+
+    @property
+    def new_chunk_ids(self) -> list[UUID]:
+        return [chunk.id for chunk in self.chunk_refs if chunk.id not in self.reused_chunk_ids]
+
+    @property
+    def removed_chunk_ids(self) -> list[UUID]:
+        return [chunk.id for chunk in [*self.removed_chunk_refs, *self.existing_by_fingerprint.values()]]
+
+    def embedding_source_id(self, chunk: ScriptChunk) -> UUID | None:
+        if chunk.id in self.embedding_source_ids:
+            return self.embedding_source_ids[chunk.id]
+        return chunk.id if chunk.id in self.reused_chunk_ids else None
+
+    def adopt(self, batch: list[ScriptChunk]) -> list[UUID]:
+        unchanged_chunk_ids: list[UUID] = []
+        for chunk in batch:
+            existing = self.existing_by_fingerprint.pop(chunk.fingerprint, None) if chunk.fingerprint else None
+            if existing is None:
+                continue
+            if existing.index_id != chunk.index_id:
+                # Re-indexing the old document in place could not be rolled back, so a shifted chunk is
+                # written under its new id (reusing the stored vector) and the old document is retired.
+                self.embedding_source_ids[chunk.id] = existing.id
+                self.removed_chunk_refs.append(existing)
+                continue
+            chunk.id = existing.id
+            chunk.created_at = existing.created_at
+            self.reused_chunk_ids.add(chunk.id)
+            unchanged_chunk_ids.append(chunk.id)
+        self.chunk_refs.extend(chunk.to_ref() for chunk in batch)
+        return unchanged_chunk_ids
 
 
 class ScriptAppService:
@@ -56,12 +180,33 @@ class ScriptAppService:
         script_chunk_store: IScriptChunkStore,
         file_text_extractor: FileTextExtractor,
         upload_max_text_length: int,
+        chunk_job_runner: ScriptChunkJobRunner | None = None,
+        chunk_cache: IScriptChunkCache | None = None,
+        chunk_embedder: IScriptChunkEmbedder | None = None,
+        chunk_retrieval_service: ScriptChunkRetrievalService | None = None,
+        chunk_process_pool: ScriptChunkProcessPool | None = None,
+        avatar_thumbnailer: ImageThumbnailer | None = None,
+        avatar_cache: LibraryAvatarCache | None = None,
+        presigned_url_ttl: timedelta | None = None,
+        presigned_upload_max_bytes: int | None = None,
     ):
         self._script_repository = script_repository
         self._storage_provider = storage_provider
         self._script_chunk_store = script_chunk_store
         self._file_text_extractor = file_text_extractor
         self._upload_max_text_length = upload_max_text_length
+        self._chunk_job_runner = chunk_job_runner
+        self._chunk_cache = chunk_cache
+        self._chunk_embedder = chunk_embedder
+        self._chunk_retrieval_service = chunk_retrieval_service or ScriptChunkRetrievalService(
+            script_chunk_store=script_chunk_store,
+            chunk_embedder=chunk_embedder,
+        )
+        self._chunk_process_pool = chunk_process_pool
+        self._avatar_thumbnailer = avatar_thumbnailer
+        self._avatar_cache = avatar_cache
+        self._presigned_url_ttl = presigned_url_ttl
+        self._presigned_upload_max_bytes = presigned_upload_max_bytes
 
     async def create_library(self, request: CreateScriptLibraryRequest) -> ScriptLibraryResponse:
         library_name = request.name.strip()
@@ -87,7 +232,7 @@ class ScriptAppService:
 
     async def get_library(self, library_id: UUID) -> ScriptLibraryDetailResponse:
         library = await self._get_library_or_raise(library_id)
-        scripts = await self._script_repository.list_all(library_id=library_id)
+        stats = await self._script_repository.get_library_stats(library_id)
         return ScriptLibraryDetailResponse(
             id=library.id,
             name=library.name,
@@ -95,7 +240,10 @@ class ScriptAppService:
             avatar_path=library.avatar_path,
             created_at=library.created_at,
             updated_at=library.updated_at,
-            script_count=len(scripts),
+            script_count=stats.script_count,
+            total_file_size=stats.total_file_size,
+            chunk_count=stats.chunk_count,
+            last_script_updated_at=stats.last_script_updated_at,
         )
 
     async def update_library(
@@ -125,6 +273,7 @@ class ScriptAppService:
             library_id=config.library_id,
             chunk_size=config.chunk_size,
             overlap=config.chunk_overlap,
+            auto_chunk_on_upload=config.auto_chunk_on_upload,
             created_at=config.created_at,
             updated_at=config.updated_at,
         )
@@ -138,15 +287,22 @@ class ScriptAppService:
         if request.overlap >= request.chunk_size:
             raise ValidationException("Overlap must be smaller than chunk size")
 
+        auto_chunk_on_upload = request.auto_chunk_on_upload
+        if auto_chunk_on_upload is None:
+            current_config = await self._get_or_create_library_config(library_id)
+            auto_chunk_on_upload = current_config.auto_chunk_on_upload
+
         config = await self._script_repository.upsert_library_config(
             library_id=library_id,
             chunk_size=request.chunk_size,
             chunk_overlap=request.overlap,
+            auto_chunk_on_upload=auto_chunk_on_upload,
         )
         return ScriptLibraryConfigResponse(
             library_id=config.library_id,
             chunk_size=config.chunk_size,
             overlap=config.chunk_overlap,
+            auto_chunk_on_upload=config.auto_chunk_on_upload,
             created_at=config.created_at,
             updated_at=config.updated_at,
         )
@@ -161,43 +317,275 @@ class ScriptAppService:
         file_size = self._get_upload_file_size(file)
         if file_size <= 0:
             raise ValidationException("File is empty")
-        await self._validate_upload_text_length(file, file_format)
-
-        script_id = uuid.uuid4()
-        object_name = self._build_text_object_name(library_id, script_id, file_format.extension)
         content_type = (
             file.content_type
             or mimetypes.guess_type(file.filename)[0]
             or "application/octet-stream"
         )
-
-        file.file.seek(0)
-        await self._storage_provider.upload_file(
-            object_name=object_name,
-            data_stream=file.file,
-            data_size=file_size,
+        return await self._register_script(
+            library_id=library_id,
+            filename=file.filename,
+            file_format=file_format,
+            file_stream=file.file,
+            file_size=file_size,
             content_type=content_type,
         )
 
-        script = Script(
-            id=script_id,
-            library_id=library_id,
-            original_name=file.filename,
-            storage_path=object_name,
-            file_extension=file_format.extension,
-            content_type=content_type,
-            file_size=file_size,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+    async def presign_script_upload(
+        self,
+        library_id: UUID,
+        request: PresignScriptUploadRequest,
+    ) -> ScriptPresignedUploadResponse:
+        url_ttl = self._require_presigned_url_ttl()
+        await self._get_library_or_raise(library_id)
+        file_format = FileFormat.from_filename(request.filename)
+        self._validate_presigned_upload_size(request.file_size)
+
+        upload_id = uuid.uuid4()
+        upload_url = await self._storage_provider.presigned_put_url(
+            self._build_staged_upload_object_name(library_id, upload_id, file_format.extension),
+            url_ttl,
+        )
+        return ScriptPresignedUploadResponse(
+            upload_id=upload_id,
+            upload_url=upload_url,
+            expires_at=datetime.utcnow() + url_ttl,
         )
 
+    async def finalize_presigned_script_upload(
+        self,
+        library_id: UUID,
+        request: FinalizeScriptUploadRequest,
+    ) -> ScriptUploadResponse:
+        self._require_presigned_url_ttl()
+        await self._get_library_or_raise(library_id)
+        file_format = FileFormat.from_filename(request.filename)
+        # The object name is rebuilt from the upload id, so clients can only finalize objects staged for this library.
+        staged_object_name = self._build_staged_upload_object_name(library_id, request.upload_id, file_format.extension)
+        stat = await self._storage_provider.stat_object(staged_object_name)
+        if stat is None:
+            raise ValidationException(
+                "Uploaded file not found",
+                detail="Upload the file to the presigned URL before finalizing",
+            )
+
         try:
-            saved_script = await self._script_repository.save_to_library(script, library_id)
+            if stat.size <= 0:
+                raise ValidationException("File is empty")
+            self._validate_presigned_upload_size(stat.size)
+            content_type = (
+                stat.content_type
+                if stat.content_type and stat.content_type != "application/octet-stream"
+                else mimetypes.guess_type(request.filename)[0] or "application/octet-stream"
+            )
+            # Validation and hashing read the object once into a local spool; the stored blob is a
+            # server-side copy of the staged object, so the bytes never go back out through the API.
+            with tempfile.SpooledTemporaryFile(max_size=STAGED_UPLOAD_SPOOL_MAX_BYTES) as file_stream:
+                async with self._storage_provider.open_object(staged_object_name) as object_stream:
+                    await asyncio.to_thread(shutil.copyfileobj, object_stream, file_stream, 1024 * 1024)
+                file_stream.seek(0)
+                return await self._register_script(
+                    library_id=library_id,
+                    filename=request.filename,
+                    file_format=file_format,
+                    file_stream=file_stream,
+                    file_size=stat.size,
+                    content_type=content_type,
+                    staged_object_name=staged_object_name,
+                )
+        finally:
+            await self._delete_objects_with_retry([staged_object_name], raise_on_failure=False)
+
+    async def presign_script_download(self, library_id: UUID, script_id: UUID) -> ScriptPresignedDownloadResponse:
+        url_ttl = self._require_presigned_url_ttl()
+        await self._get_library_or_raise(library_id)
+        script = await self._get_script_in_library_or_raise(library_id, script_id)
+
+        download_url = await self._storage_provider.presigned_get_url(
+            script.storage_path,
+            url_ttl,
+            response_headers={
+                "response-content-type": script.content_type,
+                "response-content-disposition": f"attachment; filename*=UTF-8''{quote(script.original_name)}",
+            },
+        )
+        return ScriptPresignedDownloadResponse(url=download_url, expires_at=datetime.utcnow() + url_ttl)
+
+    async def presign_library_avatar_download(
+        self,
+        library_id: UUID,
+        size: int | None = None,
+    ) -> ScriptPresignedDownloadResponse:
+        url_ttl = self._require_presigned_url_ttl()
+        avatar = await self.open_library_avatar(library_id, size=size)
+        download_url = await self._storage_provider.presigned_get_url(
+            avatar.object_name,
+            url_ttl,
+            response_headers={"response-content-type": avatar.content_type},
+        )
+        return ScriptPresignedDownloadResponse(url=download_url, expires_at=datetime.utcnow() + url_ttl)
+
+    async def _register_script(
+        self,
+        library_id: UUID,
+        filename: str,
+        file_format: FileFormat,
+        file_stream: BinaryIO,
+        file_size: int,
+        content_type: str,
+        staged_object_name: str | None = None,
+    ) -> ScriptUploadResponse:
+        # PDF/DOCX text extracted for validation is kept and stored as the script's text sidecar.
+        text_sink = (
+            await self._validate_upload_text_length(file_stream, file_format) if not file_format.is_text else None
+        )
+        try:
+            # Hashing reads the local spool, so existing content is found before anything is sent to storage.
+            file_stream.seek(0)
+            hash_stream = ScriptUploadStream(
+                file_stream,
+                max_text_length=self._upload_max_text_length if file_format.is_text else None,
+            )
+            try:
+                await asyncio.to_thread(hash_stream.finish)
+            finally:
+                file_stream.seek(0)
+            content_hash = hash_stream.content_hash
+
+            blob = await self._store_script_blob(
+                file_stream=file_stream,
+                content_hash=content_hash,
+                extension=file_format.extension,
+                file_size=file_size,
+                content_type=content_type,
+                staged_object_name=staged_object_name,
+            )
+            script = Script(
+                id=uuid.uuid4(),
+                library_id=library_id,
+                original_name=filename,
+                storage_path=blob.storage_path,
+                file_extension=file_format.extension,
+                content_type=content_type,
+                file_size=file_size,
+                content_hash=content_hash,
+                created_at=datetime.utcnow(),
+                updated_at=datetime.utcnow(),
+            )
+
+            try:
+                saved_script = await self._script_repository.save_to_library(script, library_id)
+            except Exception:
+                await self._release_script_objects([script])
+                raise
+
+            if text_sink is not None:
+                sidecar_object_name = await self._get_text_sidecar_object_name(saved_script)
+                if sidecar_object_name is not None and not await self._text_sidecar_exists(sidecar_object_name):
+                    await self._store_text_sidecar(sidecar_object_name, text_sink, text_sink.tell())
+        finally:
+            if text_sink is not None:
+                text_sink.close()
+
+        response = ScriptUploadResponse.from_entity(saved_script)
+        response.chunk_job_id = await self._submit_auto_chunk_job(library_id, saved_script.id)
+        return response
+
+    async def _store_script_blob(
+        self,
+        file_stream: BinaryIO,
+        content_hash: str,
+        extension: str,
+        file_size: int,
+        content_type: str,
+        staged_object_name: str | None = None,
+    ) -> ScriptBlob:
+        # Every blob row gets its own object name, so a concurrent release only ever deletes the object
+        # of the row it removed and never one that a re-created row points to.
+        object_name = self._build_blob_object_name(content_hash, extension)
+        existing_blob = await self._script_repository.find_blob(content_hash)
+        if existing_blob is None:
+            await self._upload_blob_object(file_stream, object_name, file_size, content_type, staged_object_name)
+
+        try:
+            blob = await self._script_repository.acquire_blob(content_hash, object_name, file_size)
         except Exception:
-            await self._delete_objects_with_retry([object_name], raise_on_failure=False)
+            if existing_blob is None:
+                await self._delete_objects_with_retry([object_name], raise_on_failure=False)
             raise
+        if blob.storage_path != object_name:
+            if existing_blob is None:
+                # Another upload of the same content created the blob first.
+                await self._delete_objects_with_retry([object_name], raise_on_failure=False)
+        elif existing_blob is not None:
+            # The blob was released between lookup and acquire, so this row is new and needs its object.
+            try:
+                await self._upload_blob_object(file_stream, object_name, file_size, content_type, staged_object_name)
+            except Exception:
+                await self._release_blob_hashes([content_hash])
+                raise
+        return blob
 
-        return ScriptUploadResponse.from_entity(saved_script)
+    async def _upload_blob_object(
+        self,
+        file_stream: BinaryIO,
+        object_name: str,
+        file_size: int,
+        content_type: str,
+        staged_object_name: str | None = None,
+    ) -> None:
+        if staged_object_name is not None:
+            await self._storage_provider.copy_object(staged_object_name, object_name)
+            return
+        file_stream.seek(0)
+        await self._storage_provider.upload_file(
+            object_name=object_name,
+            data_stream=file_stream,
+            data_size=file_size,
+            content_type=content_type,
+        )
+
+    async def _release_script_objects(self, scripts: list[Script]) -> list[str]:
+        blob_hashes = [script.content_hash for script in scripts if self._is_blob_backed(script)]
+        object_names = []
+        for script in scripts:
+            if self._is_blob_backed(script):
+                continue
+            object_names.append(script.storage_path)
+            sidecar_object_name = await self._get_text_sidecar_object_name(script)
+            if sidecar_object_name is not None:
+                object_names.append(sidecar_object_name)
+        if blob_hashes:
+            object_names.extend(await self._release_blob_hashes(blob_hashes, delete_objects=False))
+        return await self._delete_objects_with_retry(object_names, raise_on_failure=False)
+
+    async def _release_blob_hashes(self, content_hashes: list[str], delete_objects: bool = True) -> list[str]:
+        object_names = []
+        for blob in await self._script_repository.release_blobs(content_hashes):
+            object_names.append(blob.storage_path)
+            if self._needs_text_sidecar(blob.storage_path.rsplit(".", 1)[-1]):
+                object_names.append(self._build_text_sidecar_object_name(blob.storage_path, blob.content_hash))
+        if delete_objects:
+            await self._delete_objects_with_retry(object_names, raise_on_failure=False)
+        return object_names
+
+    async def _submit_auto_chunk_job(self, library_id: UUID, script_id: UUID) -> UUID | None:
+        if self._chunk_job_runner is None:
+            return None
+        config = await self._get_or_create_library_config(library_id)
+        if not config.auto_chunk_on_upload:
+            return None
+        try:
+            job = await self._chunk_job_runner.submit(library_id, script_id)
+        except Exception as exc:
+            logger.warning(
+                "Failed to submit auto chunk job after upload: script_id=%s library_id=%s error=%s",
+                script_id,
+                library_id,
+                exc,
+            )
+            return None
+        return job.id
 
     async def upload_library_avatar(self, library_id: UUID, file: UploadFile) -> ScriptLibraryResponse:
         library = await self._get_library_or_raise(library_id)
@@ -225,6 +613,7 @@ class ScriptAppService:
             raise ValidationException("Only image files are allowed for avatar upload")
 
         object_name = self._build_library_avatar_object_name(library_id, extension)
+        previous_avatar_path = library.avatar_path
         file.file.seek(0)
         await self._storage_provider.upload_file(
             object_name=object_name,
@@ -245,30 +634,115 @@ class ScriptAppService:
             await self._delete_objects_with_retry([object_name], raise_on_failure=False)
             raise
 
-        if library.avatar_path and library.avatar_path != object_name:
-            await self._delete_objects_with_retry([library.avatar_path], raise_on_failure=False)
+        if previous_avatar_path and previous_avatar_path != object_name:
+            await self._delete_objects_with_retry([previous_avatar_path], raise_on_failure=False)
+
+        all_thumbnail_names = self._build_library_avatar_thumbnail_object_names(library_id)
+        thumbnail_names = await self._store_library_avatar_thumbnails(library_id, file.file)
+        stale_thumbnail_names = [name for name in all_thumbnail_names if name not in thumbnail_names]
+        if previous_avatar_path and stale_thumbnail_names:
+            await self._delete_objects_with_retry(stale_thumbnail_names, raise_on_failure=False)
+        self._invalidate_cached_avatars(
+            [name for name in (previous_avatar_path, object_name, *all_thumbnail_names) if name]
+        )
 
         return ScriptLibraryResponse.from_entity(updated_library)
 
-    async def get_library_avatar(self, library_id: UUID) -> tuple[bytes, str]:
+    async def get_library_avatar(self, library_id: UUID, size: int | None = None) -> tuple[bytes, str]:
+        avatar = await self.open_library_avatar(library_id, size=size)
+        return await self.read_library_avatar(avatar), avatar.content_type
+
+    async def open_library_avatar(self, library_id: UUID, size: int | None = None) -> ScriptLibraryAvatar:
         library = await self._get_library_or_raise(library_id)
         if not library.avatar_path:
             raise ScriptLibraryAvatarNotFoundException(str(library_id))
 
-        avatar_bytes = await self._storage_provider.get_object_bytes(library.avatar_path)
-        content_type = mimetypes.guess_type(library.avatar_path)[0] or "application/octet-stream"
-        return avatar_bytes, content_type
+        # List views ask for a small size; serve the smallest thumbnail that covers it and fall back
+        # to the original when no thumbnail was generated.
+        object_names = [library.avatar_path]
+        thumbnail_size = next((item for item in LIBRARY_AVATAR_THUMBNAIL_SIZES if size and item >= size), None)
+        if thumbnail_size is not None:
+            object_names.insert(0, self._build_library_avatar_thumbnail_object_name(library_id, thumbnail_size))
+
+        for object_name in object_names:
+            stat = await self._storage_provider.stat_object(object_name)
+            if stat is None:
+                continue
+            content_type = (
+                stat.content_type
+                if stat.content_type and stat.content_type.startswith("image/")
+                else mimetypes.guess_type(object_name)[0] or "application/octet-stream"
+            )
+            last_modified_tag = int(stat.last_modified.timestamp()) if stat.last_modified else 0
+            etag = stat.etag or f"{stat.size:x}-{last_modified_tag:x}"
+            return ScriptLibraryAvatar(
+                object_name=object_name,
+                etag=f'"{etag}"',
+                content_type=content_type,
+                last_modified=stat.last_modified,
+            )
+        raise ScriptLibraryAvatarNotFoundException(str(library_id))
+
+    async def read_library_avatar(self, avatar: ScriptLibraryAvatar) -> bytes:
+        if self._avatar_cache is not None:
+            cached = self._avatar_cache.get(avatar.object_name, avatar.etag)
+            if cached is not None:
+                return cached
+
+        avatar_bytes = await self._storage_provider.get_object_bytes(avatar.object_name)
+        if self._avatar_cache is not None:
+            self._avatar_cache.set(avatar.object_name, avatar.etag, avatar_bytes)
+        return avatar_bytes
+
+    async def _store_library_avatar_thumbnails(self, library_id: UUID, image_stream: BinaryIO) -> list[str]:
+        if self._avatar_thumbnailer is None:
+            return []
+        image_stream.seek(0)
+        try:
+            thumbnails = await asyncio.to_thread(
+                self._avatar_thumbnailer.render,
+                image_stream,
+                LIBRARY_AVATAR_THUMBNAIL_SIZES,
+            )
+        except Exception as exc:
+            logger.warning("Failed to render library avatar thumbnails: library_id=%s error=%s", library_id, exc)
+            return []
+
+        object_names: list[str] = []
+        for size, data in thumbnails.items():
+            object_name = self._build_library_avatar_thumbnail_object_name(library_id, size)
+            try:
+                await self._storage_provider.upload_bytes(object_name, data, content_type=THUMBNAIL_CONTENT_TYPE)
+            except Exception as exc:
+                logger.warning("Failed to store library avatar thumbnail: path=%s error=%s", object_name, exc)
+                continue
+            object_names.append(object_name)
+        return object_names
+
+    def _require_presigned_url_ttl(self) -> timedelta:
+        if self._presigned_url_ttl is None:
+            raise PresignedTransferUnavailableError()
+        return self._presigned_url_ttl
+
+    def _validate_presigned_upload_size(self, file_size: int) -> None:
+        if self._presigned_upload_max_bytes is not None and file_size > self._presigned_upload_max_bytes:
+            raise ValidationException(
+                "File is too large",
+                detail=f"Each file must be at most {self._presigned_upload_max_bytes} bytes",
+            )
+
+    def _invalidate_cached_avatars(self, object_names: list[str]) -> None:
+        if self._avatar_cache is None:
+            return
+        for object_name in object_names:
+            self._avatar_cache.invalidate(object_name)
 
     async def list_library_scripts(self, library_id: UUID) -> list[ScriptItemResponse]:
         await self._get_library_or_raise(library_id)
-        scripts = await self._script_repository.list_all(library_id=library_id)
-        chunk_counts: dict[UUID, int] = {}
-        for script in scripts:
-            chunk_counts[script.id] = len(await self._script_repository.list_chunks(script.id, library_id))
-
+        scripts_with_counts = await self._script_repository.list_all_with_chunk_counts(library_id)
         return [
-            ScriptItemResponse.from_entity(script, chunk_count=chunk_counts.get(script.id, 0))
-            for script in scripts
+            ScriptItemResponse.from_entity(script, chunk_count=chunk_count)
+            for script, chunk_count in scripts_with_counts
         ]
 
     async def get_script_text_content(self, library_id: UUID, script_id: UUID) -> ScriptContentResponse:
@@ -285,17 +759,228 @@ class ScriptAppService:
             )
         return ScriptContentResponse.from_entity(script, content_text)
 
-    async def get_script_chunks(self, library_id: UUID, script_id: UUID) -> list[ScriptChunkResponse]:
+    async def open_script_text_stream(self, library_id: UUID, script_id: UUID) -> ScriptTextStream:
         await self._get_library_or_raise(library_id)
         script = await self._get_script_in_library_or_raise(library_id, script_id)
 
-        cached_chunks = await self._script_repository.list_chunks(
+        source_tag = await self._get_script_source_tag(script)
+        object_name, source_extension = script.storage_path, script.file_extension
+        if source_tag and self._needs_text_sidecar(script.file_extension):
+            sidecar_object_name = self._build_text_sidecar_object_name(script.storage_path, source_tag)
+            if await self._text_sidecar_exists(sidecar_object_name):
+                object_name, source_extension = sidecar_object_name, None
+
+        etag_source = source_tag or f"{script.id.hex}-{script.file_size}"
+        return ScriptTextStream(
             script_id=script.id,
+            etag=f'"{etag_source[:32]}-text-v{FileTextExtractor.EXTRACTION_VERSION}"',
+            last_modified=script.updated_at,
+            object_name=object_name,
+            source_extension=source_extension,
+        )
+
+    async def iter_script_text(self, text_stream: ScriptTextStream) -> AsyncIterator[bytes]:
+        async with self._storage_provider.open_object(text_stream.object_name) as file_stream:
+            batches = iter_batches_in_thread(
+                lambda: (
+                    segment.encode("utf-8")
+                    for segment in self._iter_script_text_segments(file_stream, text_stream.source_extension)
+                ),
+                batch_size=TEXT_STREAM_BATCH_SEGMENTS,
+                max_pending_batches=TEXT_STREAM_MAX_PENDING_BATCHES,
+            )
+            async with aclosing(batches):
+                async for batch in batches:
+                    yield b"".join(batch)
+
+    async def read_script_text_range(
+        self,
+        text_stream: ScriptTextStream,
+        text_range: ScriptTextRange,
+    ) -> ScriptTextRangeContent:
+        stop = text_range.start + TEXT_RANGE_MAX_LENGTH
+        if text_range.end is not None:
+            stop = min(stop, text_range.end + 1)
+
+        async with self._storage_provider.open_object(text_stream.object_name) as file_stream:
+            content, total = await asyncio.to_thread(
+                self._read_text_range,
+                file_stream,
+                text_stream.source_extension,
+                text_range.unit,
+                text_range.start,
+                stop,
+            )
+        if not content:
+            raise ScriptTextRangeNotSatisfiableError(text_range.unit, total or 0)
+
+        return ScriptTextRangeContent(
+            unit=text_range.unit,
+            start=text_range.start,
+            end=text_range.start + len(content) - 1,
+            total=total,
+            content=content if isinstance(content, bytes) else content.encode("utf-8"),
+        )
+
+    async def get_script_chunks(
+        self,
+        library_id: UUID,
+        script_id: UUID,
+        after_index: int | None = None,
+        limit: int | None = None,
+    ) -> list[ScriptChunkResponse]:
+        await self._get_library_or_raise(library_id)
+        script = await self._get_script_in_library_or_raise(library_id, script_id)
+
+        generation = await self._get_chunk_cache_generation(script.id)
+        if generation is not None:
+            cached_chunks = await self._get_cached_chunks(script.id, generation)
+            if cached_chunks is not None:
+                return self._to_chunk_responses(
+                    self._slice_after_index(
+                        sorted(cached_chunks, key=lambda item: item.index_id),
+                        after_index,
+                        limit,
+                        key=lambda item: item.index_id,
+                    )
+                )
+
+        is_full_list = after_index is None and limit is None
+        return await self._load_chunk_page(
+            script,
+            library_id,
+            after_index,
+            limit,
+            cache_generation=generation if is_full_list else None,
+        )
+
+    async def stream_script_chunks(
+        self,
+        library_id: UUID,
+        script_id: UUID,
+    ) -> AsyncIterator[list[ScriptChunkResponse]]:
+        await self._get_library_or_raise(library_id)
+        script = await self._get_script_in_library_or_raise(library_id, script_id)
+        return self._iter_chunk_response_batches(script, library_id)
+
+    async def _iter_chunk_response_batches(
+        self,
+        script: Script,
+        library_id: UUID,
+    ) -> AsyncIterator[list[ScriptChunkResponse]]:
+        generation = await self._get_chunk_cache_generation(script.id)
+        cached_chunks = await self._get_cached_chunks(script.id, generation) if generation is not None else None
+        if cached_chunks is not None:
+            responses = self._to_chunk_responses(cached_chunks)
+            for start in range(0, len(responses), CHUNK_STREAM_BATCH_SIZE):
+                yield responses[start:start + CHUNK_STREAM_BATCH_SIZE]
+            return
+
+        after_index: int | None = None
+        while True:
+            page = await self._load_chunk_page(script, library_id, after_index, CHUNK_STREAM_BATCH_SIZE)
+            if page:
+                yield page
+            if len(page) < CHUNK_STREAM_BATCH_SIZE:
+                return
+            after_index = page[-1].chunk_index
+
+    async def search_library_chunks(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int = 20,
+        script_id: UUID | None = None,
+        cursor: str | None = None,
+    ) -> ScriptChunkSearchResponse:
+        search_query = query.strip()
+        if not search_query:
+            raise ValidationException("Search query is required")
+
+        await self._get_library_or_raise(library_id)
+        if script_id is not None:
+            await self._get_script_in_library_or_raise(library_id, script_id)
+
+        hits = await self._script_chunk_store.search_chunks(
+            library_id=library_id,
+            query=search_query,
+            size=size,
+            script_id=script_id,
+            search_after=self._decode_search_cursor(cursor) if cursor else None,
+        )
+        next_cursor = self._encode_search_cursor(hits[-1].sort_values) if len(hits) == size else None
+        return ScriptChunkSearchResponse(
+            hits=[ScriptChunkSearchHitResponse.from_entity(hit) for hit in hits],
+            next_cursor=next_cursor,
+        )
+
+    async def semantic_search_library_chunks(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int = 10,
+        script_id: UUID | None = None,
+    ) -> ScriptChunkSearchResponse:
+        search_query = query.strip()
+        if not search_query:
+            raise ValidationException("Search query is required")
+        if self._chunk_embedder is None:
+            raise SemanticSearchUnavailableError()
+
+        await self._get_library_or_raise(library_id)
+        if script_id is not None:
+            await self._get_script_in_library_or_raise(library_id, script_id)
+
+        hits = await self._chunk_retrieval_service.vector_search(
             library_id=library_id,
+            query=search_query,
+            size=size,
+            script_id=script_id,
         )
-        if cached_chunks:
+        return ScriptChunkSearchResponse(hits=[ScriptChunkSearchHitResponse.from_entity(hit) for hit in hits])
+
+    async def hybrid_search_library_chunks(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int = 10,
+        script_id: UUID | None = None,
+    ) -> ScriptChunkHybridSearchResponse:
+        search_query = query.strip()
+        if not search_query:
+            raise ValidationException("Search query is required")
+
+        await self._get_library_or_raise(library_id)
+        if script_id is not None:
+            await self._get_script_in_library_or_raise(library_id, script_id)
+
+        hits = await self._chunk_retrieval_service.hybrid_search(
+            library_id=library_id,
+            query=search_query,
+            size=size,
+            script_id=script_id,
+        )
+        return ScriptChunkHybridSearchResponse(hits=[ScriptChunkHybridHitResponse.from_entity(hit) for hit in hits])
+
+    async def _load_chunk_page(
+        self,
+        script: Script,
+        library_id: UUID,
+        after_index: int | None,
+        limit: int | None,
+        cache_generation: int | None = None,
+    ) -> list[ScriptChunkResponse]:
+        chunk_refs = await self._script_repository.list_chunks(
+            script_id=script.id,
+            library_id=library_id,
+            after_index=after_index,
+            limit=limit,
+        )
+        if chunk_refs:
             try:
-                hydrated_chunks = await self._script_chunk_store.get_chunks(cached_chunks)
+                hydrated_chunks = await self._script_chunk_store.get_chunks(chunk_refs)
+                if cache_generation is not None:
+                    await self._set_cached_chunks(script.id, cache_generation, hydrated_chunks)
                 return self._to_chunk_responses(hydrated_chunks)
             except Exception as exc:
                 logger.warning(
@@ -304,115 +989,492 @@ class ScriptAppService:
                     library_id,
                     exc,
                 )
+        elif after_index is not None:
+            # Paging past the last chunk; the first page already rebuilt missing chunks.
+            return []
+
+        chunk_refs = await self._execute_script_chunks(script, library_id)
+        return await self._hydrate_chunk_refs(
+            script.id,
+            self._slice_after_index(chunk_refs, after_index, limit, key=lambda item: item.index_id),
+            cache=after_index is None and limit is None,
+        )
 
-        return await self._execute_script_chunks(script, library_id)
+    async def _hydrate_chunk_refs(
+        self,
+        script_id: UUID,
+        chunk_refs: list[ScriptChunk],
+        cache: bool = False,
+    ) -> list[ScriptChunkResponse]:
+        chunks = await self._script_chunk_store.get_chunks(chunk_refs) if chunk_refs else []
+        if cache:
+            generation = await self._get_chunk_cache_generation(script_id)
+            if generation is not None:
+                await self._set_cached_chunks(script_id, generation, chunks)
+        return self._to_chunk_responses(chunks)
 
-    async def _validate_upload_text_length(self, file: UploadFile, file_format: FileFormat) -> None:
-        file.file.seek(0)
+    async def _validate_upload_text_length(self, file_stream: BinaryIO, file_format: FileFormat) -> BinaryIO | None:
+        file_stream.seek(0)
+        text_sink = tempfile.SpooledTemporaryFile(max_size=TEXT_SIDECAR_SPOOL_MAX_BYTES)
         try:
-            try:
-                extracted_text = await asyncio.to_thread(
-                    self._file_text_extractor.extract_from_stream,
-                    file.file,
-                    file_format.extension,
-                )
-            except TextExtractError:
-                if not file_format.is_text:
-                    return
-                raise
-        finally:
-            file.file.seek(0)
-
-        if len(extracted_text) > self._upload_max_text_length:
-            raise ValidationException(
-                "File text exceeds limit",
-                detail=f"Each file must contain at most {self._upload_max_text_length} characters of text",
+            await asyncio.to_thread(
+                self._count_upload_text_length,
+                file_stream,
+                file_format.extension,
+                text_sink,
             )
+        except TextExtractError:
+            text_sink.close()
+            return None
+        except BaseException:
+            text_sink.close()
+            raise
+        finally:
+            file_stream.seek(0)
+        return text_sink
+
+    def _count_upload_text_length(self, file_stream, file_extension: str, text_sink: BinaryIO | None = None) -> int:
+        counter = TextLengthCounter(self._upload_max_text_length)
+        text_segments = self._file_text_extractor.iter_text_segments_from_stream(file_stream, file_extension)
+        if text_sink is not None:
+            text_segments = self._write_text_segments(text_segments, text_sink)
+        for segment in text_segments:
+            counter.feed(segment)
+        return counter.length
+
+    async def execute_script_chunks(
+        self,
+        library_id: UUID,
+        script_id: UUID,
+        use_process_pool: bool = False,
+    ) -> list[ScriptChunkResponse]:
+        await self._get_library_or_raise(library_id)
+        script = await self._get_script_in_library_or_raise(library_id, script_id)
+        chunk_refs = await self._execute_script_chunks(script, library_id, use_process_pool=use_process_pool)
+        return await self._hydrate_chunk_refs(script.id, chunk_refs, cache=True)
 
-    async def execute_script_chunks(self, library_id: UUID, script_id: UUID) -> list[ScriptChunkResponse]:
+    async def rebuild_script_chunks(
+        self,
+        library_id: UUID,
+        script_id: UUID,
+        on_progress: ChunkProgressCallback | None = None,
+        use_process_pool: bool = False,
+    ) -> int:
         await self._get_library_or_raise(library_id)
         script = await self._get_script_in_library_or_raise(library_id, script_id)
-        return await self._execute_script_chunks(script, library_id)
+        chunk_refs = await self._execute_script_chunks(
+            script,
+            library_id,
+            on_progress=on_progress,
+            use_process_pool=use_process_pool,
+        )
+        return len(chunk_refs)
+
+    async def submit_script_chunk_job(self, library_id: UUID, script_id: UUID) -> ScriptChunkJobResponse:
+        await self._get_library_or_raise(library_id)
+        await self._get_script_in_library_or_raise(library_id, script_id)
+        if self._chunk_job_runner is None:
+            raise ChunkingError(detail="Background chunk jobs are not available")
+
+        job = await self._chunk_job_runner.submit(library_id, script_id)
+        return ScriptChunkJobResponse.from_entity(job)
+
+    async def rechunk_library(self, library_id: UUID) -> ScriptLibraryRechunkResponse:
+        await self._get_library_or_raise(library_id)
+        if self._chunk_job_runner is None:
+            raise ChunkingError(detail="Background chunk jobs are not available")
+
+        scripts = await self._script_repository.list_all(library_id)
+        jobs = await self._chunk_job_runner.submit_many(
+            library_id,
+            [script.id for script in scripts],
+            use_process_pool=True,
+        )
+        return ScriptLibraryRechunkResponse(
+            library_id=library_id,
+            jobs=[ScriptChunkJobResponse.from_entity(job) for job in jobs],
+        )
+
+    async def get_script_chunk_job(self, library_id: UUID, job_id: UUID) -> ScriptChunkJobResponse:
+        await self._get_library_or_raise(library_id)
+        job = await self._chunk_job_runner.get_job(job_id) if self._chunk_job_runner else None
+        if job is None or job.library_id != library_id:
+            raise ScriptChunkJobNotFoundException(str(job_id))
+        return ScriptChunkJobResponse.from_entity(job)
 
     async def _execute_script_chunks(
         self,
         script: Script,
         library_id: UUID,
-    ) -> list[ScriptChunkResponse]:
+        on_progress: ChunkProgressCallback | None = None,
+        use_process_pool: bool = False,
+    ) -> list[ScriptChunk]:
         existing_chunk_refs = await self._script_repository.list_chunks(
             script_id=script.id,
             library_id=library_id,
         )
+        rebuild = _ChunkRebuild.from_existing(existing_chunk_refs)
+        progress = ScriptChunkJobProgress()
         try:
             library_config = await self._get_or_create_library_config(library_id)
-            metadata = {
-                "script_id": str(script.id),
-                "library_id": str(library_id),
-                "original_name": script.original_name,
-            }
-            async with self._storage_provider.open_object(script.storage_path) as file_stream:
-                documents = await asyncio.to_thread(
-                    self._create_chunk_documents_from_stream,
-                    file_stream,
-                    script.file_extension,
-                    metadata,
-                    library_config.chunk_size,
-                    library_config.chunk_overlap,
-                )
-        except ChunkingError:
-            raise
-        except Exception as exc:
-            raise ChunkingError(detail=str(exc)) from exc
-
-        chunks = self._to_script_chunks(
-            documents=documents,
-            script_id=script.id,
-            library_id=library_id,
-        )
-        try:
-            await self._script_chunk_store.index_chunks(chunks)
+            copied_from_duplicate = await self._copy_chunks_from_duplicate_script(
+                script,
+                library_id,
+                library_config,
+                rebuild,
+                progress,
+                on_progress,
+            )
+            if not copied_from_duplicate:
+                # Extracted text is kept in a sidecar next to the original, so only the first
+                # chunking of a PDF/DOCX pays for parsing; later rebuilds just split the sidecar.
+                sidecar_object_name = await self._get_text_sidecar_object_name(script)
+                if sidecar_object_name is not None and await self._text_sidecar_exists(sidecar_object_name):
+                    await self._index_chunks_from_stream(
+                        script,
+                        library_id,
+                        library_config,
+                        rebuild,
+                        progress,
+                        on_progress,
+                        source_object_name=sidecar_object_name,
+                    )
+                elif use_process_pool and self._chunk_process_pool is not None:
+                    await self._index_chunks_from_process_pool(
+                        script,
+                        library_id,
+                        library_config,
+                        rebuild,
+                        progress,
+                        on_progress,
+                        sidecar_object_name=sidecar_object_name,
+                    )
+                else:
+                    await self._index_chunks_from_stream(
+                        script,
+                        library_id,
+                        library_config,
+                        rebuild,
+                        progress,
+                        on_progress,
+                        sidecar_object_name=sidecar_object_name,
+                    )
         except Exception as exc:
+            if rebuild.new_chunk_ids:
+                await self._delete_chunk_documents_with_retry(
+                    chunk_ids=rebuild.new_chunk_ids,
+                    raise_on_failure=False,
+                )
+            if isinstance(exc, ChunkingError):
+                raise
             raise ChunkingError(detail=str(exc)) from exc
 
         try:
             await self._script_repository.replace_chunks(
                 script_id=script.id,
                 library_id=library_id,
-                chunks=chunks,
+                chunks=rebuild.chunk_refs,
+                chunk_size=library_config.chunk_size,
+                chunk_overlap=library_config.chunk_overlap,
             )
         except Exception:
-            await self._delete_chunk_documents_with_retry(
-                chunk_ids=[chunk.id for chunk in chunks],
-                raise_on_failure=False,
-            )
+            if rebuild.new_chunk_ids:
+                await self._delete_chunk_documents_with_retry(
+                    chunk_ids=rebuild.new_chunk_ids,
+                    raise_on_failure=False,
+                )
             raise
-        if existing_chunk_refs:
+        await self._invalidate_cached_chunks([script.id])
+        if rebuild.removed_chunk_ids:
             await self._delete_chunk_documents_with_retry(
-                chunk_ids=[chunk.id for chunk in existing_chunk_refs],
+                chunk_ids=rebuild.removed_chunk_ids,
                 raise_on_failure=False,
             )
-        return self._to_chunk_responses(chunks)
+        return rebuild.chunk_refs
+
+    async def _get_chunk_cache_generation(self, script_id: UUID) -> int | None:
+        if self._chunk_cache is None:
+            return None
+        try:
+            return await self._chunk_cache.get_generation(script_id)
+        except Exception as exc:
+            logger.warning("Failed to read chunk cache generation: script_id=%s error=%s", script_id, exc)
+            return None
+
+    async def _get_cached_chunks(self, script_id: UUID, generation: int) -> list[ScriptChunk] | None:
+        try:
+            return await self._chunk_cache.get(script_id, generation)
+        except Exception as exc:
+            logger.warning("Failed to read cached chunks: script_id=%s error=%s", script_id, exc)
+            return None
+
+    async def _set_cached_chunks(self, script_id: UUID, generation: int, chunks: list[ScriptChunk]) -> None:
+        try:
+            await self._chunk_cache.set(script_id, generation, chunks)
+        except Exception as exc:
+            logger.warning("Failed to cache chunks: script_id=%s error=%s", script_id, exc)
+
+    async def _invalidate_cached_chunks(self, script_ids: list[UUID]) -> bool:
+        if self._chunk_cache is None or not script_ids:
+            return False
+        try:
+            await self._chunk_cache.invalidate(script_ids)
+        except Exception as exc:
+            logger.warning("Failed to invalidate cached chunks: script_ids=%s error=%s", script_ids, exc)
+            return False
+        return True
+
+    async def _index_chunks_from_stream(
+        self,
+        script: Script,
+        library_id: UUID,
+        library_config: ScriptConfig,
+        rebuild: "_ChunkRebuild",
+        progress: ScriptChunkJobProgress,
+        on_progress: ChunkProgressCallback | None,
+        source_object_name: str | None = None,
+        sidecar_object_name: str | None = None,
+    ) -> None:
+        from_sidecar = source_object_name is not None
+        text_sink = (
+            tempfile.SpooledTemporaryFile(max_size=TEXT_SIDECAR_SPOOL_MAX_BYTES)
+            if sidecar_object_name is not None and not from_sidecar
+            else None
+        )
+        try:
+            async with self._storage_provider.open_object(source_object_name or script.storage_path) as file_stream:
+                text_chunk_batches = iter_batches_in_thread(
+                    lambda: self._iter_text_chunks_from_stream(
+                        file_stream,
+                        None if from_sidecar else script.file_extension,
+                        library_config.chunk_size,
+                        library_config.chunk_overlap,
+                        progress,
+                        text_sink,
+                    ),
+                    batch_size=CHUNK_PIPELINE_BATCH_SIZE,
+                    max_pending_batches=CHUNK_PIPELINE_MAX_PENDING_BATCHES,
+                )
+                async with aclosing(text_chunk_batches):
+                    async for text_chunks in text_chunk_batches:
+                        batch = self._to_script_chunks(
+                            text_chunks=text_chunks,
+                            script_id=script.id,
+                            library_id=library_id,
+                        )
+                        await self._index_chunk_batch(batch, rebuild, progress, on_progress)
+            if text_sink is not None:
+                await self._store_text_sidecar(sidecar_object_name, text_sink, text_sink.tell())
+        finally:
+            if text_sink is not None:
+                text_sink.close()
+
+    async def _index_chunks_from_process_pool(
+        self,
+        script: Script,
+        library_id: UUID,
+        library_config: ScriptConfig,
+        rebuild: "_ChunkRebuild",
+        progress: ScriptChunkJobProgress,
+        on_progress: ChunkProgressCallback | None,
+        sidecar_object_name: str | None = None,
+    ) -> None:
+        # The worker gets file paths, not bytes: the source is spooled to disk once, and the worker writes
+        # the extracted text and the chunks back to files that are read here batch by batch.
+        with tempfile.TemporaryDirectory(prefix="script-chunks-") as work_dir:
+            source_path = os.path.join(work_dir, f"source.{script.file_extension}")
+            chunks_path = os.path.join(work_dir, "chunks.pickle")
+            text_path = os.path.join(work_dir, "text.txt") if sidecar_object_name is not None else None
+            async with self._storage_provider.open_object(script.storage_path) as object_stream:
+                await asyncio.to_thread(self._copy_stream_to_path, object_stream, source_path)
+            split_summary = await self._chunk_process_pool.split_file(
+                source_path,
+                script.file_extension,
+                library_config.chunk_size,
+                library_config.chunk_overlap,
+                chunks_path,
+                text_path,
+            )
+            if text_path is not None:
+                with open(text_path, "rb") as text_stream:
+                    await self._store_text_sidecar(sidecar_object_name, text_stream, os.path.getsize(text_path))
+            progress.extracted_segments = split_summary.extracted_segments
+            text_chunk_batches = iter_batches_in_thread(
+                lambda: iter_split_chunks(chunks_path),
+                batch_size=CHUNK_BULK_INDEX_BATCH_SIZE,
+                max_pending_batches=CHUNK_PIPELINE_MAX_PENDING_BATCHES,
+            )
+            async with aclosing(text_chunk_batches):
+                async for text_chunks in text_chunk_batches:
+                    batch = self._to_script_chunks(
+                        text_chunks=text_chunks,
+                        script_id=script.id,
+                        library_id=library_id,
+                    )
+                    await self._index_chunk_batch(batch, rebuild, progress, on_progress)
+
+    async def _get_text_sidecar_object_name(self, script: Script) -> str | None:
+        if not self._needs_text_sidecar(script.file_extension):
+            return None
+        source_tag = await self._get_script_source_tag(script)
+        if not source_tag:
+            return None
+        return self._build_text_sidecar_object_name(script.storage_path, source_tag)
+
+    async def _get_script_source_tag(self, script: Script) -> str | None:
+        if script.content_hash:
+            return script.content_hash
+        try:
+            stat = await self._storage_provider.stat_object(script.storage_path)
+        except Exception as exc:
+            logger.warning("Failed to stat script object: path=%s error=%s", script.storage_path, exc)
+            return None
+        return stat.etag if stat is not None else None
+
+    async def _text_sidecar_exists(self, object_name: str) -> bool:
+        try:
+            return await self._storage_provider.stat_object(object_name) is not None
+        except Exception as exc:
+            logger.warning("Failed to stat extracted text sidecar: path=%s error=%s", object_name, exc)
+            return False
+
+    async def _store_text_sidecar(self, object_name: str, text_stream: BinaryIO, size: int) -> None:
+        text_stream.seek(0)
+        try:
+            await self._storage_provider.upload_file(
+                object_name=object_name,
+                data_stream=text_stream,
+                data_size=size,
+                content_type=TEXT_SIDECAR_CONTENT_TYPE,
+            )
+        except Exception as exc:
+            logger.warning("Failed to store extracted text sidecar: path=%s error=%s", object_name, exc)
+
+    async def _index_chunk_batch(
+        self,
+        batch: list[ScriptChunk],
+        rebuild: "_ChunkRebuild",
+        progress: ScriptChunkJobProgress,
+        on_progress: ChunkProgressCallback | None,
+    ) -> None:
+        unchanged_chunk_ids = rebuild.adopt(batch)
+        present_chunk_ids = await self._script_chunk_store.find_existing_chunk_ids(unchanged_chunk_ids)
+        pending_chunks = [chunk for chunk in batch if chunk.id not in present_chunk_ids]
+        if pending_chunks:
+            await self._embed_chunks(pending_chunks, rebuild)
+            try:
+                await self._script_chunk_store.index_chunks(pending_chunks)
+            finally:
+                # Vectors live in Elasticsearch only; do not keep them for the whole rebuild.
+                for chunk in pending_chunks:
+                    chunk.embedding = None
+        progress.total_chunks = len(rebuild.chunk_refs)
+        progress.indexed_chunks = len(rebuild.chunk_refs)
+        if on_progress is not None:
+            await on_progress(progress)
+
+    async def _embed_chunks(self, chunks: list[ScriptChunk], rebuild: "_ChunkRebuild") -> None:
+        if self._chunk_embedder is None:
+            return
+
+        source_ids = {
+            chunk.id: source_id
+            for chunk in chunks
+            if (source_id := rebuild.embedding_source_id(chunk)) is not None
+        }
+        if source_ids:
+            try:
+                stored_embeddings = await self._script_chunk_store.get_chunk_embeddings(
+                    list(source_ids.values())
+                )
+            except Exception as exc:
+                logger.warning("Failed to load stored chunk embeddings, re-embedding: error=%s", exc)
+                stored_embeddings = {}
+            for chunk in chunks:
+                embedding = stored_embeddings.get(source_ids.get(chunk.id))
+                if embedding is not None and len(embedding) == self._chunk_embedder.dimensions:
+                    chunk.embedding = embedding
+
+        missing_chunks = [chunk for chunk in chunks if chunk.embedding is None]
+        for start in range(0, len(missing_chunks), CHUNK_EMBEDDING_BATCH_SIZE):
+            embedding_batch = missing_chunks[start:start + CHUNK_EMBEDDING_BATCH_SIZE]
+            embeddings = await self._chunk_embedder.embed([chunk.content for chunk in embedding_batch])
+            for chunk, embedding in zip(embedding_batch, embeddings, strict=True):
+                chunk.embedding = embedding
+
+    async def _copy_chunks_from_duplicate_script(
+        self,
+        script: Script,
+        library_id: UUID,
+        library_config: ScriptConfig,
+        rebuild: "_ChunkRebuild",
+        progress: ScriptChunkJobProgress,
+        on_progress: ChunkProgressCallback | None,
+    ) -> bool:
+        if not script.content_hash:
+            return False
+        donor = await self._script_repository.find_chunked_script_by_content_hash(
+            content_hash=script.content_hash,
+            chunk_size=library_config.chunk_size,
+            chunk_overlap=library_config.chunk_overlap,
+            exclude_script_id=script.id,
+        )
+        if donor is None or donor.library_id is None:
+            return False
+
+        donor_chunk_refs = await self._script_repository.list_chunks(donor.id, donor.library_id)
+        if not donor_chunk_refs:
+            return False
+        for start in range(0, len(donor_chunk_refs), CHUNK_PIPELINE_BATCH_SIZE):
+            donor_ref_batch = donor_chunk_refs[start:start + CHUNK_PIPELINE_BATCH_SIZE]
+            try:
+                donor_chunks = await self._script_chunk_store.get_chunks(donor_ref_batch)
+                if len(donor_chunks) != len(donor_ref_batch):
+                    raise ChunkingError(detail="Duplicate script chunk documents are incomplete")
+            except Exception as exc:
+                if start > 0:
+                    # Earlier batches are already indexed; fail and let the caller roll them back.
+                    raise
+                logger.warning(
+                    "Failed to load duplicate script chunks, rebuilding: script_id=%s donor_script_id=%s error=%s",
+                    script.id,
+                    donor.id,
+                    exc,
+                )
+                return False
+
+            copied_chunks: list[ScriptChunk] = []
+            for chunk in donor_chunks:
+                copied_chunk = ScriptChunk.create(
+                    script_id=script.id,
+                    library_id=library_id,
+                    index_id=chunk.index_id,
+                    content=chunk.content,
+                    start_index=chunk.start_index,
+                    end_index=chunk.end_index,
+                )
+                rebuild.embedding_source_ids[copied_chunk.id] = chunk.id
+                copied_chunks.append(copied_chunk)
+            await self._index_chunk_batch(copied_chunks, rebuild, progress, on_progress)
+        return True
 
     async def delete_script_from_library(self, library_id: UUID, script_id: UUID) -> ScriptDeleteResponse:
         await self._get_library_or_raise(library_id)
         script = await self._get_script_in_library_or_raise(library_id, script_id)
-        chunk_refs = await self._script_repository.list_chunks(script.id, library_id)
 
         deleted = await self._script_repository.delete(script_id)
         if not deleted:
             raise ScriptNotFoundException(str(script_id))
-        failed_chunk_ids = await self._delete_chunk_documents_with_retry(
-            [chunk.id for chunk in chunk_refs],
-            raise_on_failure=False,
+        await self._invalidate_cached_chunks([script.id])
+        chunks_deleted = await self._delete_chunk_documents_by_query_with_retry(
+            lambda: self._script_chunk_store.delete_script_chunks(script.id, library_id),
+            scope=f"script '{script.id}'",
         )
-        failed_objects = await self._delete_objects_with_retry([script.storage_path], raise_on_failure=False)
-        if failed_chunk_ids or failed_objects:
+        failed_objects = await self._release_script_objects([script])
+        if not chunks_deleted or failed_objects:
             details: list[str] = []
-            if failed_chunk_ids:
-                details.append(
-                    "failed to delete Elasticsearch chunk document(s): "
-                    f"{self._preview_identifiers(failed_chunk_ids)}"
-                )
+            if not chunks_deleted:
+                details.append(f"failed to delete Elasticsearch chunk documents of script {script.id}")
             if failed_objects:
                 details.append(f"failed to delete storage object: {failed_objects[0]}")
             raise StorageCleanupError(
@@ -424,32 +1486,30 @@ class ScriptAppService:
     async def delete_library(self, library_id: UUID) -> ScriptLibraryDeleteResponse:
         library = await self._get_library_or_raise(library_id)
         scripts = await self._script_repository.list_all(library_id=library_id)
-        chunk_refs: list[ScriptChunk] = []
-        for script in scripts:
-            chunk_refs.extend(await self._script_repository.list_chunks(script.id, library_id))
 
         deleted = await self._script_repository.delete_library(library_id)
         if not deleted:
             raise ScriptLibraryNotFoundException(str(library_id))
 
-        failed_chunk_ids = await self._delete_chunk_documents_with_retry(
-            [chunk.id for chunk in chunk_refs],
-            raise_on_failure=False,
-        )
-        failed_objects = await self._delete_objects_with_retry(
-            [
-                *[script.storage_path for script in scripts],
-                *([library.avatar_path] if library.avatar_path else []),
-            ],
-            raise_on_failure=False,
+        await self._invalidate_cached_chunks([script.id for script in scripts])
+        chunks_deleted = await self._delete_chunk_documents_by_query_with_retry(
+            lambda: self._script_chunk_store.delete_library_chunks(library_id),
+            scope=f"library '{library_id}'",
         )
-        if failed_chunk_ids or failed_objects:
+        failed_objects = await self._release_script_objects(scripts)
+        if library.avatar_path:
+            avatar_object_names = [
+                library.avatar_path,
+                *self._build_library_avatar_thumbnail_object_names(library_id),
+            ]
+            failed_objects.extend(
+                await self._delete_objects_with_retry(avatar_object_names, raise_on_failure=False)
+            )
+            self._invalidate_cached_avatars(avatar_object_names)
+        if not chunks_deleted or failed_objects:
             details: list[str] = []
-            if failed_chunk_ids:
-                details.append(
-                    "failed to delete Elasticsearch chunk document(s): "
-                    f"{self._preview_identifiers(failed_chunk_ids)}"
-                )
+            if not chunks_deleted:
+                details.append(f"failed to delete Elasticsearch chunk documents of library {library_id}")
             if failed_objects:
                 preview = ", ".join(failed_objects[:5])
                 suffix = "..." if len(failed_objects) > 5 else ""
@@ -531,15 +1591,35 @@ class ScriptAppService:
         raise_on_failure: bool = True,
         max_retries: int = 3,
     ) -> list[str]:
-        failed_chunk_ids: list[str] = []
-        for chunk_id in chunk_ids:
-            deleted = await self._delete_chunk_document_with_retry(
-                chunk_id=chunk_id,
-                max_retries=max_retries,
-            )
-            if not deleted:
-                failed_chunk_ids.append(str(chunk_id))
+        pending_ids = list(dict.fromkeys(chunk_ids))
+        for attempt in range(1, max_retries + 1):
+            if not pending_ids:
+                break
+            try:
+                await self._script_chunk_store.delete_chunks(pending_ids)
+                pending_ids = []
+            except ChunkDocumentDeleteError as exc:
+                failed = set(exc.failed_chunk_ids)
+                pending_ids = [chunk_id for chunk_id in pending_ids if str(chunk_id) in failed]
+                logger.warning(
+                    "Failed to delete %s Elasticsearch chunk document(s) on attempt %s/%s: %s",
+                    len(pending_ids),
+                    attempt,
+                    max_retries,
+                    exc.detail,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Failed to delete %s Elasticsearch chunk document(s) on attempt %s/%s: %s",
+                    len(pending_ids),
+                    attempt,
+                    max_retries,
+                    exc,
+                )
+            if pending_ids and attempt < max_retries:
+                await asyncio.sleep(0.2 * attempt)
 
+        failed_chunk_ids = [str(chunk_id) for chunk_id in pending_ids]
         if failed_chunk_ids and raise_on_failure:
             raise StorageCleanupError(
                 detail=(
@@ -550,15 +1630,20 @@ class ScriptAppService:
 
         return failed_chunk_ids
 
-    async def _delete_chunk_document_with_retry(self, chunk_id: UUID, max_retries: int = 3) -> bool:
+    async def _delete_chunk_documents_by_query_with_retry(
+        self,
+        delete_operation: Callable[[], Awaitable[None]],
+        scope: str,
+        max_retries: int = 3,
+    ) -> bool:
         for attempt in range(1, max_retries + 1):
             try:
-                await self._script_chunk_store.delete_chunks([chunk_id])
+                await delete_operation()
                 return True
             except Exception as exc:
                 logger.warning(
-                    "Failed to delete Elasticsearch chunk document '%s' on attempt %s/%s: %s",
-                    chunk_id,
+                    "Failed to delete Elasticsearch chunk documents of %s on attempt %s/%s: %s",
+                    scope,
                     attempt,
                     max_retries,
                     exc,
@@ -567,26 +1652,72 @@ class ScriptAppService:
                     await asyncio.sleep(0.2 * attempt)
         return False
 
-    def _create_chunk_documents_from_stream(
+    def _iter_text_chunks_from_stream(
         self,
         file_stream,
-        file_extension: str,
-        metadata: dict[str, str],
+        file_extension: str | None,
         chunk_size: int,
         chunk_overlap: int,
-    ):
+        progress: ScriptChunkJobProgress | None = None,
+        text_sink: BinaryIO | None = None,
+    ) -> Iterator[ScriptTextChunk]:
         splitter = ScriptSentenceWindowTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
         )
-        text_segments = self._file_text_extractor.iter_text_segments_from_stream(
+        text_segments = self._iter_script_text_segments(file_stream, file_extension)
+        if text_sink is not None:
+            text_segments = self._write_text_segments(text_segments, text_sink)
+        if progress is not None:
+            text_segments = self._count_text_segments(text_segments, progress)
+        return splitter.iter_chunks_from_text_segments(text_segments)
+
+    def _iter_script_text_segments(self, file_stream, file_extension: str | None) -> Iterator[str]:
+        if file_extension is None:
+            return self._file_text_extractor.iter_utf8_text_segments_from_stream(file_stream)
+        return self._file_text_extractor.iter_text_segments_from_stream(
             file_stream=file_stream,
             file_extension=file_extension,
         )
-        return splitter.create_documents_from_text_segments(
-            text_segments=text_segments,
-            metadata=metadata,
-        )
+
+    def _read_text_range(
+        self,
+        file_stream,
+        file_extension: str | None,
+        unit: str,
+        start: int,
+        stop: int,
+    ) -> tuple[str | bytes, int | None]:
+        # Offsets count decoded characters or bytes of the UTF-8 encoding; the total length is only
+        # known when the text ends before the requested range does.
+        parts: list = []
+        position = 0
+        with closing(self._iter_script_text_segments(file_stream, file_extension)) as text_segments:
+            for segment in text_segments:
+                piece = segment.encode("utf-8") if unit == "bytes" else segment
+                if position + len(piece) > start:
+                    parts.append(piece[max(start - position, 0):stop - position])
+                position += len(piece)
+                if position >= stop:
+                    return (b"" if unit == "bytes" else "").join(parts), None
+        return (b"" if unit == "bytes" else "").join(parts), position
+
+    @staticmethod
+    def _copy_stream_to_path(source: BinaryIO, path: str) -> None:
+        with open(path, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+    @staticmethod
+    def _write_text_segments(text_segments: Iterable[str], text_sink: BinaryIO) -> Iterator[str]:
+        for segment in text_segments:
+            text_sink.write(segment.encode("utf-8"))
+            yield segment
+
+    @staticmethod
+    def _count_text_segments(text_segments: Iterable[str], progress: ScriptChunkJobProgress) -> Iterator[str]:
+        for segment in text_segments:
+            progress.extracted_segments += 1
+            yield segment
 
     async def _get_or_create_library_config(self, library_id: UUID) -> ScriptConfig:
         config = await self._script_repository.get_library_config(library_id)
@@ -600,28 +1731,42 @@ class ScriptAppService:
 
     @staticmethod
     def _to_script_chunks(
-        documents,
+        text_chunks: Iterable[ScriptTextChunk],
         script_id: UUID,
         library_id: UUID,
     ) -> list[ScriptChunk]:
-        chunks: list[ScriptChunk] = []
-        for document in documents:
-            content = document.page_content
-            metadata = document.metadata or {}
-            chunk_index = int(metadata.get("chunk_index", len(chunks)))
-            start_index = int(metadata.get("start_index", 0))
-            end_index = int(metadata.get("end_index", start_index + len(content)))
-            chunks.append(
-                ScriptChunk.create(
-                    script_id=script_id,
-                    library_id=library_id,
-                    index_id=chunk_index,
-                    content=content,
-                    start_index=start_index,
-                    end_index=end_index,
-                )
+        return [
+            ScriptChunk.create(
+                script_id=script_id,
+                library_id=library_id,
+                index_id=text_chunk.index,
+                content=text_chunk.content,
+                start_index=text_chunk.start_index,
+                end_index=text_chunk.end_index,
             )
-        return chunks
+            for text_chunk in text_chunks
+        ]
+
+    @staticmethod
+    def _encode_search_cursor(sort_values: list[object]) -> str:
+        payload = json.dumps(sort_values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_search_cursor(cursor: str) -> list[object]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            sort_values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (ValueError, UnicodeError) as exc:
+            raise ValidationException("Invalid search cursor") from exc
+        if not isinstance(sort_values, list) or not sort_values:
+            raise ValidationException("Invalid search cursor")
+        return sort_values
+
+    @staticmethod
+    def _slice_after_index(items: list, after_index: int | None, limit: int | None, key: Callable) -> list:
+        start = bisect.bisect_right(items, after_index, key=key) if after_index is not None else 0
+        return items[start:start + limit] if limit is not None else items[start:]
 
     @staticmethod
     def _to_chunk_responses(chunks: list[ScriptChunk]) -> list[ScriptChunkResponse]:
@@ -647,13 +1792,40 @@ class ScriptAppService:
             raise ValidationException("Unable to determine upload file size") from exc
 
     @staticmethod
-    def _build_text_object_name(library_id: UUID, script_id: UUID, extension: str) -> str:
-        return f"{library_id}/text/{script_id}.{extension}"
+    def _needs_text_sidecar(file_extension: str) -> bool:
+        return file_extension.lower().lstrip(".") not in FileFormat.TEXT_EXTENSIONS
+
+    @staticmethod
+    def _build_text_sidecar_object_name(storage_path: str, source_tag: str) -> str:
+        return f"{storage_path}.{source_tag[:32]}.text-v{FileTextExtractor.EXTRACTION_VERSION}.txt"
+
+    @staticmethod
+    def _build_blob_object_name(content_hash: str, extension: str) -> str:
+        return f"{BLOB_OBJECT_PREFIX}{content_hash[:2]}/{content_hash}/{uuid.uuid4().hex}.{extension}"
+
+    @staticmethod
+    def _build_staged_upload_object_name(library_id: UUID, upload_id: UUID, extension: str) -> str:
+        return f"{STAGED_UPLOAD_OBJECT_PREFIX}{library_id}/{upload_id}.{extension}"
+
+    @staticmethod
+    def _is_blob_backed(script: Script) -> bool:
+        return bool(script.content_hash) and script.storage_path.startswith(BLOB_OBJECT_PREFIX)
 
     @staticmethod
     def _build_library_avatar_object_name(library_id: UUID, extension: str) -> str:
         return f"{library_id}/image/avatar.{extension}"
 
+    @staticmethod
+    def _build_library_avatar_thumbnail_object_name(library_id: UUID, size: int) -> str:
+        return f"{library_id}/image/avatar-{size}.{THUMBNAIL_EXTENSION}"
+
+    @classmethod
+    def _build_library_avatar_thumbnail_object_names(cls, library_id: UUID) -> list[str]:
+        return [
+            cls._build_library_avatar_thumbnail_object_name(library_id, size)
+            for size in LIBRARY_AVATAR_THUMBNAIL_SIZES
+        ]
+
     @staticmethod
     def _preview_identifiers(items: list[str]) -> str:
         preview = ", ".join(items[:5])
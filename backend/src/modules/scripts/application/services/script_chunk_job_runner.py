@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.modules.scripts.domain.entities.script_chunk_job_entity import (
+    ScriptChunkJob,
+    ScriptChunkJobProgress,
+    ScriptChunkJobStatus,
+)
+from src.modules.scripts.domain.repositories import IScriptChunkJobRepository
+from src.shared.domain.exceptions import DomainException
+
+if TYPE_CHECKING:
+    from src.modules.scripts.application.services.script_app_service import ScriptAppService
+
+logger = logging.getLogger(__name__)
+
+
+class ScriptChunkJobRunner:
+    def __init__(
+        self,
+        job_repository: IScriptChunkJobRepository,
+        service_factory: Callable[[], AbstractAsyncContextManager["ScriptAppService"]],
+        max_concurrency: int,
+        process_pool_max_concurrency: int | None = None,
+    ):
+        self._job_repository = job_repository
+        self._service_factory = service_factory
+        self._max_concurrency = max(1, max_concurrency)
+        self._process_pool_max_concurrency = max(1, process_pool_max_concurrency or max_concurrency)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        # Process-pool jobs spend their CPU time in worker processes, so they are bounded separately
+        # and do not queue behind (or starve) interactive single-script jobs.
+        self._process_pool_semaphore = asyncio.Semaphore(self._process_pool_max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        library_id: UUID,
+        script_id: UUID,
+        use_process_pool: bool = False,
+    ) -> ScriptChunkJob:
+        job = ScriptChunkJob.create(library_id=library_id, script_id=script_id)
+        await self._job_repository.save(job)
+        self._track(asyncio.create_task(self._run(job, use_process_pool)))
+        return job
+
+    async def submit_many(
+        self,
+        library_id: UUID,
+        script_ids: list[UUID],
+        use_process_pool: bool = False,
+    ) -> list[ScriptChunkJob]:
+        jobs: list[ScriptChunkJob] = []
+        for script_id in script_ids:
+            job = ScriptChunkJob.create(library_id=library_id, script_id=script_id)
+            await self._job_repository.save(job)
+            jobs.append(job)
+        if jobs:
+            # One drain task feeds a bounded queue instead of creating a task per script up front.
+            self._track(asyncio.create_task(self._drain(jobs, use_process_pool)))
+        return jobs
+
+    async def get_job(self, job_id: UUID) -> ScriptChunkJob | None:
+        return await self._job_repository.find_by_id(job_id)
+
+    async def wait_idle(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _track(self, task: asyncio.Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, jobs: list[ScriptChunkJob], use_process_pool: bool) -> None:
+        worker_count = min(
+            len(jobs),
+            self._process_pool_max_concurrency if use_process_pool else self._max_concurrency,
+        )
+        queue: asyncio.Queue[ScriptChunkJob | None] = asyncio.Queue(maxsize=worker_count)
+
+        async def _work() -> None:
+            while (job := await queue.get()) is not None:
+                await self._run(job, use_process_pool)
+
+        workers = [asyncio.create_task(_work()) for _ in range(worker_count)]
+        try:
+            for job in jobs:
+                await queue.put(job)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for job in jobs:
+                if job.status == ScriptChunkJobStatus.PENDING:
+                    job.mark_failed("Chunk job was cancelled")
+                    await asyncio.shield(self._save(job))
+            raise
+
+    async def _run(self, job: ScriptChunkJob, use_process_pool: bool) -> None:
+        semaphore = self._process_pool_semaphore if use_process_pool else self._semaphore
+        try:
+            async with semaphore:
+                await self._execute(job, use_process_pool)
+        except asyncio.CancelledError:
+            job.mark_failed("Chunk job was cancelled")
+            await asyncio.shield(self._save(job))
+            raise
+
+    async def _execute(self, job: ScriptChunkJob, use_process_pool: bool) -> None:
+        job.mark_running()
+        await self._save(job)
+
+        async def _report_progress(progress: ScriptChunkJobProgress) -> None:
+            job.update_progress(progress)
+            await self._save(job)
+
+        try:
+            async with self._service_factory() as service:
+                await service.rebuild_script_chunks(
+                    job.library_id,
+                    job.script_id,
+                    on_progress=_report_progress,
+                    use_process_pool=use_process_pool,
+                )
+        except DomainException as exc:
+            job.mark_failed(exc.detail or exc.message)
+        except Exception as exc:
+            logger.exception("Script chunk job failed: job_id=%s script_id=%s", job.id, job.script_id)
+            job.mark_failed(str(exc))
+        else:
+            job.mark_succeeded()
+        await self._save(job)
+
+    async def _save(self, job: ScriptChunkJob) -> None:
+        try:
+            await self._job_repository.save(job)
+        except Exception as exc:
+            logger.warning("Failed to persist script chunk job state: job_id=%s error=%s", job.id, exc)
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from src.modules.scripts.domain.entities.script_chunk_search_entity import (
+    ScriptChunkHybridHit,
+    ScriptChunkSearchHit,
+)
+from src.modules.scripts.domain.repositories import IScriptChunkEmbedder, IScriptChunkStore
+
+logger = logging.getLogger(__name__)
+
+
+RRF_RANK_CONSTANT = 60
+RRF_CANDIDATE_MULTIPLIER = 2
+RRF_MIN_CANDIDATES = 20
+
+
+class ScriptChunkRetrievalService:
+    def __init__(
+        self,
+        script_chunk_store: IScriptChunkStore,
+        chunk_embedder: IScriptChunkEmbedder | None = None,
+        rank_constant: int = RRF_RANK_CONSTANT,
+    ):
+        self._script_chunk_store = script_chunk_store
+        self._chunk_embedder = chunk_embedder
+        self._rank_constant = rank_constant
+
+    async def hybrid_search(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int,
+        script_id: UUID | None = None,
+    ) -> list[ScriptChunkHybridHit]:
+        candidate_size = max(size * RRF_CANDIDATE_MULTIPLIER, RRF_MIN_CANDIDATES)
+        lexical_result, vector_result = await asyncio.gather(
+            self._script_chunk_store.search_chunks(
+                library_id=library_id,
+                query=query,
+                size=candidate_size,
+                script_id=script_id,
+            ),
+            self.vector_search(library_id, query, candidate_size, script_id),
+            return_exceptions=True,
+        )
+        if isinstance(lexical_result, BaseException) and isinstance(vector_result, BaseException):
+            raise lexical_result
+        if isinstance(lexical_result, BaseException):
+            logger.warning("Lexical chunk search failed, using vector results only: error=%s", lexical_result)
+            lexical_result = []
+        if isinstance(vector_result, BaseException):
+            logger.warning("Vector chunk search failed, using lexical results only: error=%s", vector_result)
+            vector_result = []
+        return self.fuse(lexical_result, vector_result, size)
+
+    def fuse(
+        self,
+        lexical_hits: list[ScriptChunkSearchHit],
+        vector_hits: list[ScriptChunkSearchHit],
+        size: int,
+    ) -> list[ScriptChunkHybridHit]:
+        fused: dict[UUID, ScriptChunkHybridHit] = {}
+        for rank, hit in enumerate(lexical_hits, start=1):
+            fused_hit = fused.setdefault(hit.chunk_id, ScriptChunkHybridHit(hit=hit, score=0.0))
+            fused_hit.score += 1.0 / (self._rank_constant + rank)
+            fused_hit.lexical_score = hit.score
+            fused_hit.lexical_rank = rank
+        for rank, hit in enumerate(vector_hits, start=1):
+            fused_hit = fused.setdefault(hit.chunk_id, ScriptChunkHybridHit(hit=hit, score=0.0))
+            fused_hit.score += 1.0 / (self._rank_constant + rank)
+            fused_hit.vector_score = hit.score
+            fused_hit.vector_rank = rank
+        return sorted(
+            fused.values(),
+            key=lambda item: (-item.score, str(item.hit.script_id), item.hit.chunk_index),
+        )[:size]
+
+    async def vector_search(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int,
+        script_id: UUID | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        if self._chunk_embedder is None:
+            return []
+        query_vectors = await self._chunk_embedder.embed([query])
+        return await self._script_chunk_store.knn_search_chunks(
+            library_id=library_id,
+            query_vector=query_vectors[0],
+            size=size,
+            script_id=script_id,
+        )
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class ScriptBlob:
+    content_hash: str
+    storage_path: str
+    file_size: int
+    ref_count: int
+    created_at: datetime
+    updated_at: datetime
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+import hashlib
 import uuid
 
 from src.shared.domain.base_entity import BaseEntity
@@ -14,6 +15,28 @@ class ScriptChunk(BaseEntity):
     chunk_size: int = 0
     start_index: int = 0
     end_index: int = 0
+    fingerprint: str | None = None
+    embedding: list[float] | None = None
+
+    @staticmethod
+    def compute_fingerprint(content: str, start_index: int, end_index: int) -> str:
+        digest = hashlib.sha256(f"{start_index}:{end_index}:".encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def to_ref(self) -> "ScriptChunk":
+        return ScriptChunk(
+            id=self.id,
+            script_id=self.script_id,
+            library_id=self.library_id,
+            index_id=self.index_id,
+            chunk_size=self.chunk_size,
+            start_index=self.start_index,
+            end_index=self.end_index,
+            fingerprint=self.fingerprint,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
 
     @classmethod
     def create(
@@ -35,6 +58,7 @@ class ScriptChunk(BaseEntity):
             chunk_size=len(content),
             start_index=start_index,
             end_index=end_index,
+            fingerprint=cls.compute_fingerprint(content, start_index, end_index),
             created_at=now,
             updated_at=now,
         )
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+import uuid
+
+from src.shared.domain.base_entity import BaseEntity
+
+
+class ScriptChunkJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class ScriptChunkJobProgress:
+    extracted_segments: int = 0
+    total_chunks: int = 0
+    indexed_chunks: int = 0
+
+
+@dataclass
+class ScriptChunkJob(BaseEntity):
+    library_id: uuid.UUID | None = None
+    script_id: uuid.UUID | None = None
+    status: ScriptChunkJobStatus = ScriptChunkJobStatus.PENDING
+    extracted_segments: int = 0
+    total_chunks: int = 0
+    indexed_chunks: int = 0
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in {ScriptChunkJobStatus.SUCCEEDED, ScriptChunkJobStatus.FAILED}
+
+    @classmethod
+    def create(cls, library_id: uuid.UUID, script_id: uuid.UUID) -> "ScriptChunkJob":
+        now = datetime.utcnow()
+        return cls(
+            id=uuid.uuid4(),
+            library_id=library_id,
+            script_id=script_id,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def mark_running(self) -> None:
+        now = datetime.utcnow()
+        self.status = ScriptChunkJobStatus.RUNNING
+        self.started_at = now
+        self.updated_at = now
+
+    def update_progress(self, progress: ScriptChunkJobProgress) -> None:
+        self.extracted_segments = progress.extracted_segments
+        self.total_chunks = progress.total_chunks
+        self.indexed_chunks = progress.indexed_chunks
+        self.updated_at = datetime.utcnow()
+
+    def mark_succeeded(self) -> None:
+        now = datetime.utcnow()
+        self.status = ScriptChunkJobStatus.SUCCEEDED
+        self.finished_at = now
+        self.updated_at = now
+
+    def mark_failed(self, error: str) -> None:
+        now = datetime.utcnow()
+        self.status = ScriptChunkJobStatus.FAILED
+        self.error = error
+        self.finished_at = now
+        self.updated_at = now
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass
+class ScriptChunkHighlight:
+    text: str
+    start_index: int
+    end_index: int
+
+
+@dataclass
+class ScriptChunkSearchHit:
+    chunk_id: UUID
+    script_id: UUID
+    library_id: UUID
+    chunk_index: int
+    start_index: int
+    end_index: int
+    score: float
+    content: str = ""
+    highlights: list[ScriptChunkHighlight] = field(default_factory=list)
+    sort_values: list[object] = field(default_factory=list)
+
+
+@dataclass
+class ScriptChunkHybridHit:
+    hit: ScriptChunkSearchHit
+    score: float
+    lexical_score: float | None = None
+    lexical_rank: int | None = None
+    vector_score: float | None = None
+    vector_rank: int | None = None
@@ -10,3 +10,4 @@ class ScriptConfig:
     chunk_overlap: int
     created_at: datetime
     updated_at: datetime
+    auto_chunk_on_upload: bool = False
@@ -13,6 +13,9 @@ class Script(BaseEntity):
     file_extension: str = ""
     content_type: str = "application/octet-stream"
     file_size: int = 0
+    content_hash: str | None = None
+    chunk_size: int | None = None
+    chunk_overlap: int | None = None
 
     @classmethod
     def create(
@@ -23,6 +26,7 @@ class Script(BaseEntity):
         file_extension: str,
         content_type: str,
         file_size: int,
+        content_hash: str | None = None,
     ) -> "Script":
         now = datetime.utcnow()
         return cls(
@@ -33,6 +37,7 @@ class Script(BaseEntity):
             file_extension=file_extension,
             content_type=content_type,
             file_size=file_size,
+            content_hash=content_hash,
             created_at=now,
             updated_at=now,
         )
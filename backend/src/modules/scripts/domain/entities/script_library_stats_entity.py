@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class ScriptLibraryStats:
+    library_id: UUID
+    script_count: int = 0
+    total_file_size: int = 0
+    chunk_count: int = 0
+    last_script_updated_at: datetime | None = None
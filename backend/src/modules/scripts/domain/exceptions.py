@@ -1,4 +1,4 @@
-from src.shared.domain.exceptions import DomainException
+from src.shared.domain.exceptions import DomainException, ValidationException
 
 
 class ScriptNotFoundException(DomainException):
@@ -37,6 +37,15 @@ class ScriptLibraryAvatarNotFoundException(DomainException):
         )
 
 
+class ScriptChunkJobNotFoundException(DomainException):
+    def __init__(self, identifier: str):
+        super().__init__(
+            message="Script chunk job not found",
+            code=404,
+            detail=f"Script chunk job with identifier '{identifier}' does not exist",
+        )
+
+
 class TextExtractError(DomainException):
     def __init__(self, detail: str | None = None):
         super().__init__(
@@ -55,6 +64,23 @@ class ChunkingError(DomainException):
         )
 
 
+class SemanticSearchUnavailableError(DomainException):
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Semantic search is not available",
+            code=503,
+            detail=detail or "No chunk embedder is configured",
+        )
+
+
+class PresignedTransferUnavailableError(DomainException):
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Presigned transfer is not available",
+            code=503,
+            detail=detail or "Direct object storage transfer is disabled",
+        )
+
 class StorageCleanupError(DomainException):
     def __init__(self, detail: str | None = None):
         super().__init__(
@@ -62,3 +88,32 @@ class StorageCleanupError(DomainException):
             code=500,
             detail=detail or "Database records are deleted but storage cleanup failed",
         )
+
+
+class ChunkDocumentDeleteError(DomainException):
+    def __init__(self, failed_chunk_ids: list[str], detail: str | None = None):
+        self.failed_chunk_ids = failed_chunk_ids
+        super().__init__(
+            message="Failed to delete chunk documents",
+            code=500,
+            detail=detail or f"Failed to delete {len(failed_chunk_ids)} chunk document(s)",
+        )
+
+
+class ScriptTextRangeNotSatisfiableError(DomainException):
+    def __init__(self, unit: str, total: int):
+        self.unit = unit
+        self.total = total
+        super().__init__(
+            message="Requested text range not satisfiable",
+            code=416,
+            detail=f"Script text has {total} {unit}",
+        )
+
+
+class ScriptTextTooLongError(ValidationException):
+    def __init__(self, max_text_length: int):
+        super().__init__(
+            message="File text exceeds limit",
+            detail=f"Each file must contain at most {max_text_length} characters of text",
+        )
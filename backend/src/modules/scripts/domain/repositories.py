@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.modules.scripts.domain.entities.script_blob_entity import ScriptBlob
 from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.domain.entities.script_chunk_job_entity import ScriptChunkJob
+from src.modules.scripts.domain.entities.script_chunk_search_entity import ScriptChunkSearchHit
 from src.modules.scripts.domain.entities.script_config_entity import ScriptConfig
 from src.modules.scripts.domain.entities.script_entity import Script
 from src.modules.scripts.domain.entities.script_library_entity import ScriptLibrary
+from src.modules.scripts.domain.entities.script_library_stats_entity import ScriptLibraryStats
 
 
 class IScriptRepository(ABC):
@@ -41,6 +45,10 @@ class IScriptRepository(ABC):
     async def delete_library(self, library_id: UUID) -> bool:
         pass
 
+    @abstractmethod
+    async def get_library_stats(self, library_id: UUID) -> ScriptLibraryStats:
+        pass
+
     @abstractmethod
     async def save_to_library(self, script: Script, library_id: UUID) -> Script:
         pass
@@ -49,16 +57,36 @@ class IScriptRepository(ABC):
     async def list_all(self, library_id: UUID | None = None) -> list[Script]:
         pass
 
+    @abstractmethod
+    async def list_all_with_chunk_counts(self, library_id: UUID) -> list[tuple[Script, int]]:
+        pass
+
     @abstractmethod
     async def find_by_id(self, script_id: UUID) -> Script | None:
         pass
 
+    @abstractmethod
+    async def find_chunked_script_by_content_hash(
+        self,
+        content_hash: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        exclude_script_id: UUID | None = None,
+    ) -> Script | None:
+        pass
+
     @abstractmethod
     async def delete(self, script_id: UUID) -> bool:
         pass
 
     @abstractmethod
-    async def list_chunks(self, script_id: UUID, library_id: UUID) -> list[ScriptChunk]:
+    async def list_chunks(
+        self,
+        script_id: UUID,
+        library_id: UUID,
+        after_index: int | None = None,
+        limit: int | None = None,
+    ) -> list[ScriptChunk]:
         pass
 
     @abstractmethod
@@ -67,9 +95,23 @@ class IScriptRepository(ABC):
         script_id: UUID,
         library_id: UUID,
         chunks: list[ScriptChunk],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
     ) -> None:
         pass
 
+    @abstractmethod
+    async def find_blob(self, content_hash: str) -> ScriptBlob | None:
+        pass
+
+    @abstractmethod
+    async def acquire_blob(self, content_hash: str, storage_path: str, file_size: int) -> ScriptBlob:
+        pass
+
+    @abstractmethod
+    async def release_blobs(self, content_hashes: list[str]) -> list[ScriptBlob]:
+        pass
+
     @abstractmethod
     async def get_library_config(self, library_id: UUID) -> ScriptConfig | None:
         pass
@@ -80,6 +122,7 @@ class IScriptRepository(ABC):
         library_id: UUID,
         chunk_size: int,
         chunk_overlap: int,
+        auto_chunk_on_upload: bool = False,
     ) -> ScriptConfig:
         pass
 
@@ -93,6 +136,82 @@ class IScriptChunkStore(ABC):
     async def get_chunks(self, chunk_refs: list[ScriptChunk]) -> list[ScriptChunk]:
         pass
 
+    @abstractmethod
+    async def find_existing_chunk_ids(self, chunk_ids: list[UUID]) -> set[UUID]:
+        pass
+
+    @abstractmethod
+    async def get_chunk_embeddings(self, chunk_ids: list[UUID]) -> dict[UUID, list[float]]:
+        pass
+
+    @abstractmethod
+    async def search_chunks(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int,
+        script_id: UUID | None = None,
+        search_after: list[object] | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        pass
+
+    @abstractmethod
+    async def knn_search_chunks(
+        self,
+        library_id: UUID,
+        query_vector: list[float],
+        size: int,
+        script_id: UUID | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        pass
+
     @abstractmethod
     async def delete_chunks(self, chunk_ids: list[UUID]) -> None:
         pass
+
+    @abstractmethod
+    async def delete_script_chunks(self, script_id: UUID, library_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_library_chunks(self, library_id: UUID) -> None:
+        pass
+
+
+class IScriptChunkEmbedder(ABC):
+    @property
+    @abstractmethod
+    def dimensions(self) -> int:
+        pass
+
+    @abstractmethod
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        pass
+
+
+class IScriptChunkJobRepository(ABC):
+    @abstractmethod
+    async def save(self, job: ScriptChunkJob) -> ScriptChunkJob:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, job_id: UUID) -> ScriptChunkJob | None:
+        pass
+
+
+class IScriptChunkCache(ABC):
+    @abstractmethod
+    async def get_generation(self, script_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    async def get(self, script_id: UUID, generation: int) -> list[ScriptChunk] | None:
+        pass
+
+    @abstractmethod
+    async def set(self, script_id: UUID, generation: int, chunks: list[ScriptChunk]) -> bool:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, script_ids: list[UUID]) -> None:
+        pass
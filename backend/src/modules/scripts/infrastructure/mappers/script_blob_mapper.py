@@ -0,0 +1,15 @@
+from src.modules.scripts.domain.entities.script_blob_entity import ScriptBlob
+from src.modules.scripts.infrastructure.models.script_blob_model import ScriptBlobModel
+
+
+class ScriptBlobMapper:
+    @staticmethod
+    def to_entity(model: ScriptBlobModel) -> ScriptBlob:
+        return ScriptBlob(
+            content_hash=model.content_hash,
+            storage_path=model.storage_path,
+            file_size=model.file_size,
+            ref_count=model.ref_count,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
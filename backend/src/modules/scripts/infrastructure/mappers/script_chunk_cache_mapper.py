@@ -0,0 +1,32 @@
+import json
+from uuid import UUID
+
+from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+
+
+class ScriptChunkCacheMapper:
+    @staticmethod
+    def to_json(chunks: list[ScriptChunk]) -> str:
+        return json.dumps(
+            [
+                [chunk.id.hex, chunk.index_id, chunk.start_index, chunk.end_index, chunk.content]
+                for chunk in chunks
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def from_json(payload: str, script_id: UUID) -> list[ScriptChunk]:
+        return [
+            ScriptChunk(
+                id=UUID(hex=chunk_id),
+                script_id=script_id,
+                index_id=index_id,
+                content=content,
+                chunk_size=len(content),
+                start_index=start_index,
+                end_index=end_index,
+            )
+            for chunk_id, index_id, start_index, end_index, content in json.loads(payload)
+        ]
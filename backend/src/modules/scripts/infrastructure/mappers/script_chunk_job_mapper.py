@@ -0,0 +1,48 @@
+import json
+from datetime import datetime
+from uuid import UUID
+
+from src.modules.scripts.domain.entities.script_chunk_job_entity import (
+    ScriptChunkJob,
+    ScriptChunkJobStatus,
+)
+
+
+class ScriptChunkJobMapper:
+    @staticmethod
+    def to_json(entity: ScriptChunkJob) -> str:
+        return json.dumps(
+            {
+                "id": str(entity.id),
+                "library_id": str(entity.library_id),
+                "script_id": str(entity.script_id),
+                "status": entity.status.value,
+                "extracted_segments": entity.extracted_segments,
+                "total_chunks": entity.total_chunks,
+                "indexed_chunks": entity.indexed_chunks,
+                "error": entity.error,
+                "created_at": entity.created_at.isoformat(),
+                "updated_at": entity.updated_at.isoformat(),
+                "started_at": entity.started_at.isoformat() if entity.started_at else None,
+                "finished_at": entity.finished_at.isoformat() if entity.finished_at else None,
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def from_json(payload: str) -> ScriptChunkJob:
+        data = json.loads(payload)
+        return ScriptChunkJob(
+            id=UUID(data["id"]),
+            library_id=UUID(data["library_id"]),
+            script_id=UUID(data["script_id"]),
+            status=ScriptChunkJobStatus(data["status"]),
+            extracted_segments=int(data.get("extracted_segments", 0)),
+            total_chunks=int(data.get("total_chunks", 0)),
+            indexed_chunks=int(data.get("indexed_chunks", 0)),
+            error=data.get("error"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
+            finished_at=datetime.fromisoformat(data["finished_at"]) if data.get("finished_at") else None,
+        )
@@ -10,6 +10,7 @@ class ScriptChunkMapper:
             script_id=model.script_id,
             library_id=model.library_id,
             index_id=model.index_id,
+            fingerprint=model.fingerprint,
             created_at=model.created_at,
             updated_at=model.created_at,
         )
@@ -21,5 +22,17 @@ class ScriptChunkMapper:
             script_id=entity.script_id,
             library_id=entity.library_id,
             index_id=entity.index_id,
+            fingerprint=entity.fingerprint,
             created_at=entity.created_at,
         )
+
+    @staticmethod
+    def to_row(entity: ScriptChunk) -> dict[str, object]:
+        return {
+            "id": entity.id,
+            "script_id": entity.script_id,
+            "library_id": entity.library_id,
+            "index_id": entity.index_id,
+            "fingerprint": entity.fingerprint,
+            "created_at": entity.created_at,
+        }
@@ -11,4 +11,5 @@ class ScriptConfigMapper:
             chunk_overlap=model.chunk_overlap,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            auto_chunk_on_upload=model.auto_chunk_on_upload,
         )
@@ -13,6 +13,9 @@ class ScriptMapper:
             file_extension=model.file_extension,
             content_type=model.content_type,
             file_size=model.file_size,
+            content_hash=model.content_hash,
+            chunk_size=model.chunk_size,
+            chunk_overlap=model.chunk_overlap,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -26,6 +29,9 @@ class ScriptMapper:
             file_extension=entity.file_extension,
             content_type=entity.content_type,
             file_size=entity.file_size,
+            content_hash=entity.content_hash,
+            chunk_size=entity.chunk_size,
+            chunk_overlap=entity.chunk_overlap,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, UUID, text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, UUID, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -19,6 +19,12 @@ class ScriptConfigModel(Base):
     )
     chunk_size: Mapped[int] = mapped_column(Integer, nullable=False, default=500, server_default=text("500"))
     chunk_overlap: Mapped[int] = mapped_column(Integer, nullable=False, default=50, server_default=text("50"))
+    auto_chunk_on_upload: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=text("false"),
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -31,6 +37,7 @@ class ScriptConfigModel(Base):
             "<ScriptConfigModel("
             f"library_id={self.library_id}, "
             f"chunk_size={self.chunk_size}, "
-            f"chunk_overlap={self.chunk_overlap}"
+            f"chunk_overlap={self.chunk_overlap}, "
+            f"auto_chunk_on_upload={self.auto_chunk_on_upload}"
             ")>"
         )
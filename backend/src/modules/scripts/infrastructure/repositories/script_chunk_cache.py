@@ -0,0 +1,68 @@
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.domain.repositories import IScriptChunkCache
+from src.modules.scripts.infrastructure.mappers.script_chunk_cache_mapper import ScriptChunkCacheMapper
+from src.shared.infrastructure.redis import get_redis
+
+
+class ScriptChunkCache(IScriptChunkCache):
+    def __init__(self, ttl_seconds: int, max_bytes: int, redis: Redis | None = None):
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+
+    async def _get_redis(self) -> Redis:
+        if self._redis is None:
+            self._redis = await get_redis()
+        return self._redis
+
+    async def get_generation(self, script_id: UUID) -> int:
+        redis = await self._get_redis()
+        generation = await redis.get(self.build_generation_key(script_id))
+        return int(generation) if generation is not None else 0
+
+    async def get(self, script_id: UUID, generation: int) -> list[ScriptChunk] | None:
+        redis = await self._get_redis()
+        payload = await redis.get(self.build_chunks_key(script_id, generation))
+        if payload is None:
+            return None
+        return ScriptChunkCacheMapper.from_json(payload, script_id)
+
+    async def set(self, script_id: UUID, generation: int, chunks: list[ScriptChunk]) -> bool:
+        payload = ScriptChunkCacheMapper.to_json(chunks)
+        if len(payload.encode("utf-8")) > self._max_bytes:
+            return False
+        redis = await self._get_redis()
+        async with redis.pipeline(transaction=False) as pipeline:
+            pipeline.setex(self.build_chunks_key(script_id, generation), self._ttl_seconds, payload)
+            # The counter must outlive every entry written under it, otherwise it would
+            # restart at zero while a stale zero-generation entry is still readable.
+            pipeline.expire(self.build_generation_key(script_id), self._generation_ttl_seconds)
+            await pipeline.execute()
+        return True
+
+    async def invalidate(self, script_ids: list[UUID]) -> None:
+        if not script_ids:
+            return
+        redis = await self._get_redis()
+        async with redis.pipeline(transaction=False) as pipeline:
+            for script_id in script_ids:
+                generation_key = self.build_generation_key(script_id)
+                pipeline.incr(generation_key)
+                pipeline.expire(generation_key, self._generation_ttl_seconds)
+            await pipeline.execute()
+
+    @property
+    def _generation_ttl_seconds(self) -> int:
+        return self._ttl_seconds * 2
+
+    @staticmethod
+    def build_generation_key(script_id: UUID) -> str:
+        return f"scripts:chunk_cache:{script_id}:generation"
+
+    @staticmethod
+    def build_chunks_key(script_id: UUID, generation: int) -> str:
+        return f"scripts:chunk_cache:{script_id}:{generation}"
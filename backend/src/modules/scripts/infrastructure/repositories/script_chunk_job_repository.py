@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from src.modules.scripts.domain.entities.script_chunk_job_entity import ScriptChunkJob
+from src.modules.scripts.domain.repositories import IScriptChunkJobRepository
+from src.modules.scripts.infrastructure.mappers.script_chunk_job_mapper import ScriptChunkJobMapper
+from src.shared.infrastructure.redis import RedisRepository
+
+
+class ScriptChunkJobRepository(IScriptChunkJobRepository):
+    def __init__(self, redis_repository: RedisRepository, ttl_seconds: int):
+        self._redis = redis_repository
+        self._ttl_seconds = ttl_seconds
+
+    async def save(self, job: ScriptChunkJob) -> ScriptChunkJob:
+        await self._redis.set(
+            self.build_redis_key(job.id),
+            ScriptChunkJobMapper.to_json(job),
+            self._ttl_seconds,
+        )
+        return job
+
+    async def find_by_id(self, job_id: UUID) -> ScriptChunkJob | None:
+        payload = await self._redis.get(self.build_redis_key(job_id))
+        if payload is None:
+            return None
+        return ScriptChunkJobMapper.from_json(payload)
+
+    @staticmethod
+    def build_redis_key(job_id: UUID) -> str:
+        return f"scripts:chunk_job:{job_id}"
@@ -1,18 +1,23 @@
+from collections import Counter
 from uuid import UUID
 
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import case, delete, desc, func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.modules.scripts.domain.entities.script_blob_entity import ScriptBlob
 from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
 from src.modules.scripts.domain.entities.script_config_entity import ScriptConfig
 from src.modules.scripts.domain.entities.script_entity import Script
 from src.modules.scripts.domain.entities.script_library_entity import ScriptLibrary
+from src.modules.scripts.domain.entities.script_library_stats_entity import ScriptLibraryStats
 from src.modules.scripts.infrastructure.mappers.script_config_mapper import ScriptConfigMapper
 from src.modules.scripts.domain.repositories import IScriptRepository
+from src.modules.scripts.infrastructure.mappers.script_blob_mapper import ScriptBlobMapper
 from src.modules.scripts.infrastructure.mappers.script_chunk_mapper import ScriptChunkMapper
 from src.modules.scripts.infrastructure.mappers.script_library_mapper import ScriptLibraryMapper
 from src.modules.scripts.infrastructure.mappers.script_mapper import ScriptMapper
+from src.modules.scripts.infrastructure.models.script_blob_model import ScriptBlobModel
 from src.modules.scripts.infrastructure.models.script_chunk_model import ScriptChunkModel
 from src.modules.scripts.infrastructure.models.script_config_model import ScriptConfigModel
 from src.modules.scripts.infrastructure.models.script_library_model import ScriptLibraryModel
@@ -20,6 +25,17 @@ from src.modules.scripts.infrastructure.models.script_library_script_model impor
 from src.modules.scripts.infrastructure.models.script_model import ScriptModel
 
 
+BLOB_COLUMNS = (
+    ScriptBlobModel.content_hash,
+    ScriptBlobModel.storage_path,
+    ScriptBlobModel.file_size,
+    ScriptBlobModel.ref_count,
+    ScriptBlobModel.created_at,
+    ScriptBlobModel.updated_at,
+)
+CHUNK_INSERT_BATCH_SIZE = 1000
+
+
 class ScriptRepository(IScriptRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -110,6 +126,33 @@ class ScriptRepository(IScriptRepository):
         await self._session.commit()
         return True
 
+    async def get_library_stats(self, library_id: UUID) -> ScriptLibraryStats:
+        chunk_count = (
+            select(func.count(ScriptChunkModel.id))
+            .where(ScriptChunkModel.library_id == library_id)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                func.count(ScriptModel.id),
+                func.coalesce(func.sum(ScriptModel.file_size), 0),
+                func.max(ScriptModel.updated_at),
+                chunk_count,
+            )
+            .select_from(ScriptLibraryScriptModel)
+            .join(ScriptModel, ScriptModel.id == ScriptLibraryScriptModel.script_id)
+            .where(ScriptLibraryScriptModel.library_id == library_id)
+        )
+        result = await self._session.execute(stmt)
+        script_count, total_file_size, last_script_updated_at, total_chunks = result.one()
+        return ScriptLibraryStats(
+            library_id=library_id,
+            script_count=int(script_count or 0),
+            total_file_size=int(total_file_size or 0),
+            chunk_count=int(total_chunks or 0),
+            last_script_updated_at=last_script_updated_at,
+        )
+
     async def save_to_library(self, script: Script, library_id: UUID) -> Script:
         script_model = ScriptMapper.to_model(script)
         self._session.add(script_model)
@@ -142,6 +185,37 @@ class ScriptRepository(IScriptRepository):
         rows = result.all()
         return [ScriptMapper.to_entity(script_model, mapping_library_id) for script_model, mapping_library_id in rows]
 
+    async def list_all_with_chunk_counts(self, library_id: UUID) -> list[tuple[Script, int]]:
+        chunk_counts = (
+            select(
+                ScriptChunkModel.script_id.label("script_id"),
+                func.count(ScriptChunkModel.id).label("chunk_count"),
+            )
+            .where(ScriptChunkModel.library_id == library_id)
+            .group_by(ScriptChunkModel.script_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                ScriptModel,
+                ScriptLibraryScriptModel.library_id,
+                func.coalesce(chunk_counts.c.chunk_count, 0),
+            )
+            .join(
+                ScriptLibraryScriptModel,
+                ScriptLibraryScriptModel.script_id == ScriptModel.id,
+            )
+            .outerjoin(chunk_counts, chunk_counts.c.script_id == ScriptModel.id)
+            .where(ScriptLibraryScriptModel.library_id == library_id)
+            .order_by(desc(ScriptModel.created_at))
+        )
+
+        result = await self._session.execute(stmt)
+        return [
+            (ScriptMapper.to_entity(script_model, mapping_library_id), int(chunk_count))
+            for script_model, mapping_library_id, chunk_count in result.all()
+        ]
+
     async def find_by_id(self, script_id: UUID) -> Script | None:
         result = await self._session.execute(
             select(ScriptModel, ScriptLibraryScriptModel.library_id)
@@ -158,6 +232,38 @@ class ScriptRepository(IScriptRepository):
         script_model, mapping_library_id = row
         return ScriptMapper.to_entity(script_model, mapping_library_id)
 
+    async def find_chunked_script_by_content_hash(
+        self,
+        content_hash: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        exclude_script_id: UUID | None = None,
+    ) -> Script | None:
+        stmt = (
+            select(ScriptModel, ScriptLibraryScriptModel.library_id)
+            .join(
+                ScriptLibraryScriptModel,
+                ScriptLibraryScriptModel.script_id == ScriptModel.id,
+            )
+            .where(
+                ScriptModel.content_hash == content_hash,
+                ScriptModel.chunk_size == chunk_size,
+                ScriptModel.chunk_overlap == chunk_overlap,
+            )
+            .order_by(desc(ScriptModel.updated_at))
+            .limit(1)
+        )
+        if exclude_script_id is not None:
+            stmt = stmt.where(ScriptModel.id != exclude_script_id)
+
+        result = await self._session.execute(stmt)
+        row = result.first()
+        if not row:
+            return None
+
+        script_model, mapping_library_id = row
+        return ScriptMapper.to_entity(script_model, mapping_library_id)
+
     async def delete(self, script_id: UUID) -> bool:
         script_result = await self._session.execute(
             select(ScriptModel).where(ScriptModel.id == script_id)
@@ -177,8 +283,14 @@ class ScriptRepository(IScriptRepository):
         await self._session.commit()
         return True
 
-    async def list_chunks(self, script_id: UUID, library_id: UUID) -> list[ScriptChunk]:
-        result = await self._session.execute(
+    async def list_chunks(
+        self,
+        script_id: UUID,
+        library_id: UUID,
+        after_index: int | None = None,
+        limit: int | None = None,
+    ) -> list[ScriptChunk]:
+        stmt = (
             select(ScriptChunkModel)
             .where(
                 ScriptChunkModel.script_id == script_id,
@@ -186,6 +298,11 @@ class ScriptRepository(IScriptRepository):
             )
             .order_by(ScriptChunkModel.index_id.asc())
         )
+        if after_index is not None:
+            stmt = stmt.where(ScriptChunkModel.index_id > after_index)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [ScriptChunkMapper.to_entity(model) for model in models]
 
@@ -194,6 +311,8 @@ class ScriptRepository(IScriptRepository):
         script_id: UUID,
         library_id: UUID,
         chunks: list[ScriptChunk],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
     ) -> None:
         await self._session.execute(
             delete(ScriptChunkModel).where(
@@ -201,11 +320,74 @@ class ScriptRepository(IScriptRepository):
                 ScriptChunkModel.library_id == library_id,
             )
         )
+        await self._session.execute(
+            update(ScriptModel)
+            .where(ScriptModel.id == script_id)
+            .values(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        )
+
+        for start in range(0, len(chunks), CHUNK_INSERT_BATCH_SIZE):
+            await self._session.execute(
+                insert(ScriptChunkModel),
+                [ScriptChunkMapper.to_row(chunk) for chunk in chunks[start:start + CHUNK_INSERT_BATCH_SIZE]],
+            )
+
+        await self._session.commit()
+
+    async def find_blob(self, content_hash: str) -> ScriptBlob | None:
+        result = await self._session.execute(
+            select(ScriptBlobModel).where(ScriptBlobModel.content_hash == content_hash)
+        )
+        model = result.scalar_one_or_none()
+        return ScriptBlobMapper.to_entity(model) if model else None
+
+    async def acquire_blob(self, content_hash: str, storage_path: str, file_size: int) -> ScriptBlob:
+        stmt = (
+            insert(ScriptBlobModel)
+            .values(
+                content_hash=content_hash,
+                storage_path=storage_path,
+                file_size=file_size,
+                ref_count=1,
+            )
+            .on_conflict_do_update(
+                index_elements=[ScriptBlobModel.content_hash],
+                set_={
+                    "ref_count": ScriptBlobModel.ref_count + 1,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(*BLOB_COLUMNS)
+        )
+        result = await self._session.execute(stmt)
+        row = result.one()
+        await self._session.commit()
+        return ScriptBlob(**row._asdict())
 
-        for chunk in chunks:
-            self._session.add(ScriptChunkMapper.to_model(chunk))
+    async def release_blobs(self, content_hashes: list[str]) -> list[ScriptBlob]:
+        release_counts = Counter(content_hash for content_hash in content_hashes if content_hash)
+        if not release_counts:
+            return []
 
+        await self._session.execute(
+            update(ScriptBlobModel)
+            .where(ScriptBlobModel.content_hash.in_(list(release_counts)))
+            .values(
+                ref_count=ScriptBlobModel.ref_count - case(release_counts, value=ScriptBlobModel.content_hash),
+                updated_at=func.now(),
+            )
+        )
+        result = await self._session.execute(
+            delete(ScriptBlobModel)
+            .where(
+                ScriptBlobModel.content_hash.in_(list(release_counts)),
+                ScriptBlobModel.ref_count <= 0,
+            )
+            .returning(*BLOB_COLUMNS)
+        )
+        released = [ScriptBlob(**row._asdict()) for row in result.all()]
         await self._session.commit()
+        return released
 
     async def get_library_config(self, library_id: UUID) -> ScriptConfig | None:
         result = await self._session.execute(
@@ -219,6 +401,7 @@ class ScriptRepository(IScriptRepository):
         library_id: UUID,
         chunk_size: int,
         chunk_overlap: int,
+        auto_chunk_on_upload: bool = False,
     ) -> ScriptConfig:
         stmt = (
             insert(ScriptConfigModel)
@@ -226,12 +409,14 @@ class ScriptRepository(IScriptRepository):
                 library_id=library_id,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
+                auto_chunk_on_upload=auto_chunk_on_upload,
             )
             .on_conflict_do_update(
                 index_elements=[ScriptConfigModel.library_id],
                 set_={
                     "chunk_size": chunk_size,
                     "chunk_overlap": chunk_overlap,
+                    "auto_chunk_on_upload": auto_chunk_on_upload,
                     "updated_at": func.now(),
                 },
             )
@@ -5,9 +5,15 @@ from src.modules.scripts.infrastructure.services.elasticsearch_chunk_store impor
 from src.modules.scripts.infrastructure.services.script_chunker import (
     ScriptSentenceWindowTextSplitter,
 )
+from src.modules.scripts.infrastructure.services.script_upload_stream import (
+    ScriptUploadStream,
+    TextLengthCounter,
+)
 
 __all__ = [
     "ElasticsearchChunkStore",
     "FileTextExtractor",
     "ScriptSentenceWindowTextSplitter",
+    "ScriptUploadStream",
+    "TextLengthCounter",
 ]
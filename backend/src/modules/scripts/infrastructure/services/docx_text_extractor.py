@@ -0,0 +1,63 @@
+from collections.abc import Iterator
+from typing import BinaryIO
+from xml.etree import ElementTree
+from zipfile import ZipFile
+
+DOCX_DOCUMENT_PART = "word/document.xml"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCUMENT = f"{_W}document"
+_BODY = f"{_W}body"
+_PARAGRAPH = f"{_W}p"
+_HYPERLINK = f"{_W}hyperlink"
+_RUN = f"{_W}r"
+_TEXT = f"{_W}t"
+_BREAK = f"{_W}br"
+_BREAK_TYPE = f"{_W}type"
+_RUN_CONTENT_TEXT = {
+    _TEXT: None,
+    _BREAK: None,
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+    f"{_W}ptab": "\t",
+    f"{_W}tab": "\t",
+}
+# Same scope as python-docx `Document.paragraphs`/`Paragraph.text`: body-level paragraphs, and runs
+# that sit directly in the paragraph or in one of its hyperlinks.
+_RUN_PATHS = {
+    (_DOCUMENT, _BODY, _PARAGRAPH, _RUN),
+    (_DOCUMENT, _BODY, _PARAGRAPH, _HYPERLINK, _RUN),
+}
+
+
+def iter_docx_paragraphs(source: str | BinaryIO) -> Iterator[str]:
+    # Only word/document.xml is opened; media and other parts are never read or decompressed.
+    with ZipFile(source) as archive, archive.open(DOCX_DOCUMENT_PART) as document_part:
+        path: list[str] = []
+        body = None
+        parts: list[str] = []
+        for event, element in ElementTree.iterparse(document_part, events=("start", "end")):
+            if event == "start":
+                path.append(element.tag)
+                if len(path) == 2 and element.tag == _BODY:
+                    body = element
+                continue
+
+            path.pop()
+            tag = element.tag
+            if tag in _RUN_CONTENT_TEXT and tuple(path) in _RUN_PATHS:
+                parts.append(_run_content_text(element))
+            elif len(path) == 2 and body is not None:
+                if tag == _PARAGRAPH:
+                    yield "".join(parts)
+                parts.clear()
+                # Finished body children are dropped so memory stays bounded by one paragraph/table.
+                body.clear()
+
+
+def _run_content_text(element: ElementTree.Element) -> str:
+    if element.tag == _TEXT:
+        return element.text or ""
+    if element.tag == _BREAK:
+        return "\n" if element.get(_BREAK_TYPE, "textWrapping") == "textWrapping" else ""
+    return _RUN_CONTENT_TEXT[element.tag]
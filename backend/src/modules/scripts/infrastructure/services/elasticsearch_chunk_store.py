@@ -1,27 +1,47 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import uuid
+from collections.abc import Iterator
 from datetime import datetime
-from urllib import error as urllib_error
 from urllib import parse as urllib_parse
-from urllib import request as urllib_request
+
+import httpx
 
 from config.settings import settings
 from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.domain.entities.script_chunk_search_entity import (
+    ScriptChunkHighlight,
+    ScriptChunkSearchHit,
+)
+from src.modules.scripts.domain.exceptions import ChunkDocumentDeleteError
 from src.modules.scripts.domain.repositories import IScriptChunkStore
+from src.shared.infrastructure.elasticsearch import ElasticsearchClient
 
 logger = logging.getLogger(__name__)
 
+HIGHLIGHT_PRE_TAG = "<em>"
+HIGHLIGHT_POST_TAG = "</em>"
+SEARCH_HIT_SOURCE_FIELDS = ["script_id", "library_id", "index_id", "start_index", "end_index", "content"]
+KNN_CANDIDATE_MULTIPLIER = 10
+KNN_MIN_CANDIDATES = 100
+
 
 class ElasticsearchChunkStore(IScriptChunkStore):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        embedding_dimensions: int | None = None,
+    ) -> None:
         elasticsearch_settings = settings.elasticsearch
+        self._client = client or ElasticsearchClient.get_instance()
+        self._embedding_dimensions = embedding_dimensions or settings.scripts_embedding_dimensions
         self._base_url = elasticsearch_settings.url.rstrip("/")
         self._index_name = elasticsearch_settings.script_chunk_index
-        self._timeout_seconds = elasticsearch_settings.request_timeout_seconds
+        self._bulk_timeout_seconds = elasticsearch_settings.bulk_request_timeout_seconds
+        self._bulk_batch_size = max(1, elasticsearch_settings.bulk_batch_size)
+        self._bulk_max_bytes = max(1, elasticsearch_settings.bulk_max_bytes)
         self._index_ready = False
 
     async def index_chunks(self, chunks: list[ScriptChunk]) -> None:
@@ -29,19 +49,19 @@ class ElasticsearchChunkStore(IScriptChunkStore):
             return
 
         await self._ensure_index()
-        failures: list[str] = []
+        actions: list[tuple[str, bytes]] = []
         for chunk in chunks:
-            try:
-                await asyncio.to_thread(self._index_chunk, chunk)
-            except Exception as exc:
-                logger.error(
-                    "Failed to index chunk in Elasticsearch: chunk_id=%s script_id=%s library_id=%s error=%s",
-                    chunk.id,
-                    chunk.script_id,
-                    chunk.library_id,
-                    exc,
+            chunk_id = str(chunk.id)
+            actions.append(
+                (
+                    chunk_id,
+                    self._encode_bulk_action({"index": {"_id": chunk_id}}, self._chunk_to_document(chunk)),
                 )
-                failures.append(str(chunk.id))
+            )
+
+        failures: list[str] = []
+        for batch in self._iter_bulk_batches(actions):
+            failures.extend(await self._bulk_request("index", batch))
 
         if failures:
             preview = ", ".join(failures[:5])
@@ -57,10 +77,9 @@ class ElasticsearchChunkStore(IScriptChunkStore):
         await self._ensure_index()
         document_ids = [str(chunk.id) for chunk in sorted(chunk_refs, key=lambda item: item.index_id)]
         payload = {"ids": document_ids}
-        response = await asyncio.to_thread(
-            self._request_json,
+        response = await self._request_json(
             "POST",
-            self._build_path("_mget"),
+            self._build_path("_mget") + "?_source_excludes=embedding",
             payload,
             (200,),
         )
@@ -94,36 +113,150 @@ class ElasticsearchChunkStore(IScriptChunkStore):
 
         return hydrated_chunks
 
+    async def find_existing_chunk_ids(self, chunk_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        if not chunk_ids:
+            return set()
+
+        await self._ensure_index()
+        response = await self._request_json(
+            "POST",
+            self._build_path("_mget") + "?_source=false",
+            {"ids": [str(chunk_id) for chunk_id in dict.fromkeys(chunk_ids)]},
+            (200,),
+        )
+        return {
+            uuid.UUID(document["_id"])
+            for document in response.get("docs", [])
+            if document.get("found") and document.get("_id")
+        }
+
+    async def get_chunk_embeddings(self, chunk_ids: list[uuid.UUID]) -> dict[uuid.UUID, list[float]]:
+        if not chunk_ids:
+            return {}
+
+        await self._ensure_index()
+        response = await self._request_json(
+            "POST",
+            self._build_path("_mget") + "?_source_includes=embedding",
+            {"ids": [str(chunk_id) for chunk_id in dict.fromkeys(chunk_ids)]},
+            (200,),
+        )
+        embeddings: dict[uuid.UUID, list[float]] = {}
+        for document in response.get("docs", []):
+            embedding = (document.get("_source") or {}).get("embedding") if document.get("found") else None
+            if embedding and len(embedding) == self._embedding_dimensions:
+                embeddings[uuid.UUID(document["_id"])] = [float(value) for value in embedding]
+        return embeddings
+
+    async def search_chunks(
+        self,
+        library_id: uuid.UUID,
+        query: str,
+        size: int,
+        script_id: uuid.UUID | None = None,
+        search_after: list[object] | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        await self._ensure_index()
+        filters: list[dict[str, object]] = [{"term": {"library_id": str(library_id)}}]
+        if script_id is not None:
+            filters.append({"term": {"script_id": str(script_id)}})
+        payload: dict[str, object] = {
+            "size": size,
+            "track_total_hits": False,
+            "_source": SEARCH_HIT_SOURCE_FIELDS,
+            "query": {
+                "bool": {
+                    "must": [{"match": {"content": {"query": query}}}],
+                    "filter": filters,
+                }
+            },
+            "highlight": {
+                "pre_tags": [HIGHLIGHT_PRE_TAG],
+                "post_tags": [HIGHLIGHT_POST_TAG],
+                "fields": {"content": {"fragment_size": 150, "number_of_fragments": 3}},
+            },
+            # script_id + index_id is unique per document, so it is a stable search_after tiebreaker.
+            "sort": [{"_score": "desc"}, {"script_id": "asc"}, {"index_id": "asc"}],
+        }
+        if search_after:
+            payload["search_after"] = search_after
+
+        response = await self._request_json("POST", self._build_path("_search"), payload, (200,))
+        hits = (response.get("hits") or {}).get("hits") or []
+        return [self._document_to_search_hit(hit) for hit in hits]
+
+    async def knn_search_chunks(
+        self,
+        library_id: uuid.UUID,
+        query_vector: list[float],
+        size: int,
+        script_id: uuid.UUID | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        await self._ensure_index()
+        filters: list[dict[str, object]] = [{"term": {"library_id": str(library_id)}}]
+        if script_id is not None:
+            filters.append({"term": {"script_id": str(script_id)}})
+        payload: dict[str, object] = {
+            "size": size,
+            "track_total_hits": False,
+            "_source": SEARCH_HIT_SOURCE_FIELDS,
+            # Filters inside the knn clause are applied during the HNSW graph search,
+            # so each library still gets a full top-k instead of a post-filtered remainder.
+            "knn": {
+                "field": "embedding",
+                "query_vector": query_vector,
+                "k": size,
+                "num_candidates": max(size * KNN_CANDIDATE_MULTIPLIER, KNN_MIN_CANDIDATES),
+                "filter": filters,
+            },
+        }
+        response = await self._request_json("POST", self._build_path("_search"), payload, (200,))
+        hits = (response.get("hits") or {}).get("hits") or []
+        return [self._document_to_search_hit(hit) for hit in hits]
+
     async def delete_chunks(self, chunk_ids: list[uuid.UUID]) -> None:
         if not chunk_ids:
             return
 
         await self._ensure_index()
+        actions = [
+            (str(chunk_id), self._encode_bulk_action({"delete": {"_id": str(chunk_id)}}))
+            for chunk_id in dict.fromkeys(chunk_ids)
+        ]
         failures: list[str] = []
-        for chunk_id in chunk_ids:
-            try:
-                await asyncio.to_thread(self._delete_chunk, chunk_id)
-            except Exception as exc:
-                logger.warning(
-                    "Failed to delete Elasticsearch chunk document: chunk_id=%s error=%s",
-                    chunk_id,
-                    exc,
-                )
-                failures.append(str(chunk_id))
+        for batch in self._iter_bulk_batches(actions):
+            failures.extend(await self._bulk_request("delete", batch))
 
         if failures:
             preview = ", ".join(failures[:5])
             suffix = "..." if len(failures) > 5 else ""
-            raise RuntimeError(
-                f"Failed to delete {len(failures)} chunk document(s) from Elasticsearch: {preview}{suffix}"
+            raise ChunkDocumentDeleteError(
+                failed_chunk_ids=failures,
+                detail=(
+                    f"Failed to delete {len(failures)} chunk document(s) from Elasticsearch: {preview}{suffix}"
+                ),
             )
 
+    async def delete_script_chunks(self, script_id: uuid.UUID, library_id: uuid.UUID) -> None:
+        await self._ensure_index()
+        await self._delete_by_query(
+            [
+                {"term": {"script_id": str(script_id)}},
+                {"term": {"library_id": str(library_id)}},
+            ],
+        )
+
+    async def delete_library_chunks(self, library_id: uuid.UUID) -> None:
+        await self._ensure_index()
+        await self._delete_by_query(
+            [{"term": {"library_id": str(library_id)}}],
+        )
+
     async def _ensure_index(self) -> None:
         if self._index_ready:
             return
 
-        status, _ = await asyncio.to_thread(
-            self._request_raw,
+        status, _ = await self._request_raw(
             "GET",
             self._build_path(),
             None,
@@ -131,8 +264,7 @@ class ElasticsearchChunkStore(IScriptChunkStore):
         )
         if status == 404:
             try:
-                await asyncio.to_thread(
-                    self._request_json,
+                await self._request_json(
                     "PUT",
                     self._build_path(),
                     self._index_template(),
@@ -141,24 +273,104 @@ class ElasticsearchChunkStore(IScriptChunkStore):
             except RuntimeError as exc:
                 if "resource_already_exists_exception" not in str(exc):
                     raise
+        else:
+            await self._ensure_embedding_mapping()
 
         self._index_ready = True
 
-    def _index_chunk(self, chunk: ScriptChunk) -> None:
-        self._request_json(
-            "PUT",
-            self._build_path("_doc", str(chunk.id)),
-            self._chunk_to_document(chunk),
-            (200, 201),
-        )
+    async def _ensure_embedding_mapping(self) -> None:
+        # Indices created before vectors were introduced only gain the field; existing
+        # documents are embedded the next time their script is chunked.
+        try:
+            await self._request_json(
+                "PUT",
+                self._build_path("_mapping"),
+                {"properties": {"embedding": self._embedding_mapping()}},
+                (200,),
+            )
+        except RuntimeError as exc:
+            logger.warning("Failed to add embedding mapping to chunk index: %s", exc)
 
-    def _delete_chunk(self, chunk_id: uuid.UUID) -> None:
-        self._request_raw(
-            "DELETE",
-            self._build_path("_doc", str(chunk_id)),
-            None,
-            (200, 202, 404),
+    def _iter_bulk_batches(self, actions: list[tuple[str, bytes]]) -> Iterator[list[tuple[str, bytes]]]:
+        batch: list[tuple[str, bytes]] = []
+        batch_bytes = 0
+        for action in actions:
+            action_bytes = len(action[1])
+            if batch and (
+                len(batch) >= self._bulk_batch_size
+                or batch_bytes + action_bytes > self._bulk_max_bytes
+            ):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            batch.append(action)
+            batch_bytes += action_bytes
+
+        if batch:
+            yield batch
+
+    async def _bulk_request(self, operation: str, batch: list[tuple[str, bytes]]) -> list[str]:
+        document_ids = [document_id for document_id, _ in batch]
+        try:
+            _, body = await self._request_raw(
+                "POST",
+                self._build_path("_bulk"),
+                b"".join(payload for _, payload in batch),
+                (200,),
+                timeout=self._bulk_timeout_seconds,
+            )
+        except Exception as exc:
+            logger.error(
+                "Elasticsearch bulk request failed: operation=%s documents=%s error=%s",
+                operation,
+                len(document_ids),
+                exc,
+            )
+            return document_ids
+
+        response = json.loads(body) if body else {}
+        succeeded: set[str] = set()
+        failures: list[str] = []
+        for item in response.get("items", []):
+            result = item.get(operation) or {}
+            document_id = str(result.get("_id", ""))
+            status = int(result.get("status", 500))
+            if result.get("error") is None and (200 <= status < 300 or status == 404):
+                succeeded.add(document_id)
+                continue
+            logger.error(
+                "Elasticsearch bulk item failed: operation=%s chunk_id=%s status=%s error=%s",
+                operation,
+                document_id,
+                status,
+                result.get("error"),
+            )
+
+        for document_id in document_ids:
+            if document_id not in succeeded:
+                failures.append(document_id)
+        return failures
+
+    @staticmethod
+    def _encode_bulk_action(action: dict[str, object], source: dict[str, object] | None = None) -> bytes:
+        lines = [json.dumps(action, ensure_ascii=False)]
+        if source is not None:
+            lines.append(json.dumps(source, ensure_ascii=False))
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    async def _delete_by_query(self, filters: list[dict[str, object]]) -> None:
+        response = await self._request_json(
+            "POST",
+            self._build_path("_delete_by_query") + "?conflicts=proceed&refresh=true",
+            {"query": {"bool": {"filter": filters}}},
+            (200,),
+            timeout=self._bulk_timeout_seconds,
         )
+        failures = response.get("failures") or []
+        if failures:
+            raise RuntimeError(
+                f"Elasticsearch delete_by_query reported {len(failures)} failure(s): {failures[:3]}"
+            )
 
     def _build_path(self, *parts: str) -> str:
         encoded_parts = [urllib_parse.quote(self._index_name, safe="")]
@@ -166,7 +378,7 @@ class ElasticsearchChunkStore(IScriptChunkStore):
         return "/" + "/".join(encoded_parts)
 
     def _chunk_to_document(self, chunk: ScriptChunk) -> dict[str, object]:
-        return {
+        document: dict[str, object] = {
             "script_id": str(chunk.script_id) if chunk.script_id else None,
             "library_id": str(chunk.library_id) if chunk.library_id else None,
             "index_id": chunk.index_id,
@@ -176,6 +388,9 @@ class ElasticsearchChunkStore(IScriptChunkStore):
             "end_index": chunk.end_index,
             "created_at": chunk.created_at.isoformat() if chunk.created_at else None,
         }
+        if chunk.embedding is not None:
+            document["embedding"] = chunk.embedding
+        return document
 
     @staticmethod
     def _document_to_chunk(document_id: str, source: dict[str, object]) -> ScriptChunk:
@@ -195,6 +410,41 @@ class ElasticsearchChunkStore(IScriptChunkStore):
             updated_at=ElasticsearchChunkStore._parse_datetime(source.get("created_at")),
         )
 
+    @staticmethod
+    def _document_to_search_hit(hit: dict[str, object]) -> ScriptChunkSearchHit:
+        source = hit.get("_source") or {}
+        content = str(source.get("content", ""))
+        start_index = int(source.get("start_index", 0))
+        end_index = int(source.get("end_index", start_index + len(content)))
+        fragments = (hit.get("highlight") or {}).get("content") or []
+        return ScriptChunkSearchHit(
+            chunk_id=uuid.UUID(str(hit["_id"])),
+            script_id=uuid.UUID(str(source["script_id"])),
+            library_id=uuid.UUID(str(source["library_id"])),
+            chunk_index=int(source.get("index_id", 0)),
+            start_index=start_index,
+            end_index=end_index,
+            score=float(hit.get("_score") or 0.0),
+            content=content,
+            highlights=[
+                ElasticsearchChunkStore._locate_highlight(str(fragment), content, start_index, end_index)
+                for fragment in fragments
+            ],
+            sort_values=list(hit.get("sort") or []),
+        )
+
+    @staticmethod
+    def _locate_highlight(fragment: str, content: str, start_index: int, end_index: int) -> ScriptChunkHighlight:
+        plain_fragment = fragment.replace(HIGHLIGHT_PRE_TAG, "").replace(HIGHLIGHT_POST_TAG, "")
+        position = content.find(plain_fragment) if plain_fragment else -1
+        if position < 0:
+            return ScriptChunkHighlight(text=fragment, start_index=start_index, end_index=end_index)
+        return ScriptChunkHighlight(
+            text=fragment,
+            start_index=start_index + position,
+            end_index=start_index + position + len(plain_fragment),
+        )
+
     @staticmethod
     def _parse_datetime(value: object) -> datetime:
         if isinstance(value, str) and value:
@@ -217,52 +467,68 @@ class ElasticsearchChunkStore(IScriptChunkStore):
                     "start_index": {"type": "integer"},
                     "end_index": {"type": "integer"},
                     "created_at": {"type": "date"},
+                    "embedding": self._embedding_mapping(),
                 }
             }
         }
 
-    def _request_json(
+    def _embedding_mapping(self) -> dict[str, object]:
+        return {
+            "type": "dense_vector",
+            "dims": self._embedding_dimensions,
+            "index": True,
+            "similarity": "cosine",
+            "index_options": {"type": "hnsw", "m": 16, "ef_construction": 100},
+        }
+
+    async def _request_json(
         self,
         method: str,
         path: str,
         payload: dict[str, object] | None,
         expected_statuses: tuple[int, ...],
+        timeout: float | None = None,
     ) -> dict[str, object]:
-        _, body = self._request_raw(method, path, payload, expected_statuses)
+        _, body = await self._request_raw(method, path, payload, expected_statuses, timeout=timeout)
         if not body:
             return {}
         return json.loads(body)
 
-    def _request_raw(
+    async def _request_raw(
         self,
         method: str,
         path: str,
-        payload: dict[str, object] | None,
+        payload: dict[str, object] | bytes | None,
         expected_statuses: tuple[int, ...],
+        timeout: float | None = None,
     ) -> tuple[int, str]:
         url = f"{self._base_url}{path}"
-        data = json.dumps(payload).encode("utf-8") if payload is not None else None
         headers = {"Accept": "application/json"}
-        if payload is not None:
+        if isinstance(payload, bytes):
+            data = payload
+            headers["Content-Type"] = "application/x-ndjson"
+        elif payload is not None:
+            data = json.dumps(payload).encode("utf-8")
             headers["Content-Type"] = "application/json"
+        else:
+            data = None
 
-        request = urllib_request.Request(url, data=data, headers=headers, method=method)
         try:
-            with urllib_request.urlopen(request, timeout=self._timeout_seconds) as response:
-                body = response.read().decode("utf-8")
-                if response.status not in expected_statuses:
-                    raise RuntimeError(
-                        f"Unexpected Elasticsearch response: method={method} url={url} status={response.status}"
-                    )
-                return response.status, body
-        except urllib_error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="ignore")
-            if exc.code in expected_statuses:
-                return exc.code, body
-            raise RuntimeError(
-                f"Elasticsearch request failed: method={method} url={url} status={exc.code} body={body}"
-            ) from exc
-        except urllib_error.URLError as exc:
+            response = await self._client.request(
+                method,
+                url,
+                content=data,
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.HTTPError as exc:
             raise RuntimeError(
                 f"Failed to reach Elasticsearch: method={method} url={url} error={exc}"
             ) from exc
+
+        body = response.text
+        if response.status_code not in expected_statuses:
+            raise RuntimeError(
+                f"Elasticsearch request failed: method={method} url={url} status={response.status_code} body={body}"
+            )
+        return response.status_code, body
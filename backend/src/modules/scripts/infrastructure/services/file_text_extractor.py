@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import codecs
-import os
-import tempfile
 from collections.abc import Iterator
-from contextlib import contextmanager
 from io import BytesIO
 from typing import BinaryIO
 
 from src.modules.scripts.domain.exceptions import TextExtractError
+from src.modules.scripts.infrastructure.services.docx_text_extractor import iter_docx_paragraphs
+from src.modules.scripts.infrastructure.services.pdf_text_extractor import PdfTextExtractor
+from src.modules.scripts.infrastructure.services.seekable_source import open_seekable_source
 
 
 class FileTextExtractor:
+    # Bump whenever extraction output changes so stored extracted-text sidecars are rebuilt.
+    EXTRACTION_VERSION = 1
+
+    def __init__(self, pdf_text_extractor: PdfTextExtractor | None = None):
+        self._pdf_text_extractor = pdf_text_extractor or PdfTextExtractor()
+
     def extract(self, file_bytes: bytes, file_extension: str) -> str:
         return self.extract_from_stream(BytesIO(file_bytes), file_extension)
 
@@ -34,6 +40,20 @@ class FileTextExtractor:
 
         raise TextExtractError(detail=f"Unsupported file extension for extraction: {extension}")
 
+    @staticmethod
+    def iter_utf8_text_segments_from_stream(file_stream: BinaryIO) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        while True:
+            chunk = file_stream.read(64 * 1024)
+            if not chunk:
+                break
+            decoded = decoder.decode(chunk, final=False)
+            if decoded:
+                yield decoded
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
     @staticmethod
     def _decode_plain_text(file_bytes: bytes) -> str:
         candidates = ("utf-8", "utf-8-sig", "gb18030")
@@ -45,6 +65,17 @@ class FileTextExtractor:
 
         return file_bytes.decode("utf-8", errors="ignore").strip()
 
+    @staticmethod
+    def detect_plain_text_encoding(sample_bytes: bytes) -> str:
+        for encoding in ("utf-8", "utf-8-sig", "gb18030"):
+            try:
+                # The sample is a stream prefix and may end inside a multibyte character.
+                codecs.getincrementaldecoder(encoding)().decode(sample_bytes, final=False)
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        return "utf-8"
+
     @staticmethod
     def _iter_decode_plain_text_stream(file_stream: BinaryIO) -> Iterator[str]:
         sample = file_stream.read(4096)
@@ -67,16 +98,7 @@ class FileTextExtractor:
             sample = b""
         sample_bytes = bytes(sample)
 
-        candidates = ("utf-8", "utf-8-sig", "gb18030")
-        selected_encoding = "utf-8"
-        for encoding in candidates:
-            try:
-                sample_bytes.decode(encoding)
-                selected_encoding = encoding
-                break
-            except UnicodeDecodeError:
-                continue
-
+        selected_encoding = FileTextExtractor.detect_plain_text_encoding(sample_bytes)
         decoder = codecs.getincrementaldecoder(selected_encoding)(errors="ignore")
         first_chunk = decoder.decode(sample_bytes, final=False)
         if first_chunk:
@@ -100,65 +122,30 @@ class FileTextExtractor:
         if tail:
             yield tail
 
-    @staticmethod
-    def _iter_extract_pdf_from_stream(file_stream: BinaryIO) -> Iterator[str]:
+    def _iter_extract_pdf_from_stream(self, file_stream: BinaryIO) -> Iterator[str]:
         try:
-            import pdfplumber
+            import pdfplumber  # noqa: F401
         except ModuleNotFoundError as exc:
             raise TextExtractError(
                 detail="Missing dependency 'pdfplumber' for PDF extraction",
             ) from exc
 
         try:
-            with FileTextExtractor._stream_to_temp_path(file_stream, suffix=".pdf") as temp_path:
-                with pdfplumber.open(temp_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text() or ""
-                        if page_text.strip():
-                            yield page_text.strip()
-                            yield "\n"
+            for page_text in self._pdf_text_extractor.iter_page_texts(file_stream):
+                if page_text:
+                    yield page_text
+                    yield "\n"
         except Exception as exc:  # pragma: no cover - library-specific exceptions are unstable
             raise TextExtractError(detail=f"Failed to parse PDF file: {exc}") from exc
 
     @staticmethod
     def _iter_extract_docx_from_stream(file_stream: BinaryIO) -> Iterator[str]:
         try:
-            from docx import Document
-        except ModuleNotFoundError as exc:
-            raise TextExtractError(
-                detail="Missing dependency 'python-docx' for DOCX extraction",
-            ) from exc
-
-        try:
-            with FileTextExtractor._stream_to_temp_path(file_stream, suffix=".docx") as temp_path:
-                document = Document(temp_path)
-                for paragraph in document.paragraphs:
-                    paragraph_text = paragraph.text.strip()
+            with open_seekable_source(file_stream, suffix=".docx") as source:
+                for paragraph_text in iter_docx_paragraphs(source):
+                    paragraph_text = paragraph_text.strip()
                     if paragraph_text:
                         yield paragraph_text
                         yield "\n"
         except Exception as exc:  # pragma: no cover - library-specific exceptions are unstable
             raise TextExtractError(detail=f"Failed to parse DOCX file: {exc}") from exc
-
-    @staticmethod
-    @contextmanager
-    def _stream_to_temp_path(file_stream: BinaryIO, suffix: str) -> Iterator[str]:
-        fd, temp_path = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
-        try:
-            with open(temp_path, "wb") as temp_file:
-                while True:
-                    chunk = file_stream.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    if isinstance(chunk, str):
-                        chunk = chunk.encode("utf-8", errors="ignore")
-                    elif isinstance(chunk, bytearray):
-                        chunk = bytes(chunk)
-                    temp_file.write(chunk)
-            yield temp_path
-        finally:
-            try:
-                os.remove(temp_path)
-            except FileNotFoundError:
-                pass
@@ -0,0 +1,42 @@
+import asyncio
+import hashlib
+import math
+
+from src.modules.scripts.domain.repositories import IScriptChunkEmbedder
+
+
+class HashingChunkEmbedder(IScriptChunkEmbedder):
+    def __init__(self, dimensions: int = 256, ngram_sizes: tuple[int, ...] = (1, 2)):
+        self._dimensions = dimensions
+        self._ngram_sizes = ngram_sizes
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        return await asyncio.to_thread(self.embed_sync, texts)
+
+    def embed_sync(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed_text(text) for text in texts]
+
+    def _embed_text(self, text: str) -> list[float]:
+        vector = [0.0] * self._dimensions
+        normalized = "".join(text.split()).lower()
+        for ngram_size in self._ngram_sizes:
+            for start in range(len(normalized) - ngram_size + 1):
+                digest = hashlib.blake2b(
+                    normalized[start:start + ngram_size].encode("utf-8"),
+                    digest_size=8,
+                ).digest()
+                value = int.from_bytes(digest, "little")
+                vector[value % self._dimensions] += 1.0 if value >> 63 else -1.0
+
+        norm = math.sqrt(sum(component * component for component in vector))
+        if norm == 0:
+            # Elasticsearch rejects zero-magnitude vectors for cosine similarity.
+            vector[0] = 1.0
+            return vector
+        return [component / norm for component in vector]
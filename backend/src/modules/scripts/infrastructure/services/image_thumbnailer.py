@@ -0,0 +1,40 @@
+from io import BytesIO
+from typing import BinaryIO
+
+try:
+    from PIL import Image, ImageOps
+except Exception:  # pragma: no cover - fallback when dependency is missing
+    Image = None  # type: ignore[assignment]
+    ImageOps = None  # type: ignore[assignment]
+
+THUMBNAIL_EXTENSION = "webp"
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+
+
+class ImageThumbnailer:
+    def __init__(self, quality: int = 80):
+        if Image is None:
+            raise RuntimeError("Pillow is not available, install 'pillow' dependency first")
+        self._quality = quality
+
+    @staticmethod
+    def is_available() -> bool:
+        return Image is not None
+
+    def render(self, file_stream: BinaryIO, sizes: tuple[int, ...]) -> dict[int, bytes]:
+        if not sizes:
+            return {}
+        thumbnails: dict[int, bytes] = {}
+        with Image.open(file_stream) as source:
+            # Let the JPEG decoder downscale while decoding instead of materialising the full image.
+            source.draft("RGB", (max(sizes), max(sizes)))
+            image = ImageOps.exif_transpose(source)
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+            # Shrink from the largest size down so each step resamples an already reduced image.
+            for size in sorted(set(sizes), reverse=True):
+                image.thumbnail((size, size), Image.Resampling.LANCZOS)
+                buffer = BytesIO()
+                image.save(buffer, format="WEBP", quality=self._quality)
+                thumbnails[size] = buffer.getvalue()
+        return thumbnails
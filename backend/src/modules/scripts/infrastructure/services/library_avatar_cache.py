@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+
+class LibraryAvatarCache:
+    def __init__(self, max_bytes: int, max_item_bytes: int | None = None):
+        self._max_bytes = max(0, max_bytes)
+        self._max_item_bytes = self._max_bytes if max_item_bytes is None else min(max_item_bytes, self._max_bytes)
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, object_name: str, etag: str) -> bytes | None:
+        key = (object_name, etag)
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def set(self, object_name: str, etag: str, data: bytes) -> bool:
+        if len(data) > self._max_item_bytes:
+            return False
+        self.invalidate(object_name)
+        self._entries[(object_name, etag)] = data
+        self._size += len(data)
+        while self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+        return True
+
+    def invalidate(self, object_name: str) -> None:
+        for key in [key for key in self._entries if key[0] == object_name]:
+            self._size -= len(self._entries.pop(key))
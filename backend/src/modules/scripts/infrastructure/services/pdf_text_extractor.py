@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, BinaryIO
+
+from src.modules.scripts.infrastructure.services.seekable_source import open_seekable_source, open_temp_copy
+
+PDF_PAGES_PER_TASK = 8
+# In-memory sources up to this size are sent to workers inline; larger ones go through one temp file,
+# because every task pickles its source argument.
+PDF_WORKER_INLINE_MAX_BYTES = 1024 * 1024
+
+
+def extract_pdf_page_range(source: str | bytes, start: int, stop: int) -> list[str]:
+    import pdfplumber
+
+    stream: Any = source
+    if isinstance(source, bytes):
+        stream = BytesIO(source)
+    with pdfplumber.open(stream, pages=list(range(start + 1, stop + 1))) as pdf:
+        return [(page.extract_text() or "").strip() for page in pdf.pages]
+
+
+class PdfTextExtractor:
+    def __init__(self, max_workers: int = 1, pages_per_task: int = PDF_PAGES_PER_TASK):
+        self._max_workers = max(1, max_workers)
+        self._pages_per_task = max(1, pages_per_task)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def iter_page_texts(self, file_stream: BinaryIO) -> Iterator[str]:
+        import pdfplumber
+
+        with open_seekable_source(file_stream, suffix=".pdf") as source:
+            with pdfplumber.open(source) as pdf:
+                page_count = len(pdf.pages)
+                if self._max_workers == 1 or page_count <= self._pages_per_task:
+                    for page in pdf.pages:
+                        yield (page.extract_text() or "").strip()
+                    return
+
+            with self._open_worker_source(source) as worker_source:
+                yield from self._iter_page_texts_in_workers(worker_source, page_count)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_page_texts_in_workers(self, source: str | bytes, page_count: int) -> Iterator[str]:
+        executor = self._get_executor()
+        page_ranges = deque(
+            (start, min(start + self._pages_per_task, page_count))
+            for start in range(0, page_count, self._pages_per_task)
+        )
+        # Keep a bounded window of ranges in flight and yield them in submission order, so pages
+        # come out in document order while at most two ranges per worker are held in memory.
+        pending: deque[Future] = deque()
+        try:
+            while page_ranges or pending:
+                while page_ranges and len(pending) < self._max_workers * 2:
+                    start, stop = page_ranges.popleft()
+                    pending.append(executor.submit(extract_pdf_page_range, source, start, stop))
+                yield from pending.popleft().result()
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    @contextmanager
+    def _open_worker_source(source: str | BinaryIO) -> Iterator[str | bytes]:
+        if isinstance(source, str):
+            yield source
+            return
+        size = source.seek(0, os.SEEK_END)
+        source.seek(0)
+        if size <= PDF_WORKER_INLINE_MAX_BYTES:
+            yield source.read()
+            return
+        with open_temp_copy(source, suffix=".pdf") as temp_path:
+            yield temp_path
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: Executor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,62 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+PUBLISH_POLL_INTERVAL_SECONDS = 0.1
+_PIPELINE_DONE = object()
+
+
+async def iter_batches_in_thread(
+    iterable_factory: Callable[[], Iterable[T]],
+    batch_size: int,
+    max_pending_batches: int,
+) -> AsyncIterator[list[T]]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_pending_batches))
+    stop_event = threading.Event()
+    batch_size = max(1, batch_size)
+
+    def _publish(item) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=PUBLISH_POLL_INTERVAL_SECONDS)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop_event.is_set():
+                    future.cancel()
+                    return False
+
+    def _produce() -> None:
+        try:
+            batch: list[T] = []
+            for item in iterable_factory():
+                if stop_event.is_set():
+                    return
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    if not _publish(batch):
+                        return
+                    batch = []
+            if batch and not _publish(batch):
+                return
+            _publish(_PIPELINE_DONE)
+        except Exception as exc:
+            _publish(exc)
+
+    producer = asyncio.ensure_future(asyncio.to_thread(_produce))
+    try:
+        while True:
+            item = await queue.get()
+            if item is _PIPELINE_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
+        await producer
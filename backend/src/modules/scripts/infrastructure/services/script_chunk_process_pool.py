@@ -0,0 +1,136 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from typing import NamedTuple
+
+from src.modules.scripts.domain.exceptions import ChunkingError
+from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+from src.modules.scripts.infrastructure.services.script_chunker import (
+    ScriptSentenceWindowTextSplitter,
+    ScriptTextChunk,
+)
+
+
+# Chunks are handed back through a file in pickled batches so neither process holds the whole list.
+SPLIT_CHUNK_BATCH_SIZE = 500
+
+
+class ScriptChunkSplitSummary(NamedTuple):
+    extracted_segments: int
+    chunk_count: int
+
+
+def split_script_file(
+    source_path: str,
+    file_extension: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    chunks_path: str,
+    text_path: str | None = None,
+) -> ScriptChunkSplitSummary:
+    # Runs inside a worker process: extraction and splitting are pure Python and hold the GIL.
+    extracted_segment_count = 0
+    chunk_count = 0
+    with ExitStack() as stack:
+        source = stack.enter_context(open(source_path, "rb"))
+        chunk_file = stack.enter_context(open(chunks_path, "wb"))
+        text_file = stack.enter_context(open(text_path, "wb")) if text_path is not None else None
+
+        def _iter_segments():
+            nonlocal extracted_segment_count
+            for segment in FileTextExtractor().iter_text_segments_from_stream(source, file_extension):
+                extracted_segment_count += 1
+                if text_file is not None:
+                    text_file.write(segment.encode("utf-8"))
+                yield segment
+
+        splitter = ScriptSentenceWindowTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        batch: list[ScriptTextChunk] = []
+        for chunk in splitter.iter_chunks_from_text_segments(_iter_segments()):
+            batch.append(chunk)
+            if len(batch) >= SPLIT_CHUNK_BATCH_SIZE:
+                pickle.dump(batch, chunk_file, protocol=pickle.HIGHEST_PROTOCOL)
+                chunk_count += len(batch)
+                batch = []
+        if batch:
+            pickle.dump(batch, chunk_file, protocol=pickle.HIGHEST_PROTOCOL)
+            chunk_count += len(batch)
+    return ScriptChunkSplitSummary(extracted_segment_count, chunk_count)
+
+
+def iter_split_chunks(chunks_path: str) -> Iterator[ScriptTextChunk]:
+    with open(chunks_path, "rb") as chunk_file:
+        while True:
+            try:
+                batch = pickle.load(chunk_file)
+            except EOFError:
+                return
+            yield from batch
+
+
+class ScriptChunkProcessPool:
+    def __init__(self, max_workers: int | None = None):
+        self._max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    async def split_file(
+        self,
+        source_path: str,
+        file_extension: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        chunks_path: str,
+        text_path: str | None = None,
+    ) -> ScriptChunkSplitSummary:
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                executor,
+                split_script_file,
+                source_path,
+                file_extension,
+                chunk_size,
+                chunk_overlap,
+                chunks_path,
+                text_path,
+            )
+        except BrokenProcessPool as exc:
+            self._discard_executor(executor)
+            raise ChunkingError(detail="Chunk worker process exited unexpectedly") from exc
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def _create_executor(self) -> Executor:
+        # Forking a process that runs an event loop and client threads is unsafe; spawn a clean interpreter.
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _discard_executor(self, executor: Executor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
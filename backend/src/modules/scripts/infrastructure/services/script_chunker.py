@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Any
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any, NamedTuple
 
 from langchain_core.documents import Document
 
@@ -16,6 +16,13 @@ except ModuleNotFoundError:  # pragma: no cover - fallback keeps app importable
             self._chunk_overlap = chunk_overlap
 
 
+class ScriptTextChunk(NamedTuple):
+    index: int
+    content: str
+    start_index: int
+    end_index: int
+
+
 class ScriptSentenceWindowTextSplitter(TextSplitter):
     SENTENCE_ENDINGS = ("。", ".", "！", "？", "!", "?", "；", ";")
 
@@ -52,137 +59,138 @@ class ScriptSentenceWindowTextSplitter(TextSplitter):
         boundaries = self._split_streaming_with_indices(text_segments)
         return self._to_documents(boundaries, metadata)
 
+    def iter_documents_from_text_segments(
+        self,
+        text_segments: Iterable[str],
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[Document]:
+        for index, boundary in enumerate(self._iter_split_streaming_with_indices(text_segments)):
+            yield self._to_document(index, boundary, metadata)
+
+    def iter_chunks_from_text_segments(self, text_segments: Iterable[str]) -> Iterator[ScriptTextChunk]:
+        for index, (chunk, start_index, end_index) in enumerate(
+            self._iter_split_streaming_with_indices(text_segments)
+        ):
+            yield ScriptTextChunk(index, chunk, start_index, end_index)
+
     def _to_documents(
         self,
         boundaries: list[tuple[str, int, int]],
         metadata: dict[str, Any] | None = None,
     ) -> list[Document]:
-        documents: list[Document] = []
-        for index, (chunk, start_index, end_index) in enumerate(boundaries):
-            item_metadata = {
-                **(metadata or {}),
-                "chunk_index": index,
-                "start_index": start_index,
-                "end_index": end_index,
-                "chunk_size": len(chunk),
-            }
-            documents.append(
-                Document(
-                    page_content=chunk,
-                    metadata=item_metadata,
-                )
-            )
-        return documents
+        return [
+            self._to_document(index, boundary, metadata)
+            for index, boundary in enumerate(boundaries)
+        ]
+
+    @staticmethod
+    def _to_document(
+        index: int,
+        boundary: tuple[str, int, int],
+        metadata: dict[str, Any] | None = None,
+    ) -> Document:
+        chunk, start_index, end_index = boundary
+        item_metadata = {
+            **(metadata or {}),
+            "chunk_index": index,
+            "start_index": start_index,
+            "end_index": end_index,
+            "chunk_size": len(chunk),
+        }
+        return Document(
+            page_content=chunk,
+            metadata=item_metadata,
+        )
 
     def _split_streaming_with_indices(self, text_segments: Iterable[str]) -> list[tuple[str, int, int]]:
-        chunks: list[tuple[str, int, int]] = []
+        return list(self._iter_split_streaming_with_indices(text_segments))
+
+    def _iter_split_streaming_with_indices(self, text_segments: Iterable[str]) -> Iterator[tuple[str, int, int]]:
+        # Chunks are cut from `buffer` by moving `cursor`; the consumed prefix is dropped only
+        # when pending segments are merged in, which happens once the unread text exceeds a
+        # chunk. Each merge copies less than one chunk of old text, so copying stays O(n).
         buffer = ""
+        cursor = 0
         buffer_start_index = 0
+        pending_segments: list[str] = []
+        pending_length = 0
 
         for segment in text_segments:
             if not segment:
                 continue
-            buffer += segment
-            buffer, buffer_start_index = self._drain_buffer(
-                buffer=buffer,
-                buffer_start_index=buffer_start_index,
-                output=chunks,
-                force_tail=False,
-            )
-
-        self._drain_buffer(
-            buffer=buffer,
-            buffer_start_index=buffer_start_index,
-            output=chunks,
-            force_tail=True,
-        )
-        return chunks
+            pending_segments.append(segment)
+            pending_length += len(segment)
+            if len(buffer) - cursor + pending_length <= self._chunk_size:
+                continue
+
+            buffer_start_index += cursor
+            buffer = self._merge_segments(buffer[cursor:], pending_segments)
+            cursor = 0
+            pending_segments.clear()
+            pending_length = 0
+            cursor = yield from self._drain_buffer(buffer, cursor, buffer_start_index, force_tail=False)
+
+        if pending_segments:
+            buffer_start_index += cursor
+            buffer = self._merge_segments(buffer[cursor:], pending_segments)
+            cursor = 0
+        yield from self._drain_buffer(buffer, cursor, buffer_start_index, force_tail=True)
+
+    @staticmethod
+    def _merge_segments(remainder: str, segments: list[str]) -> str:
+        if not remainder and len(segments) == 1:
+            return segments[0]
+        return "".join([remainder, *segments])
 
     def _drain_buffer(
         self,
         buffer: str,
+        cursor: int,
         buffer_start_index: int,
-        output: list[tuple[str, int, int]],
         force_tail: bool,
-    ) -> tuple[str, int]:
-        while buffer:
-            if len(buffer) <= self._chunk_size:
+    ) -> Generator[tuple[str, int, int], None, int]:
+        buffer_length = len(buffer)
+        while cursor < buffer_length:
+            if buffer_length - cursor <= self._chunk_size:
                 if not force_tail:
                     break
-                split_end = len(buffer)
+                split_end = buffer_length
             else:
-                raw_end = self._chunk_size
-                split_end = self._find_split_end(buffer, 0, raw_end)
-                if split_end <= 0:
-                    split_end = raw_end
+                split_end = self._find_split_end(buffer, cursor, cursor + self._chunk_size)
 
-            raw_chunk = buffer[:split_end]
+            raw_chunk = buffer[cursor:split_end]
             trimmed_chunk = raw_chunk.strip()
             if trimmed_chunk:
                 leading_ws = len(raw_chunk) - len(raw_chunk.lstrip())
                 trailing_ws = len(raw_chunk) - len(raw_chunk.rstrip())
-                content_start = buffer_start_index + leading_ws
+                content_start = buffer_start_index + cursor + leading_ws
                 content_end = buffer_start_index + split_end - trailing_ws
-                output.append((trimmed_chunk, content_start, content_end))
+                yield trimmed_chunk, content_start, content_end
 
-            if split_end >= len(buffer):
-                buffer_start_index += split_end
-                buffer = ""
-                break
+            if split_end >= buffer_length:
+                return buffer_length
 
-            next_start = max(split_end - self._chunk_overlap, 1)
+            next_start = max(split_end - self._chunk_overlap, cursor + 1)
             if next_start >= split_end:
                 next_start = split_end
-            buffer = buffer[next_start:]
-            buffer_start_index += next_start
+            cursor = next_start
 
-        return buffer, buffer_start_index
+        return cursor
 
     def _split_with_indices(self, text: str) -> list[tuple[str, int, int]]:
         if not text.strip():
             return []
-
-        chunks: list[tuple[str, int, int]] = []
-        text_length = len(text)
-        start = 0
-
-        while start < text_length:
-            if text_length - start <= self._chunk_size:
-                split_end = text_length
-            else:
-                raw_end = start + self._chunk_size
-                split_end = self._find_split_end(text, start, raw_end)
-                if split_end <= start:
-                    split_end = raw_end
-
-            raw_chunk = text[start:split_end]
-            trimmed_chunk = raw_chunk.strip()
-            if trimmed_chunk:
-                leading_ws = len(raw_chunk) - len(raw_chunk.lstrip())
-                trailing_ws = len(raw_chunk) - len(raw_chunk.rstrip())
-                content_start = start + leading_ws
-                content_end = split_end - trailing_ws
-                chunks.append((trimmed_chunk, content_start, content_end))
-
-            if split_end >= text_length:
-                break
-
-            next_start = max(split_end - self._chunk_overlap, start + 1)
-            if next_start >= split_end:
-                next_start = split_end
-
-            start = next_start
-
-        return chunks
+        return list(self._drain_buffer(text, 0, 0, force_tail=True))
 
     def _find_split_end(self, text: str, start: int, raw_end: int) -> int:
         safe_end = min(raw_end, len(text))
         if safe_end > start and text[safe_end - 1] in self._sentence_endings:
             return safe_end
 
-        window = text[start:safe_end]
-        nearest = max(window.rfind(symbol) for symbol in self._sentence_endings)
+        # Bounded rfind scans the window in place; each call is a vectorised C search, which
+        # measures faster than building a regex/bisect index of every sentence ending.
+        nearest = max(text.rfind(symbol, start, safe_end) for symbol in self._sentence_endings)
         if nearest != -1:
-            return start + nearest + 1
+            return nearest + 1
 
         return safe_end
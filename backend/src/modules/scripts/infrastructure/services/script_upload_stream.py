@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import codecs
+import hashlib
+from typing import BinaryIO
+
+from src.modules.scripts.domain.exceptions import ScriptTextTooLongError
+from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+
+ENCODING_SAMPLE_SIZE = 4096
+
+
+class TextLengthCounter:
+    def __init__(self, max_text_length: int) -> None:
+        self._max_text_length = max_text_length
+        self._length = 0
+        self._trailing_whitespace = 0
+        self._started = False
+
+    @property
+    def length(self) -> int:
+        return self._length - self._trailing_whitespace
+
+    def feed(self, text: str) -> None:
+        if not text:
+            return
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+
+        stripped_tail = text.rstrip()
+        if stripped_tail:
+            self._trailing_whitespace = len(text) - len(stripped_tail)
+        else:
+            self._trailing_whitespace += len(text)
+        self._length += len(text)
+
+        if self.length > self._max_text_length:
+            raise ScriptTextTooLongError(self._max_text_length)
+
+
+class ScriptUploadStream:
+    def __init__(self, source: BinaryIO, max_text_length: int | None = None) -> None:
+        self._source = source
+        self._hasher = hashlib.sha256()
+        self._counter = TextLengthCounter(max_text_length) if max_text_length is not None else None
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._finished = False
+
+    @property
+    def content_hash(self) -> str:
+        return self._hasher.hexdigest()
+
+    @property
+    def text_length(self) -> int | None:
+        return self._counter.length if self._counter is not None else None
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        elif isinstance(data, bytearray):
+            data = bytes(data)
+        if data:
+            self._hasher.update(data)
+            if self._counter is not None:
+                if self._decoder is None:
+                    encoding = FileTextExtractor.detect_plain_text_encoding(data[:ENCODING_SAMPLE_SIZE])
+                    self._decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+                self._counter.feed(self._decoder.decode(data, final=False))
+        return data
+
+    def finish(self) -> None:
+        if self._finished:
+            return
+        while self.read(1024 * 1024):
+            pass
+        if self._counter is not None and self._decoder is not None:
+            self._counter.feed(self._decoder.decode(b"", final=True))
+        self._finished = True
@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import BinaryIO
+
+TEMP_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@contextmanager
+def open_seekable_source(file_stream: BinaryIO, suffix: str) -> Iterator[str | BinaryIO]:
+    # Zip and PDF readers need random access. Reuse the caller's file or stream when it already
+    # provides it and only spool forward-only streams (e.g. object storage responses) to disk.
+    path = _local_path(file_stream)
+    if path is not None:
+        yield path
+        return
+    if _is_seekable_from_start(file_stream):
+        yield file_stream
+        return
+
+    with open_temp_copy(file_stream, suffix) as temp_path:
+        yield temp_path
+
+
+@contextmanager
+def open_temp_copy(file_stream: BinaryIO, suffix: str) -> Iterator[str]:
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            shutil.copyfileobj(file_stream, temp_file, TEMP_COPY_CHUNK_SIZE)
+        yield temp_path
+    finally:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+
+def _local_path(file_stream: BinaryIO) -> str | None:
+    name = getattr(file_stream, "name", None)
+    if not isinstance(name, str) or not os.path.isfile(name):
+        return None
+    try:
+        file_stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return name
+
+
+def _is_seekable_from_start(file_stream: BinaryIO) -> bool:
+    seekable = getattr(file_stream, "seekable", None)
+    try:
+        return callable(seekable) and bool(seekable()) and file_stream.tell() == 0
+    except (OSError, ValueError):
+        return False
@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import BinaryIO
 
 
+@dataclass(frozen=True)
+class StorageObjectStat:
+    object_name: str
+    size: int
+    etag: str | None = None
+    content_type: str | None = None
+    last_modified: datetime | None = None
+
+
 class IStorageProvider(ABC):
     @abstractmethod
     async def upload_file(
@@ -26,6 +37,27 @@ class IStorageProvider(ABC):
     async def get_object_bytes(self, object_name: str) -> bytes:
         pass
 
+    @abstractmethod
+    async def stat_object(self, object_name: str) -> StorageObjectStat | None:
+        pass
+
     @abstractmethod
     async def delete_object(self, object_name: str) -> None:
         pass
+
+    @abstractmethod
+    async def copy_object(self, source_object_name: str, object_name: str) -> None:
+        pass
+
+    @abstractmethod
+    async def presigned_put_url(self, object_name: str, expires: timedelta) -> str:
+        pass
+
+    @abstractmethod
+    async def presigned_get_url(
+        self,
+        object_name: str,
+        expires: timedelta,
+        response_headers: dict[str, str] | None = None,
+    ) -> str:
+        pass
@@ -2,21 +2,26 @@ import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from io import BytesIO
 from typing import BinaryIO
 
 from config.settings import settings
-from src.shared.extensions.storage.base import IStorageProvider
+from src.shared.extensions.storage.base import IStorageProvider, StorageObjectStat
 
 try:
     from minio import Minio
+    from minio.commonconfig import CopySource
     from minio.error import S3Error
 except Exception:  # pragma: no cover - fallback when dependency is missing
     Minio = None  # type: ignore[assignment]
+    CopySource = None  # type: ignore[assignment]
     S3Error = Exception
 
 logger = logging.getLogger(__name__)
 
+MISSING_OBJECT_ERROR_CODES = {"NoSuchKey", "NoSuchObject", "ResourceNotFound"}
+
 
 def _mask_key(key: str) -> str:
     if not key:
@@ -41,6 +46,14 @@ class MinIOProvider(IStorageProvider):
             secret_key=minio_settings.secret_key,
             secure=self._secure,
         )
+        # Presigning is offline when the region is known, so the public host need not be reachable from here.
+        self._presign_client = Minio(
+            endpoint=minio_settings.public_endpoint or self._endpoint,
+            access_key=self._access_key,
+            secret_key=minio_settings.secret_key,
+            secure=self._secure if minio_settings.public_secure is None else minio_settings.public_secure,
+            region=minio_settings.region,
+        )
         self._bucket_name = minio_settings.bucket_name
         self._bucket_ready = False
 
@@ -127,6 +140,26 @@ class MinIOProvider(IStorageProvider):
         async with self.open_object(object_name) as response:
             return await asyncio.to_thread(response.read)
 
+    async def stat_object(self, object_name: str) -> StorageObjectStat | None:
+        await self._ensure_bucket()
+        try:
+            stat = await asyncio.to_thread(
+                self._client.stat_object,
+                self._bucket_name,
+                object_name,
+            )
+        except S3Error as exc:  # type: ignore[misc]
+            if getattr(exc, "code", None) in MISSING_OBJECT_ERROR_CODES:
+                return None
+            raise RuntimeError(f"Failed to stat object '{object_name}': {exc}") from exc
+        return StorageObjectStat(
+            object_name=object_name,
+            size=stat.size or 0,
+            etag=(stat.etag or "").strip('"') or None,
+            content_type=stat.content_type,
+            last_modified=stat.last_modified,
+        )
+
     async def delete_object(self, object_name: str) -> None:
         await self._ensure_bucket()
         try:
@@ -137,3 +170,38 @@ class MinIOProvider(IStorageProvider):
             )
         except S3Error as exc:  # type: ignore[misc]
             raise RuntimeError(f"Failed to delete object '{object_name}': {exc}") from exc
+
+    async def copy_object(self, source_object_name: str, object_name: str) -> None:
+        await self._ensure_bucket()
+        try:
+            await asyncio.to_thread(
+                self._client.copy_object,
+                self._bucket_name,
+                object_name,
+                CopySource(self._bucket_name, source_object_name),
+            )
+        except S3Error as exc:  # type: ignore[misc]
+            raise RuntimeError(f"Failed to copy object '{source_object_name}' to '{object_name}': {exc}") from exc
+
+    async def presigned_put_url(self, object_name: str, expires: timedelta) -> str:
+        await self._ensure_bucket()
+        return await asyncio.to_thread(
+            self._presign_client.presigned_put_object,
+            self._bucket_name,
+            object_name,
+            expires,
+        )
+
+    async def presigned_get_url(
+        self,
+        object_name: str,
+        expires: timedelta,
+        response_headers: dict[str, str] | None = None,
+    ) -> str:
+        return await asyncio.to_thread(
+            self._presign_client.presigned_get_object,
+            self._bucket_name,
+            object_name,
+            expires,
+            response_headers,
+        )
@@ -0,0 +1,33 @@
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+
+
+class ElasticsearchClient:
+    _instance: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def get_instance(cls) -> httpx.AsyncClient:
+        if cls._instance is None:
+            elasticsearch_settings = settings.elasticsearch
+            cls._instance = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=elasticsearch_settings.max_connections,
+                    max_keepalive_connections=elasticsearch_settings.max_keepalive_connections,
+                    keepalive_expiry=elasticsearch_settings.keepalive_expiry_seconds,
+                ),
+                timeout=httpx.Timeout(
+                    elasticsearch_settings.request_timeout_seconds,
+                    connect=elasticsearch_settings.connect_timeout_seconds,
+                ),
+                headers={"Accept": "application/json"},
+            )
+        return cls._instance
+
+    @classmethod
+    async def close(cls):
+        if cls._instance:
+            await cls._instance.aclose()
+            cls._instance = None
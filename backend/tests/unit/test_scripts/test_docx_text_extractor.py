@@ -0,0 +1,81 @@
+import zipfile
+from io import BytesIO
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+
+from src.modules.scripts.infrastructure.services.docx_text_extractor import iter_docx_paragraphs
+from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _build_docx(with_media: bool = False) -> bytes:
+    document = Document()
+    document.add_paragraph("第一场 日 内")
+    paragraph = document.add_paragraph("张三：")
+    paragraph.add_run("你好\t世界")
+    paragraph.add_run().add_break()
+    paragraph.add_run("第二行")
+    paragraph.add_run().add_break(WD_BREAK.PAGE)
+    linked = document.add_paragraph("见 ")
+    linked._p.append(
+        parse_xml(
+            f'<w:hyperlink xmlns:w="{W_NAMESPACE}"><w:r><w:t xml:space="preserve">链接 文本</w:t></w:r></w:hyperlink>'
+        )
+    )
+    document.add_paragraph("")
+    table = document.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "表格内容"
+    document.add_paragraph("  结尾  ")
+
+    buffer = BytesIO()
+    document.save(buffer)
+    if not with_media:
+        return buffer.getvalue()
+    with zipfile.ZipFile(buffer, "a") as archive:
+        archive.writestr("word/media/image1.png", b"\x89PNG" + b"\x00" * 4096)
+    return buffer.getvalue()
+
+
+def test_iter_docx_paragraphs_matches_python_docx_paragraph_text():
+    data = _build_docx()
+
+    expected = [paragraph.text for paragraph in Document(BytesIO(data)).paragraphs]
+
+    assert list(iter_docx_paragraphs(BytesIO(data))) == expected
+    assert "你好\t世界\n第二行" in expected[1]
+    assert "见 链接 文本" in expected
+
+
+def test_iter_docx_paragraphs_never_opens_media_parts(monkeypatch):
+    data = _build_docx(with_media=True)
+    opened = []
+    original_open = zipfile.ZipFile.open
+
+    def _recording_open(self, name, *args, **kwargs):
+        opened.append(name if isinstance(name, str) else name.filename)
+        return original_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", _recording_open)
+
+    paragraphs = list(iter_docx_paragraphs(BytesIO(data)))
+
+    assert paragraphs
+    assert opened == ["word/document.xml"]
+
+
+def test_file_text_extractor_streams_docx_paragraph_segments():
+    segments = list(FileTextExtractor().iter_text_segments_from_stream(BytesIO(_build_docx()), "docx"))
+
+    assert segments == [
+        "第一场 日 内",
+        "\n",
+        "张三：你好\t世界\n第二行",
+        "\n",
+        "见 链接 文本",
+        "\n",
+        "结尾",
+        "\n",
+    ]
@@ -0,0 +1,411 @@
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+
+from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.domain.exceptions import ChunkDocumentDeleteError
+from src.modules.scripts.infrastructure.services.elasticsearch_chunk_store import ElasticsearchChunkStore
+from src.modules.scripts.infrastructure.services.hashing_chunk_embedder import HashingChunkEmbedder
+
+
+class FakeElasticsearch:
+    def __init__(self):
+        self.documents: dict[str, dict[str, object]] = {}
+        self.index_exists = False
+        self.requests: list[httpx.Request] = []
+        self.failing_ids: set[str] = set()
+        self.fail_bulk_requests = False
+        self.search_bodies: list[dict[str, object]] = []
+        self.index_templates: list[dict[str, object]] = []
+        self.mapping_updates: list[dict[str, object]] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path.endswith("/_bulk"):
+            return self._handle_bulk(request)
+        if path.endswith("/_mget"):
+            return self._handle_mget(request)
+        if path.endswith("/_delete_by_query"):
+            return self._handle_delete_by_query(request)
+        if path.endswith("/_search"):
+            return self._handle_search(request)
+        if request.method == "GET":
+            return httpx.Response(200 if self.index_exists else 404, json={})
+        if request.method == "PUT" and path.endswith("/_mapping"):
+            self.mapping_updates.append(json.loads(request.content))
+            return httpx.Response(200, json={"acknowledged": True})
+        if request.method == "PUT":
+            self.index_templates.append(json.loads(request.content))
+            self.index_exists = True
+            return httpx.Response(200, json={"acknowledged": True})
+        return httpx.Response(400, json={"error": f"unsupported request {request.method} {path}"})
+
+    def _handle_bulk(self, request: httpx.Request) -> httpx.Response:
+        if self.fail_bulk_requests:
+            return httpx.Response(503, json={"error": "unavailable"})
+
+        lines = [json.loads(line) for line in request.content.decode("utf-8").splitlines()]
+        items = []
+        position = 0
+        while position < len(lines):
+            action = lines[position]
+            operation = next(iter(action))
+            document_id = action[operation]["_id"]
+            position += 1
+            if document_id in self.failing_ids:
+                items.append({operation: {"_id": document_id, "status": 500, "error": {"type": "es_rejected"}}})
+                if operation == "index":
+                    position += 1
+                continue
+            if operation == "index":
+                self.documents[document_id] = lines[position]
+                position += 1
+                items.append({operation: {"_id": document_id, "status": 201, "result": "created"}})
+            elif document_id in self.documents:
+                self.documents.pop(document_id)
+                items.append({operation: {"_id": document_id, "status": 200, "result": "deleted"}})
+            else:
+                items.append({operation: {"_id": document_id, "status": 404, "result": "not_found"}})
+        return httpx.Response(200, json={"errors": bool(self.failing_ids), "items": items})
+
+    def _handle_mget(self, request: httpx.Request) -> httpx.Response:
+        document_ids = json.loads(request.content)["ids"]
+        docs = [
+            {"_id": document_id, "found": True, "_source": self.documents[document_id]}
+            if document_id in self.documents
+            else {"_id": document_id, "found": False}
+            for document_id in document_ids
+        ]
+        return httpx.Response(200, json={"docs": docs})
+
+    def _handle_delete_by_query(self, request: httpx.Request) -> httpx.Response:
+        filters = json.loads(request.content)["query"]["bool"]["filter"]
+        deleted = 0
+        for document_id, source in list(self.documents.items()):
+            if all(source.get(field) == value for item in filters for field, value in item["term"].items()):
+                self.documents.pop(document_id)
+                deleted += 1
+        return httpx.Response(200, json={"deleted": deleted, "failures": []})
+
+    def _handle_search(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.search_bodies.append(body)
+        if "knn" in body:
+            return self._handle_knn_search(body)
+        query = body["query"]["bool"]["must"][0]["match"]["content"]["query"]
+        filters = body["query"]["bool"]["filter"]
+        hits = []
+        for document_id, source in self.documents.items():
+            if not all(source.get(field) == value for item in filters for field, value in item["term"].items()):
+                continue
+            score = float(source["content"].count(query))
+            if score <= 0:
+                continue
+            hits.append(
+                {
+                    "_id": document_id,
+                    "_score": score,
+                    "_source": {field: source.get(field) for field in body["_source"]},
+                    "highlight": {"content": [source["content"].replace(query, f"<em>{query}</em>")]},
+                    "sort": [score, source["script_id"], source["index_id"]],
+                }
+            )
+        hits.sort(key=lambda hit: (-hit["sort"][0], hit["sort"][1], hit["sort"][2]))
+        if "search_after" in body:
+            after = body["search_after"]
+            after_key = (-after[0], after[1], after[2])
+            hits = [hit for hit in hits if (-hit["sort"][0], hit["sort"][1], hit["sort"][2]) > after_key]
+        return httpx.Response(200, json={"hits": {"hits": hits[: body["size"]]}})
+
+    def _handle_knn_search(self, body: dict[str, object]) -> httpx.Response:
+        knn = body["knn"]
+        hits = []
+        for document_id, source in self.documents.items():
+            if "embedding" not in source:
+                continue
+            if not all(source.get(field) == value for item in knn["filter"] for field, value in item["term"].items()):
+                continue
+            similarity = sum(left * right for left, right in zip(source["embedding"], knn["query_vector"]))
+            hits.append(
+                {
+                    "_id": document_id,
+                    "_score": (1 + similarity) / 2,
+                    "_source": {field: source.get(field) for field in body["_source"]},
+                }
+            )
+        hits.sort(key=lambda hit: -hit["_score"])
+        return httpx.Response(200, json={"hits": {"hits": hits[: knn["k"]]}})
+
+    def bulk_payloads(self) -> list[bytes]:
+        return [request.content for request in self.requests if request.url.path.endswith("/_bulk")]
+
+
+def _create_store(fake: FakeElasticsearch, embedding_dimensions: int = 8) -> ElasticsearchChunkStore:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+    return ElasticsearchChunkStore(client=client, embedding_dimensions=embedding_dimensions)
+
+
+def _build_chunks(count: int, content: str = "内容。") -> list[ScriptChunk]:
+    script_id = uuid.uuid4()
+    library_id = uuid.uuid4()
+    return [
+        ScriptChunk.create(
+            script_id=script_id,
+            library_id=library_id,
+            index_id=index,
+            content=content,
+            start_index=index * len(content),
+            end_index=(index + 1) * len(content),
+        )
+        for index in range(count)
+    ]
+
+
+def test_elasticsearch_chunk_store_creates_index_once():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+
+    async def _run():
+        await store.index_chunks(_build_chunks(1))
+        await store.index_chunks(_build_chunks(1))
+
+    asyncio.run(_run())
+
+    index_checks = [request for request in fake.requests if request.method in {"GET", "PUT"}]
+    assert [request.method for request in index_checks] == ["GET", "PUT"]
+
+
+def test_elasticsearch_chunk_store_index_chunks_uses_bounded_bulk_batches():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    store._bulk_batch_size = 2
+    chunks = _build_chunks(5)
+
+    asyncio.run(store.index_chunks(chunks))
+
+    bulk_payloads = fake.bulk_payloads()
+    assert len(bulk_payloads) == 3
+    assert all(payload.endswith(b"\n") for payload in bulk_payloads)
+    assert list(fake.documents) == [str(chunk.id) for chunk in chunks]
+
+
+def test_elasticsearch_chunk_store_index_chunks_splits_batches_by_bytes():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(4, content="字" * 200)
+    single_action_bytes = len(
+        store._encode_bulk_action({"index": {"_id": str(chunks[0].id)}}, store._chunk_to_document(chunks[0]))
+    )
+    store._bulk_max_bytes = single_action_bytes * 2 + single_action_bytes // 2
+
+    asyncio.run(store.index_chunks(chunks))
+
+    assert len(fake.bulk_payloads()) == 2
+
+
+def test_elasticsearch_chunk_store_index_chunks_reports_failed_items():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(3)
+    fake.failing_ids.add(str(chunks[1].id))
+
+    with pytest.raises(RuntimeError) as exc_info:
+        asyncio.run(store.index_chunks(chunks))
+
+    message = str(exc_info.value)
+    assert "Failed to index 1 chunk document(s)" in message
+    assert str(chunks[1].id) in message
+    assert str(chunks[0].id) not in message
+
+
+def test_elasticsearch_chunk_store_index_chunks_marks_whole_batch_failed_on_request_error():
+    fake = FakeElasticsearch()
+    fake.fail_bulk_requests = True
+    store = _create_store(fake)
+    store._bulk_batch_size = 2
+
+    with pytest.raises(RuntimeError) as exc_info:
+        asyncio.run(store.index_chunks(_build_chunks(3)))
+
+    assert "Failed to index 3 chunk document(s)" in str(exc_info.value)
+
+
+def test_elasticsearch_chunk_store_get_chunks_round_trips_documents():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(3)
+
+    async def _run():
+        await store.index_chunks(chunks)
+        return await store.get_chunks(list(reversed(chunks)))
+
+    hydrated = asyncio.run(_run())
+
+    assert [chunk.id for chunk in hydrated] == [chunk.id for chunk in chunks]
+    assert hydrated[0].content == chunks[0].content
+
+
+def test_elasticsearch_chunk_store_delete_chunks_batches_and_tolerates_missing_documents():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(2)
+    missing_id = uuid.uuid4()
+    failing_id = uuid.uuid4()
+    fake.failing_ids.add(str(failing_id))
+
+    async def _run():
+        await store.index_chunks(chunks)
+        await store.delete_chunks([chunk.id for chunk in chunks] + [missing_id, failing_id])
+
+    with pytest.raises(ChunkDocumentDeleteError) as exc_info:
+        asyncio.run(_run())
+
+    assert len(fake.bulk_payloads()) == 2
+    assert exc_info.value.failed_chunk_ids == [str(failing_id)]
+    assert fake.documents == {}
+
+
+def test_elasticsearch_chunk_store_delete_script_chunks_uses_delete_by_query():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    kept_chunks = _build_chunks(2)
+    removed_chunks = _build_chunks(3)
+
+    async def _run():
+        await store.index_chunks(kept_chunks + removed_chunks)
+        await store.delete_script_chunks(removed_chunks[0].script_id, removed_chunks[0].library_id)
+
+    asyncio.run(_run())
+
+    assert set(fake.documents) == {str(chunk.id) for chunk in kept_chunks}
+    assert any(request.url.path.endswith("/_delete_by_query") for request in fake.requests)
+
+
+def test_elasticsearch_chunk_store_find_existing_chunk_ids_skips_sources():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(2)
+    missing_id = uuid.uuid4()
+
+    async def _run():
+        await store.index_chunks(chunks)
+        return await store.find_existing_chunk_ids([chunks[0].id, missing_id, chunks[1].id])
+
+    existing_ids = asyncio.run(_run())
+
+    assert existing_ids == {chunks[0].id, chunks[1].id}
+    mget_request = next(request for request in fake.requests if request.url.path.endswith("/_mget"))
+    assert mget_request.url.params["_source"] == "false"
+
+
+def test_elasticsearch_chunk_store_search_chunks_filters_by_keyword_and_locates_highlights():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(3, content="开场。雨夜重逢。")
+    other_library_chunks = _build_chunks(1, content="雨夜重逢。")
+
+    async def _run():
+        await store.index_chunks(chunks + other_library_chunks)
+        return await store.search_chunks(chunks[0].library_id, "重逢", size=2, script_id=chunks[0].script_id)
+
+    hits = asyncio.run(_run())
+
+    assert [hit.chunk_index for hit in hits] == [0, 1]
+    assert all(hit.library_id == chunks[0].library_id for hit in hits)
+    highlight = hits[1].highlights[0]
+    assert highlight.text == "开场。雨夜<em>重逢</em>。"
+    assert (highlight.start_index, highlight.end_index) == (chunks[1].start_index, chunks[1].end_index)
+    body = fake.search_bodies[0]
+    assert body["query"]["bool"]["filter"] == [
+        {"term": {"library_id": str(chunks[0].library_id)}},
+        {"term": {"script_id": str(chunks[0].script_id)}},
+    ]
+    assert body["track_total_hits"] is False
+    assert "search_after" not in body
+
+
+def test_elasticsearch_chunk_store_search_chunks_continues_after_sort_values():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    chunks = _build_chunks(3, content="雨夜重逢。")
+
+    async def _run():
+        await store.index_chunks(chunks)
+        first_page = await store.search_chunks(chunks[0].library_id, "重逢", size=2)
+        second_page = await store.search_chunks(
+            chunks[0].library_id,
+            "重逢",
+            size=2,
+            search_after=first_page[-1].sort_values,
+        )
+        return first_page, second_page
+
+    first_page, second_page = asyncio.run(_run())
+
+    assert [hit.chunk_index for hit in first_page + second_page] == [0, 1, 2]
+    assert fake.search_bodies[1]["search_after"] == first_page[-1].sort_values
+
+
+def test_elasticsearch_chunk_store_locate_highlight_offsets_inside_chunk():
+    highlight = ElasticsearchChunkStore._locate_highlight("雨夜<em>重逢</em>", "开场。雨夜重逢。", 100, 108)
+
+    assert (highlight.start_index, highlight.end_index) == (103, 107)
+
+
+def test_elasticsearch_chunk_store_maps_embedding_as_hnsw_dense_vector():
+    fake = FakeElasticsearch()
+    store = _create_store(fake, embedding_dimensions=8)
+
+    asyncio.run(store.index_chunks(_build_chunks(1)))
+
+    embedding_mapping = fake.index_templates[0]["mappings"]["properties"]["embedding"]
+    assert embedding_mapping["type"] == "dense_vector"
+    assert embedding_mapping["dims"] == 8
+    assert embedding_mapping["index"] is True
+    assert embedding_mapping["index_options"]["type"] == "hnsw"
+
+
+def test_elasticsearch_chunk_store_adds_embedding_mapping_to_existing_index():
+    fake = FakeElasticsearch()
+    fake.index_exists = True
+    store = _create_store(fake)
+
+    asyncio.run(store.index_chunks(_build_chunks(1)))
+
+    assert fake.index_templates == []
+    assert fake.mapping_updates[0]["properties"]["embedding"]["type"] == "dense_vector"
+
+
+def test_elasticsearch_chunk_store_round_trips_embeddings_and_runs_filtered_knn():
+    fake = FakeElasticsearch()
+    store = _create_store(fake)
+    embedder = HashingChunkEmbedder(dimensions=8)
+    chunks = _build_chunks(2, content="雨夜重逢。")
+    chunks[1].content = "清晨出发。"
+    other_library_chunks = _build_chunks(1, content="雨夜重逢。")
+    for chunk in chunks + other_library_chunks:
+        chunk.embedding = embedder.embed_sync([chunk.content])[0]
+
+    async def _run():
+        await store.index_chunks(chunks + other_library_chunks)
+        embeddings = await store.get_chunk_embeddings([chunks[0].id, uuid.uuid4()])
+        hits = await store.knn_search_chunks(chunks[0].library_id, chunks[0].embedding, size=1)
+        hydrated = await store.get_chunks(chunks)
+        return embeddings, hits, hydrated
+
+    embeddings, hits, hydrated = asyncio.run(_run())
+
+    assert embeddings == {chunks[0].id: pytest.approx(chunks[0].embedding)}
+    assert [hit.chunk_id for hit in hits] == [chunks[0].id]
+    assert hits[0].content == "雨夜重逢。"
+    assert all(chunk.embedding is None for chunk in hydrated)
+    knn = fake.search_bodies[0]["knn"]
+    assert knn["filter"] == [{"term": {"library_id": str(chunks[0].library_id)}}]
+    assert knn["num_candidates"] >= knn["k"]
+    mget_paths = [str(request.url) for request in fake.requests if request.url.path.endswith("/_mget")]
+    assert "_source_includes=embedding" in mget_paths[0]
+    assert "_source_excludes=embedding" in mget_paths[1]
@@ -0,0 +1,34 @@
+import asyncio
+import math
+
+from src.modules.scripts.infrastructure.services.hashing_chunk_embedder import HashingChunkEmbedder
+
+
+def _cosine(left: list[float], right: list[float]) -> float:
+    return sum(a * b for a, b in zip(left, right))
+
+
+def test_hashing_chunk_embedder_is_deterministic_and_normalized():
+    embedder = HashingChunkEmbedder(dimensions=32)
+
+    first, second = asyncio.run(embedder.embed(["雨夜重逢。", "雨夜重逢。"]))
+
+    assert first == second
+    assert len(first) == 32
+    assert math.isclose(math.sqrt(sum(value * value for value in first)), 1.0)
+
+
+def test_hashing_chunk_embedder_ranks_overlapping_text_closer():
+    embedder = HashingChunkEmbedder(dimensions=128)
+
+    query, related, unrelated = embedder.embed_sync(["车站重逢", "雨夜里两人在车站重逢。", "清晨出发去远方。"])
+
+    assert _cosine(query, related) > _cosine(query, unrelated)
+
+
+def test_hashing_chunk_embedder_never_returns_zero_vector():
+    embedder = HashingChunkEmbedder(dimensions=8)
+
+    vector = embedder.embed_sync(["   "])[0]
+
+    assert vector == [1.0] + [0.0] * 7
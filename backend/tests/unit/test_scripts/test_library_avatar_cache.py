@@ -0,0 +1,30 @@
+from src.modules.scripts.infrastructure.services.library_avatar_cache import LibraryAvatarCache
+
+
+def test_library_avatar_cache_evicts_least_recently_used_within_byte_budget():
+    cache = LibraryAvatarCache(max_bytes=10)
+    cache.set("a", '"1"', b"aaaa")
+    cache.set("b", '"1"', b"bbbb")
+    assert cache.get("a", '"1"') == b"aaaa"
+
+    cache.set("c", '"1"', b"cccc")
+
+    assert cache.get("b", '"1"') is None
+    assert cache.get("a", '"1"') == b"aaaa"
+    assert cache.get("c", '"1"') == b"cccc"
+    assert cache.size == 8
+
+
+def test_library_avatar_cache_keys_by_etag_and_skips_oversized_items():
+    cache = LibraryAvatarCache(max_bytes=10, max_item_bytes=4)
+    cache.set("a", '"1"', b"old")
+    cache.set("a", '"2"', b"new")
+
+    assert cache.get("a", '"1"') is None
+    assert cache.get("a", '"2"') == b"new"
+    assert cache.set("b", '"1"', b"too-large") is False
+    assert cache.size == 3
+
+    cache.invalidate("a")
+    assert cache.get("a", '"2"') is None
+    assert cache.size == 0
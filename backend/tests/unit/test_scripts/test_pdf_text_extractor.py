@@ -0,0 +1,131 @@
+import os
+import tempfile
+from io import BytesIO
+
+import pytest
+
+from src.modules.scripts.infrastructure.services import pdf_text_extractor as pdf_text_extractor_module
+from src.modules.scripts.infrastructure.services import seekable_source as seekable_source_module
+from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+from src.modules.scripts.infrastructure.services.pdf_text_extractor import PdfTextExtractor
+
+
+def _build_pdf(page_texts: list[str]) -> bytes:
+    page_count = len(page_texts)
+    font_id = 3 + page_count * 2
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            "<< /Type /Pages /Kids ["
+            + " ".join(f"{3 + index * 2} 0 R" for index in range(page_count))
+            + f"] /Count {page_count} >>"
+        ).encode("ascii"),
+    ]
+    for index, text in enumerate(page_texts):
+        content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("ascii")
+        objects.append(
+            (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + index * 2} 0 R >>"
+            ).encode("ascii")
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+
+class _ForwardOnlyStream:
+    def __init__(self, data: bytes):
+        self._stream = BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
+PAGE_TEXTS = [f"Page {index} line." for index in range(7)]
+
+
+def _forbid_temp_copy(monkeypatch):
+    def _mkstemp(*args, **kwargs):
+        raise AssertionError("temp copy should not be created")
+
+    monkeypatch.setattr(seekable_source_module.tempfile, "mkstemp", _mkstemp)
+
+
+def test_pdf_text_extractor_reads_seekable_stream_without_temp_copy(monkeypatch):
+    _forbid_temp_copy(monkeypatch)
+
+    pages = list(PdfTextExtractor().iter_page_texts(BytesIO(_build_pdf(PAGE_TEXTS))))
+
+    assert pages == PAGE_TEXTS
+
+
+def test_pdf_text_extractor_opens_local_file_by_path(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "script.pdf"
+    pdf_path.write_bytes(_build_pdf(PAGE_TEXTS))
+    _forbid_temp_copy(monkeypatch)
+
+    with open(pdf_path, "rb") as file_stream:
+        pages = list(PdfTextExtractor().iter_page_texts(file_stream))
+
+    assert pages == PAGE_TEXTS
+
+
+def test_pdf_text_extractor_copies_forward_only_stream():
+    pages = list(PdfTextExtractor().iter_page_texts(_ForwardOnlyStream(_build_pdf(PAGE_TEXTS))))
+
+    assert pages == PAGE_TEXTS
+
+
+@pytest.mark.parametrize("make_stream", [BytesIO, _ForwardOnlyStream])
+def test_pdf_text_extractor_extracts_page_ranges_in_workers_in_order(make_stream):
+    extractor = PdfTextExtractor(max_workers=2, pages_per_task=2)
+    try:
+        pages = list(extractor.iter_page_texts(make_stream(_build_pdf(PAGE_TEXTS))))
+    finally:
+        extractor.shutdown()
+
+    assert pages == PAGE_TEXTS
+
+
+def test_pdf_text_extractor_sends_workers_a_temp_path_for_large_in_memory_sources(monkeypatch):
+    data = _build_pdf(PAGE_TEXTS)
+    monkeypatch.setattr(pdf_text_extractor_module, "PDF_WORKER_INLINE_MAX_BYTES", len(data) - 1)
+
+    with tempfile.SpooledTemporaryFile(max_size=len(data) * 2) as spooled:
+        spooled.write(data)
+        spooled.seek(0)
+        with PdfTextExtractor._open_worker_source(spooled) as worker_source:
+            assert isinstance(worker_source, str)
+            with open(worker_source, "rb") as temp_file:
+                assert temp_file.read() == data
+    assert not os.path.exists(worker_source)
+
+    with PdfTextExtractor._open_worker_source(BytesIO(data[: len(data) - 1])) as small_source:
+        assert isinstance(small_source, bytes)
+
+    extractor = PdfTextExtractor(max_workers=2, pages_per_task=2)
+    try:
+        pages = list(extractor.iter_page_texts(BytesIO(data)))
+    finally:
+        extractor.shutdown()
+    assert pages == PAGE_TEXTS
+
+
+def test_file_text_extractor_extracts_pdf_segments():
+    extractor = FileTextExtractor()
+
+    text = extractor.extract(_build_pdf(["First page.", "", "Third page."]), "pdf")
+
+    assert text == "First page.\nThird page."
@@ -1,32 +1,61 @@
 import asyncio
-from collections.abc import AsyncIterator
+import hashlib
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import BytesIO
 from typing import BinaryIO
-from uuid import UUID
+from urllib.parse import parse_qs, urlencode, urlparse
+from uuid import UUID, uuid4
 
 import pytest
 from starlette.datastructures import UploadFile
 
 from src.modules.scripts.application.dto.script_dto import (
     CreateScriptLibraryRequest,
+    FinalizeScriptUploadRequest,
+    PresignScriptUploadRequest,
+    ScriptTextRange,
     UpdateScriptLibraryRequest,
     UpdateScriptLibraryConfigRequest,
 )
+from src.modules.scripts.application.services import script_app_service as script_app_service_module
 from src.modules.scripts.application.services.script_app_service import ScriptAppService
+from src.modules.scripts.application.services.script_chunk_job_runner import ScriptChunkJobRunner
+from src.modules.scripts.domain.entities.script_blob_entity import ScriptBlob
 from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.domain.entities.script_chunk_job_entity import ScriptChunkJob
+from src.modules.scripts.domain.entities.script_chunk_search_entity import (
+    ScriptChunkHighlight,
+    ScriptChunkSearchHit,
+)
 from src.modules.scripts.domain.entities.script_config_entity import ScriptConfig
 from src.modules.scripts.domain.entities.script_entity import Script
 from src.modules.scripts.domain.entities.script_library_entity import ScriptLibrary
+from src.modules.scripts.domain.entities.script_library_stats_entity import ScriptLibraryStats
 from src.modules.scripts.domain.exceptions import (
+    ChunkDocumentDeleteError,
+    ChunkingError,
+    PresignedTransferUnavailableError,
+    ScriptChunkJobNotFoundException,
     StorageCleanupError,
     ScriptLibraryAvatarNotFoundException,
     ScriptLibraryNotFoundException,
     ScriptNotFoundException,
+    ScriptTextRangeNotSatisfiableError,
+    ScriptTextTooLongError,
+    SemanticSearchUnavailableError,
 )
 from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+from src.modules.scripts.infrastructure.services.hashing_chunk_embedder import HashingChunkEmbedder
+from src.modules.scripts.infrastructure.services.image_thumbnailer import ImageThumbnailer
+from src.modules.scripts.infrastructure.services.library_avatar_cache import LibraryAvatarCache
+from src.modules.scripts.infrastructure.services.script_chunk_process_pool import (
+    ScriptChunkSplitSummary,
+    split_script_file,
+)
 from src.shared.domain.exceptions import ValidationException
+from src.shared.extensions.storage.base import StorageObjectStat
 
 
 class FakeScriptRepository:
@@ -35,6 +64,8 @@ class FakeScriptRepository:
         self._scripts: dict[UUID, Script] = {}
         self._chunks: dict[tuple[UUID, UUID], list[ScriptChunk]] = {}
         self._configs: dict[UUID, ScriptConfig] = {}
+        self._blobs: dict[str, ScriptBlob] = {}
+        self.list_chunks_calls: list[tuple[int | None, int | None]] = []
 
     async def create_library(self, library: ScriptLibrary) -> ScriptLibrary:
         self._libraries[library.id] = library
@@ -84,6 +115,16 @@ class FakeScriptRepository:
             self._chunks.pop((script_id, library_id), None)
         return True
 
+    async def get_library_stats(self, library_id: UUID) -> ScriptLibraryStats:
+        scripts = await self.list_all(library_id=library_id)
+        return ScriptLibraryStats(
+            library_id=library_id,
+            script_count=len(scripts),
+            total_file_size=sum(script.file_size for script in scripts),
+            chunk_count=sum(len(self._chunks.get((script.id, library_id), [])) for script in scripts),
+            last_script_updated_at=max((script.updated_at for script in scripts), default=None),
+        )
+
     async def save_to_library(self, script: Script, library_id: UUID) -> Script:
         script.library_id = library_id
         self._scripts[script.id] = script
@@ -95,9 +136,30 @@ class FakeScriptRepository:
             scripts = [script for script in scripts if script.library_id == library_id]
         return sorted(scripts, key=lambda item: item.created_at, reverse=True)
 
+    async def list_all_with_chunk_counts(self, library_id: UUID) -> list[tuple[Script, int]]:
+        scripts = await self.list_all(library_id=library_id)
+        return [(script, len(self._chunks.get((script.id, library_id), []))) for script in scripts]
+
     async def find_by_id(self, script_id: UUID) -> Script | None:
         return self._scripts.get(script_id)
 
+    async def find_chunked_script_by_content_hash(
+        self,
+        content_hash: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        exclude_script_id: UUID | None = None,
+    ) -> Script | None:
+        for script in self._scripts.values():
+            if (
+                script.id != exclude_script_id
+                and script.content_hash == content_hash
+                and script.chunk_size == chunk_size
+                and script.chunk_overlap == chunk_overlap
+            ):
+                return script
+        return None
+
     async def delete(self, script_id: UUID) -> bool:
         script = self._scripts.pop(script_id, None)
         if script is None:
@@ -106,21 +168,40 @@ class FakeScriptRepository:
             self._chunks.pop((script_id, script.library_id), None)
         return True
 
-    async def list_chunks(self, script_id: UUID, library_id: UUID) -> list[ScriptChunk]:
-        return list(self._chunks.get((script_id, library_id), []))
+    async def list_chunks(
+        self,
+        script_id: UUID,
+        library_id: UUID,
+        after_index: int | None = None,
+        limit: int | None = None,
+    ) -> list[ScriptChunk]:
+        self.list_chunks_calls.append((after_index, limit))
+        chunks = [
+            chunk
+            for chunk in self._chunks.get((script_id, library_id), [])
+            if after_index is None or chunk.index_id > after_index
+        ]
+        return chunks[:limit] if limit is not None else chunks
 
     async def replace_chunks(
         self,
         script_id: UUID,
         library_id: UUID,
         chunks: list[ScriptChunk],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
     ) -> None:
+        script = self._scripts.get(script_id)
+        if script is not None:
+            script.chunk_size = chunk_size
+            script.chunk_overlap = chunk_overlap
         chunk_refs = [
             ScriptChunk(
                 id=chunk.id,
                 script_id=chunk.script_id,
                 library_id=chunk.library_id,
                 index_id=chunk.index_id,
+                fingerprint=chunk.fingerprint,
                 created_at=chunk.created_at,
                 updated_at=chunk.updated_at,
             )
@@ -128,6 +209,36 @@ class FakeScriptRepository:
         ]
         self._chunks[(script_id, library_id)] = chunk_refs
 
+    async def find_blob(self, content_hash: str) -> ScriptBlob | None:
+        return self._blobs.get(content_hash)
+
+    async def acquire_blob(self, content_hash: str, storage_path: str, file_size: int) -> ScriptBlob:
+        blob = self._blobs.get(content_hash)
+        if blob is None:
+            now = datetime.utcnow()
+            blob = ScriptBlob(
+                content_hash=content_hash,
+                storage_path=storage_path,
+                file_size=file_size,
+                ref_count=0,
+                created_at=now,
+                updated_at=now,
+            )
+            self._blobs[content_hash] = blob
+        blob.ref_count += 1
+        return ScriptBlob(**vars(blob))
+
+    async def release_blobs(self, content_hashes: list[str]) -> list[ScriptBlob]:
+        released: list[ScriptBlob] = []
+        for content_hash in content_hashes:
+            blob = self._blobs.get(content_hash)
+            if blob is None:
+                continue
+            blob.ref_count -= 1
+            if blob.ref_count <= 0:
+                released.append(self._blobs.pop(content_hash))
+        return released
+
     async def get_library_config(self, library_id: UUID) -> ScriptConfig | None:
         return self._configs.get(library_id)
 
@@ -136,6 +247,7 @@ class FakeScriptRepository:
         library_id: UUID,
         chunk_size: int,
         chunk_overlap: int,
+        auto_chunk_on_upload: bool = False,
     ) -> ScriptConfig:
         existing = self._configs.get(library_id)
         if existing is None:
@@ -146,12 +258,14 @@ class FakeScriptRepository:
                 chunk_overlap=chunk_overlap,
                 created_at=now,
                 updated_at=now,
+                auto_chunk_on_upload=auto_chunk_on_upload,
             )
             self._configs[library_id] = config
             return config
 
         existing.chunk_size = chunk_size
         existing.chunk_overlap = chunk_overlap
+        existing.auto_chunk_on_upload = auto_chunk_on_upload
         existing.updated_at = datetime.utcnow()
         return existing
 
@@ -162,6 +276,8 @@ class FailingReplaceChunkRepository(FakeScriptRepository):
         script_id: UUID,
         library_id: UUID,
         chunks: list[ScriptChunk],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
     ) -> None:
         raise RuntimeError("replace chunk refs failed")
 
@@ -171,9 +287,13 @@ class FakeChunkStore:
         self._documents: dict[UUID, ScriptChunk] = {}
         self.deleted_chunk_ids: list[UUID] = []
         self.fail_on_delete: set[UUID] = set()
+        self.delete_calls: list[list[UUID]] = []
+        self.indexed_chunk_ids: list[UUID] = []
+        self.search_calls: list[tuple] = []
 
     async def index_chunks(self, chunks: list[ScriptChunk]) -> None:
         for chunk in chunks:
+            self.indexed_chunk_ids.append(chunk.id)
             self._documents[chunk.id] = ScriptChunk(
                 id=chunk.id,
                 script_id=chunk.script_id,
@@ -183,6 +303,7 @@ class FakeChunkStore:
                 chunk_size=chunk.chunk_size,
                 start_index=chunk.start_index,
                 end_index=chunk.end_index,
+                embedding=chunk.embedding,
                 created_at=chunk.created_at,
                 updated_at=chunk.updated_at,
             )
@@ -196,7 +317,86 @@ class FakeChunkStore:
             chunks.append(chunk)
         return chunks
 
+    async def find_existing_chunk_ids(self, chunk_ids: list[UUID]) -> set[UUID]:
+        return {chunk_id for chunk_id in chunk_ids if chunk_id in self._documents}
+
+    async def get_chunk_embeddings(self, chunk_ids: list[UUID]) -> dict[UUID, list[float]]:
+        return {
+            chunk_id: self._documents[chunk_id].embedding
+            for chunk_id in chunk_ids
+            if chunk_id in self._documents and self._documents[chunk_id].embedding is not None
+        }
+
+    async def knn_search_chunks(
+        self,
+        library_id: UUID,
+        query_vector: list[float],
+        size: int,
+        script_id: UUID | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        scored = sorted(
+            (
+                (sum(left * right for left, right in zip(chunk.embedding, query_vector)), chunk)
+                for chunk in self._documents.values()
+                if chunk.embedding is not None
+                and chunk.library_id == library_id
+                and (script_id is None or chunk.script_id == script_id)
+            ),
+            key=lambda item: -item[0],
+        )
+        return [
+            ScriptChunkSearchHit(
+                chunk_id=chunk.id,
+                script_id=chunk.script_id,
+                library_id=chunk.library_id,
+                chunk_index=chunk.index_id,
+                start_index=chunk.start_index,
+                end_index=chunk.end_index,
+                score=score,
+                content=chunk.content,
+            )
+            for score, chunk in scored[:size]
+        ]
+
+    async def search_chunks(
+        self,
+        library_id: UUID,
+        query: str,
+        size: int,
+        script_id: UUID | None = None,
+        search_after: list[object] | None = None,
+    ) -> list[ScriptChunkSearchHit]:
+        self.search_calls.append((library_id, query, size, script_id, search_after))
+        matches = sorted(
+            (
+                chunk
+                for chunk in self._documents.values()
+                if chunk.library_id == library_id
+                and (script_id is None or chunk.script_id == script_id)
+                and query in chunk.content
+            ),
+            key=lambda chunk: (str(chunk.script_id), chunk.index_id),
+        )
+        if search_after:
+            matches = [chunk for chunk in matches if [str(chunk.script_id), chunk.index_id] > search_after]
+        return [
+            ScriptChunkSearchHit(
+                chunk_id=chunk.id,
+                script_id=chunk.script_id,
+                library_id=chunk.library_id,
+                chunk_index=chunk.index_id,
+                start_index=chunk.start_index,
+                end_index=chunk.end_index,
+                score=1.0,
+                content=chunk.content,
+                highlights=[ScriptChunkHighlight(text=query, start_index=chunk.start_index, end_index=chunk.end_index)],
+                sort_values=[str(chunk.script_id), chunk.index_id],
+            )
+            for chunk in matches[:size]
+        ]
+
     async def delete_chunks(self, chunk_ids: list[UUID]) -> None:
+        self.delete_calls.append(list(chunk_ids))
         failures: list[UUID] = []
         for chunk_id in chunk_ids:
             if chunk_id in self.fail_on_delete:
@@ -205,7 +405,33 @@ class FakeChunkStore:
             self._documents.pop(chunk_id, None)
             self.deleted_chunk_ids.append(chunk_id)
         if failures:
-            raise RuntimeError(f"Failed to delete chunk documents: {failures}")
+            raise ChunkDocumentDeleteError(failed_chunk_ids=[str(chunk_id) for chunk_id in failures])
+
+    async def delete_script_chunks(self, script_id: UUID, library_id: UUID) -> None:
+        await self._delete_matching(
+            lambda chunk: chunk.script_id == script_id and chunk.library_id == library_id
+        )
+
+    async def delete_library_chunks(self, library_id: UUID) -> None:
+        await self._delete_matching(lambda chunk: chunk.library_id == library_id)
+
+    async def _delete_matching(self, predicate) -> None:
+        for chunk_id, chunk in list(self._documents.items()):
+            if predicate(chunk):
+                self._documents.pop(chunk_id)
+                self.deleted_chunk_ids.append(chunk_id)
+
+
+class FailingSecondIndexChunkStore(FakeChunkStore):
+    def __init__(self):
+        super().__init__()
+        self.index_calls = 0
+
+    async def index_chunks(self, chunks: list[ScriptChunk]) -> None:
+        self.index_calls += 1
+        if self.index_calls == 2:
+            raise RuntimeError("bulk index failed")
+        await super().index_chunks(chunks)
 
 
 class FakeStorageProvider:
@@ -213,6 +439,8 @@ class FakeStorageProvider:
         self._objects: dict[str, bytes] = {}
         self.deleted_objects: list[str] = []
         self.fail_on_delete: set[str] = set()
+        self.stat_calls: list[str] = []
+        self.copied_objects: list[tuple[str, str]] = []
 
     async def upload_file(
         self,
@@ -244,18 +472,97 @@ class FakeStorageProvider:
     async def get_object_bytes(self, object_name: str) -> bytes:
         return self._objects[object_name]
 
+    async def stat_object(self, object_name: str) -> StorageObjectStat | None:
+        self.stat_calls.append(object_name)
+        data = self._objects.get(object_name)
+        if data is None:
+            return None
+        return StorageObjectStat(object_name=object_name, size=len(data), etag=hashlib.md5(data).hexdigest())
+
     async def delete_object(self, object_name: str) -> None:
         if object_name in self.fail_on_delete:
             raise RuntimeError("storage deletion failed")
         self._objects.pop(object_name, None)
         self.deleted_objects.append(object_name)
 
+    async def copy_object(self, source_object_name: str, object_name: str) -> None:
+        self._objects[object_name] = self._objects[source_object_name]
+        self.copied_objects.append((source_object_name, object_name))
+
+    async def presigned_put_url(self, object_name: str, expires: timedelta) -> str:
+        return f"https://storage.test/{object_name}?method=PUT&expires={int(expires.total_seconds())}"
+
+    async def presigned_get_url(
+        self,
+        object_name: str,
+        expires: timedelta,
+        response_headers: dict[str, str] | None = None,
+    ) -> str:
+        query = urlencode({"method": "GET", "expires": int(expires.total_seconds()), **(response_headers or {})})
+        return f"https://storage.test/{object_name}?{query}"
+
+
+class FakeScriptChunkJobRepository:
+    def __init__(self):
+        self._jobs: dict[UUID, ScriptChunkJob] = {}
+        self.saved_statuses: list[str] = []
+
+    async def save(self, job: ScriptChunkJob) -> ScriptChunkJob:
+        self._jobs[job.id] = ScriptChunkJob(**vars(job))
+        self.saved_statuses.append(job.status.value)
+        return job
+
+    async def find_by_id(self, job_id: UUID) -> ScriptChunkJob | None:
+        return self._jobs.get(job_id)
+
+
+class CountingChunkEmbedder(HashingChunkEmbedder):
+    def __init__(self, dimensions: int = 16):
+        super().__init__(dimensions=dimensions)
+        self.embedded_texts: list[list[str]] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.embedded_texts.append(list(texts))
+        return await super().embed(texts)
+
+
+class FakeScriptChunkCache:
+    def __init__(self):
+        self._generations: dict[UUID, int] = {}
+        self._entries: dict[tuple[UUID, int], list[ScriptChunk]] = {}
+        self.hits = 0
+
+    async def get_generation(self, script_id: UUID) -> int:
+        return self._generations.get(script_id, 0)
+
+    async def get(self, script_id: UUID, generation: int) -> list[ScriptChunk] | None:
+        chunks = self._entries.get((script_id, generation))
+        if chunks is not None:
+            self.hits += 1
+        return chunks
+
+    async def set(self, script_id: UUID, generation: int, chunks: list[ScriptChunk]) -> bool:
+        self._entries[(script_id, generation)] = list(chunks)
+        return True
+
+    async def invalidate(self, script_ids: list[UUID]) -> None:
+        for script_id in script_ids:
+            self._generations[script_id] = self._generations.get(script_id, 0) + 1
+
+    def has_current_entry(self, script_id: UUID) -> bool:
+        return (script_id, self._generations.get(script_id, 0)) in self._entries
+
 
 def _create_service(
     repository: FakeScriptRepository | None = None,
     storage: FakeStorageProvider | None = None,
     chunk_store: FakeChunkStore | None = None,
     upload_max_text_length: int = 10000,
+    chunk_cache: FakeScriptChunkCache | None = None,
+    chunk_embedder: CountingChunkEmbedder | None = None,
+    avatar_thumbnailer: ImageThumbnailer | None = None,
+    avatar_cache: LibraryAvatarCache | None = None,
+    presigned_url_ttl: timedelta | None = None,
 ) -> ScriptAppService:
     return ScriptAppService(
         script_repository=repository or FakeScriptRepository(),
@@ -263,9 +570,32 @@ def _create_service(
         script_chunk_store=chunk_store or FakeChunkStore(),
         file_text_extractor=FileTextExtractor(),
         upload_max_text_length=upload_max_text_length,
+        chunk_cache=chunk_cache,
+        chunk_embedder=chunk_embedder,
+        avatar_thumbnailer=avatar_thumbnailer,
+        avatar_cache=avatar_cache,
+        presigned_url_ttl=presigned_url_ttl,
+        presigned_upload_max_bytes=1024 * 1024,
     )
 
 
+def _attach_chunk_job_runner(
+    service: ScriptAppService,
+    job_repository: FakeScriptChunkJobRepository,
+) -> ScriptChunkJobRunner:
+    @asynccontextmanager
+    async def _service_factory() -> AsyncIterator[ScriptAppService]:
+        yield service
+
+    runner = ScriptChunkJobRunner(
+        job_repository=job_repository,
+        service_factory=_service_factory,
+        max_concurrency=1,
+    )
+    service._chunk_job_runner = runner
+    return runner
+
+
 async def _prepare_library_with_script(service: ScriptAppService, filename: str, data: bytes) -> tuple[UUID, UUID, str]:
     library = await service.create_library(CreateScriptLibraryRequest(name="测试库", description=None))
     upload_file = UploadFile(file=BytesIO(data), filename=filename)
@@ -353,6 +683,8 @@ async def _test_script_app_service_upload_list_and_read_text_content():
 
     library_detail = await service.get_library(library.id)
     assert library_detail.script_count == 1
+    assert library_detail.total_file_size == upload_result.file_size
+    assert library_detail.last_script_updated_at is not None
 
     library_scripts = await service.list_library_scripts(library.id)
     assert len(library_scripts) == 1
@@ -364,23 +696,227 @@ def test_script_app_service_upload_list_and_read_text_content():
     asyncio.run(_test_script_app_service_upload_list_and_read_text_content())
 
 
-async def _test_script_app_service_upload_script_stores_object_under_text_folder():
+async def _test_script_app_service_upload_script_stores_content_addressed_blob():
     repository = FakeScriptRepository()
     storage = FakeStorageProvider()
     service = _create_service(repository=repository, storage=storage)
+    data = "脚本内容".encode("utf-8")
+    content_hash = hashlib.sha256(data).hexdigest()
 
     library = await service.create_library(CreateScriptLibraryRequest(name="路径测试", description=None))
-    await service.upload_script(
-        library.id,
-        UploadFile(file=BytesIO("脚本内容".encode("utf-8")), filename="path.txt"),
+    uploaded = await service.upload_script(library.id, UploadFile(file=BytesIO(data), filename="path.txt"))
+
+    script = await repository.find_by_id(uploaded.id)
+    assert script.storage_path.startswith(f"blobs/{content_hash[:2]}/{content_hash}/")
+    assert script.storage_path.endswith(".txt")
+    assert list(storage._objects) == [script.storage_path]
+
+
+def test_script_app_service_upload_script_stores_content_addressed_blob():
+    asyncio.run(_test_script_app_service_upload_script_stores_content_addressed_blob())
+
+
+class CountingStorageProvider(FakeStorageProvider):
+    def __init__(self):
+        super().__init__()
+        self.upload_count = 0
+
+    async def upload_file(
+        self,
+        object_name: str,
+        data_stream: BinaryIO,
+        data_size: int,
+        content_type: str | None = None,
+    ) -> str:
+        self.upload_count += 1
+        return await super().upload_file(object_name, data_stream, data_size, content_type)
+
+
+async def _test_script_app_service_upload_script_deduplicates_blobs_across_libraries():
+    repository = FakeScriptRepository()
+    storage = CountingStorageProvider()
+    service = _create_service(repository=repository, storage=storage)
+    data = "同一份剧本。".encode("utf-8")
+
+    first_library = await service.create_library(CreateScriptLibraryRequest(name="库一", description=None))
+    second_library = await service.create_library(CreateScriptLibraryRequest(name="库二", description=None))
+    first = await service.upload_script(first_library.id, UploadFile(file=BytesIO(data), filename="a.txt"))
+    second = await service.upload_script(second_library.id, UploadFile(file=BytesIO(data), filename="b.txt"))
+
+    first_script = await repository.find_by_id(first.id)
+    second_script = await repository.find_by_id(second.id)
+    assert storage.upload_count == 1
+    assert storage.copied_objects == []
+    assert list(storage._objects) == [first_script.storage_path]
+    assert first_script.storage_path == second_script.storage_path
+    assert repository._blobs[first.content_hash].ref_count == 2
+
+    await service.delete_script_from_library(first_library.id, first.id)
+    assert storage.deleted_objects == []
+    assert repository._blobs[first.content_hash].ref_count == 1
+
+    await service.delete_library(second_library.id)
+    assert storage.deleted_objects == [second_script.storage_path]
+    assert repository._blobs == {}
+
+
+def test_script_app_service_upload_script_deduplicates_blobs_across_libraries():
+    asyncio.run(_test_script_app_service_upload_script_deduplicates_blobs_across_libraries())
+
+
+class CountingReadChunkStore(FakeChunkStore):
+    def __init__(self):
+        super().__init__()
+        self.get_calls = 0
+
+    async def get_chunks(self, chunk_refs: list[ScriptChunk]) -> list[ScriptChunk]:
+        self.get_calls += 1
+        return await super().get_chunks(chunk_refs)
+
+
+class UnreadableStorageProvider(FakeStorageProvider):
+    def __init__(self):
+        super().__init__()
+        self.block_reads = False
+
+    @asynccontextmanager
+    async def open_object(self, object_name: str) -> AsyncIterator[BinaryIO]:
+        if self.block_reads:
+            raise AssertionError("duplicate script must reuse existing chunks")
+        yield BytesIO(self._objects[object_name])
+
+
+async def _test_script_app_service_execute_script_chunks_reuses_duplicate_script_chunks():
+    repository = FakeScriptRepository()
+    storage = UnreadableStorageProvider()
+    chunk_store = CountingReadChunkStore()
+    service = _create_service(repository=repository, storage=storage, chunk_store=chunk_store)
+    data = ("第一句。第二句。第三句。" * 40).encode("utf-8")
+
+    first_library = await service.create_library(CreateScriptLibraryRequest(name="源库", description=None))
+    second_library = await service.create_library(CreateScriptLibraryRequest(name="目标库", description=None))
+    first = await service.upload_script(first_library.id, UploadFile(file=BytesIO(data), filename="a.txt"))
+    second = await service.upload_script(second_library.id, UploadFile(file=BytesIO(data), filename="b.txt"))
+    first_chunks = await service.execute_script_chunks(first_library.id, first.id)
+
+    storage.block_reads = True
+    chunk_store.get_calls = 0
+    second_chunks = await service.execute_script_chunks(second_library.id, second.id)
+
+    # One read of the donor batch, one to hydrate the response.
+    assert chunk_store.get_calls == 2
+    assert [chunk.model_dump() for chunk in second_chunks] == [chunk.model_dump() for chunk in first_chunks]
+    second_refs = await repository.list_chunks(second.id, second_library.id)
+    assert all(chunk.library_id == second_library.id for chunk in second_refs)
+    assert len(chunk_store._documents) == len(first_chunks) * 2
+
+
+def test_script_app_service_execute_script_chunks_reuses_duplicate_script_chunks():
+    asyncio.run(_test_script_app_service_execute_script_chunks_reuses_duplicate_script_chunks())
+
+
+async def _test_script_app_service_execute_script_chunks_rebuilds_when_chunk_config_differs():
+    repository = FakeScriptRepository()
+    chunk_store = CountingReadChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    data = ("第一句。第二句。第三句。" * 40).encode("utf-8")
+
+    first_library = await service.create_library(CreateScriptLibraryRequest(name="源库", description=None))
+    second_library = await service.create_library(CreateScriptLibraryRequest(name="小切片库", description=None))
+    await service.update_library_config(
+        second_library.id,
+        request=UpdateScriptLibraryConfigRequest(chunk_size=100, overlap=10),
     )
+    first = await service.upload_script(first_library.id, UploadFile(file=BytesIO(data), filename="a.txt"))
+    second = await service.upload_script(second_library.id, UploadFile(file=BytesIO(data), filename="b.txt"))
+    await service.execute_script_chunks(first_library.id, first.id)
+    chunk_store.get_calls = 0
 
-    object_name = next(iter(storage._objects.keys()))
-    assert object_name.startswith(f"{library.id}/text/")
+    second_chunks = await service.execute_script_chunks(second_library.id, second.id)
+
+    # Only the response is hydrated; the donor chunks are not read.
+    assert chunk_store.get_calls == 1
+    assert max(chunk.chunk_size for chunk in second_chunks) <= 100
+
+
+def test_script_app_service_execute_script_chunks_rebuilds_when_chunk_config_differs():
+    asyncio.run(_test_script_app_service_execute_script_chunks_rebuilds_when_chunk_config_differs())
+
+
+async def _test_script_app_service_upload_script_records_content_hash():
+    repository = FakeScriptRepository()
+    service = _create_service(repository=repository)
+    data = "脚本内容".encode("utf-8")
+
+    library = await service.create_library(CreateScriptLibraryRequest(name="哈希测试", description=None))
+    uploaded = await service.upload_script(library.id, UploadFile(file=BytesIO(data), filename="hash.txt"))
+
+    stored_script = await repository.find_by_id(uploaded.id)
+    assert uploaded.content_hash == hashlib.sha256(data).hexdigest()
+    assert stored_script.content_hash == uploaded.content_hash
+
+
+def test_script_app_service_upload_script_records_content_hash():
+    asyncio.run(_test_script_app_service_upload_script_records_content_hash())
+
+
+class BlockingDeleteStorageProvider(FakeStorageProvider):
+    def __init__(self):
+        super().__init__()
+        self.delete_requested = asyncio.Event()
+        self.allow_delete = asyncio.Event()
+
+    async def delete_object(self, object_name: str) -> None:
+        self.delete_requested.set()
+        await self.allow_delete.wait()
+        await super().delete_object(object_name)
+
+
+class InterleavingBlobRepository(FakeScriptRepository):
+    def __init__(self):
+        super().__init__()
+        self.after_find_blob: Callable[[], Awaitable[None]] | None = None
+
+    async def find_blob(self, content_hash: str) -> ScriptBlob | None:
+        blob = await super().find_blob(content_hash)
+        if self.after_find_blob is not None:
+            hook, self.after_find_blob = self.after_find_blob, None
+            await hook()
+        return blob
+
+
+async def _test_script_app_service_upload_script_survives_concurrent_blob_release():
+    repository = InterleavingBlobRepository()
+    storage = BlockingDeleteStorageProvider()
+    service = _create_service(repository=repository, storage=storage)
+    data = "并发释放的剧本。".encode("utf-8")
+    storage.allow_delete.set()
+    library = await service.create_library(CreateScriptLibraryRequest(name="并发", description=None))
+    first = await service.upload_script(library.id, UploadFile(file=BytesIO(data), filename="a.txt"))
+    first_object_name = (await repository.find_by_id(first.id)).storage_path
+    storage.allow_delete.clear()
+    release_task = None
+
+    async def _release_after_lookup() -> None:
+        nonlocal release_task
+        # The release commits its row delete, then stalls before removing the object.
+        release_task = asyncio.create_task(service.delete_script_from_library(library.id, first.id))
+        await storage.delete_requested.wait()
 
+    repository.after_find_blob = _release_after_lookup
+    second = await service.upload_script(library.id, UploadFile(file=BytesIO(data), filename="b.txt"))
+    storage.allow_delete.set()
+    await release_task
 
-def test_script_app_service_upload_script_stores_object_under_text_folder():
-    asyncio.run(_test_script_app_service_upload_script_stores_object_under_text_folder())
+    second_script = await repository.find_by_id(second.id)
+    assert second_script.storage_path != first_object_name
+    assert repository._blobs[second.content_hash].storage_path == second_script.storage_path
+    assert repository._blobs[second.content_hash].ref_count == 1
+    assert storage._objects == {second_script.storage_path: data}
+
+
+def test_script_app_service_upload_script_survives_concurrent_blob_release():
+    asyncio.run(_test_script_app_service_upload_script_survives_concurrent_blob_release())
 
 
 async def _test_script_app_service_upload_library_avatar_stores_object_under_image_folder():
@@ -434,6 +970,90 @@ def test_script_app_service_get_library_avatar_requires_existing_avatar():
     asyncio.run(_test_script_app_service_get_library_avatar_requires_existing_avatar())
 
 
+class CountingReadStorageProvider(FakeStorageProvider):
+    def __init__(self):
+        super().__init__()
+        self.read_objects: list[str] = []
+
+    async def get_object_bytes(self, object_name: str) -> bytes:
+        self.read_objects.append(object_name)
+        return await super().get_object_bytes(object_name)
+
+
+def _png_bytes(width: int, height: int) -> bytes:
+    from PIL import Image
+
+    buffer = BytesIO()
+    Image.new("RGBA", (width, height), (200, 80, 40, 255)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def _test_script_app_service_upload_library_avatar_stores_thumbnails():
+    from PIL import Image
+
+    storage = FakeStorageProvider()
+    service = _create_service(storage=storage, avatar_thumbnailer=ImageThumbnailer())
+    library = await service.create_library(CreateScriptLibraryRequest(name="缩略图", description=None))
+
+    await service.upload_library_avatar(library.id, UploadFile(file=BytesIO(_png_bytes(800, 400)), filename="avatar.png"))
+
+    for size in (64, 256):
+        with Image.open(BytesIO(storage._objects[f"{library.id}/image/avatar-{size}.webp"])) as thumbnail:
+            assert thumbnail.size == (size, size // 2)
+
+    small = await service.open_library_avatar(library.id, size=48)
+    assert (small.object_name, small.content_type) == (f"{library.id}/image/avatar-64.webp", "image/webp")
+    medium = await service.open_library_avatar(library.id, size=200)
+    assert medium.object_name == f"{library.id}/image/avatar-256.webp"
+    original = await service.open_library_avatar(library.id, size=1024)
+    assert (original.object_name, original.content_type) == (f"{library.id}/image/avatar.png", "image/png")
+
+    await service.delete_library(library.id)
+    assert storage._objects == {}
+
+
+def test_script_app_service_upload_library_avatar_stores_thumbnails():
+    asyncio.run(_test_script_app_service_upload_library_avatar_stores_thumbnails())
+
+
+async def _test_script_app_service_library_avatar_falls_back_to_original_without_thumbnails():
+    storage = FakeStorageProvider()
+    service = _create_service(storage=storage, avatar_thumbnailer=ImageThumbnailer())
+    library = await service.create_library(CreateScriptLibraryRequest(name="无缩略图", description=None))
+    await service.upload_library_avatar(library.id, UploadFile(file=BytesIO(_png_bytes(300, 300)), filename="avatar.png"))
+    assert f"{library.id}/image/avatar-64.webp" in storage._objects
+
+    service._avatar_thumbnailer = None
+    await service.upload_library_avatar(library.id, UploadFile(file=BytesIO(b"not-decodable"), filename="avatar.jpg"))
+
+    assert sorted(name for name in storage._objects if name.startswith(str(library.id))) == [f"{library.id}/image/avatar.jpg"]
+    avatar = await service.open_library_avatar(library.id, size=64)
+    assert avatar.object_name == f"{library.id}/image/avatar.jpg"
+
+
+def test_script_app_service_library_avatar_falls_back_to_original_without_thumbnails():
+    asyncio.run(_test_script_app_service_library_avatar_falls_back_to_original_without_thumbnails())
+
+
+async def _test_script_app_service_read_library_avatar_uses_cache_until_replaced():
+    storage = CountingReadStorageProvider()
+    service = _create_service(storage=storage, avatar_cache=LibraryAvatarCache(max_bytes=1024))
+    library = await service.create_library(CreateScriptLibraryRequest(name="缓存", description=None))
+    await service.upload_library_avatar(library.id, UploadFile(file=BytesIO(b"first"), filename="avatar.png"))
+
+    for _ in range(3):
+        assert await service.get_library_avatar(library.id) == (b"first", "image/png")
+    assert storage.read_objects == [f"{library.id}/image/avatar.png"]
+
+    await service.upload_library_avatar(library.id, UploadFile(file=BytesIO(b"second"), filename="avatar.png"))
+    assert await service.get_library_avatar(library.id) == (b"second", "image/png")
+    assert len(storage.read_objects) == 2
+
+
+def test_script_app_service_read_library_avatar_uses_cache_until_replaced():
+    asyncio.run(_test_script_app_service_read_library_avatar_uses_cache_until_replaced())
+
+
 async def _test_script_app_service_list_library_scripts_returns_chunk_count():
     repository = FakeScriptRepository()
     chunk_store = FakeChunkStore()
@@ -476,71 +1096,268 @@ def test_script_app_service_upload_rejects_file_over_text_limit():
     asyncio.run(_test_script_app_service_upload_rejects_file_over_text_limit())
 
 
-async def _test_script_app_service_list_library_scripts_requires_library():
-    service = _create_service()
-    with pytest.raises(ScriptLibraryNotFoundException):
-        await service.list_library_scripts(UUID("00000000-0000-0000-0000-000000000001"))
-
-
-def test_script_app_service_list_library_scripts_requires_library():
-    asyncio.run(_test_script_app_service_list_library_scripts_requires_library())
+async def _stage_presigned_upload(
+    service: ScriptAppService,
+    storage: FakeStorageProvider,
+    library_id: UUID,
+    filename: str,
+    data: bytes,
+) -> UUID:
+    presigned = await service.presign_script_upload(
+        library_id,
+        PresignScriptUploadRequest(filename=filename, file_size=len(data)),
+    )
+    # Stands in for the client PUT-ing the bytes straight to object storage.
+    storage._objects[urlparse(presigned.upload_url).path.lstrip("/")] = data
+    return presigned.upload_id
 
 
-async def _test_script_app_service_delete_script_from_library():
+async def _test_script_app_service_presigned_upload_registers_staged_object():
     storage = FakeStorageProvider()
-    chunk_store = FakeChunkStore()
-    service = _create_service(storage=storage, chunk_store=chunk_store)
+    repository = FakeScriptRepository()
+    service = _create_service(repository=repository, storage=storage, presigned_url_ttl=timedelta(minutes=15))
+    library = await service.create_library(CreateScriptLibraryRequest(name="直传", description=None))
+    data = "第一场 日 内\n张三：你好。".encode("utf-8")
 
-    library_id, script_id, _ = await _prepare_library_with_script(
-        service,
-        filename="demo.txt",
-        data="删除测试".encode("utf-8"),
+    presigned = await service.presign_script_upload(
+        library.id,
+        PresignScriptUploadRequest(filename="play.txt", file_size=len(data)),
     )
-    chunks = await service.get_script_chunks(library_id, script_id)
+    staged_object_name = urlparse(presigned.upload_url).path.lstrip("/")
+    assert staged_object_name == f"uploads/{library.id}/{presigned.upload_id}.txt"
+    assert presigned.method == "PUT"
+    storage._objects[staged_object_name] = data
 
-    result = await service.delete_script_from_library(library_id, script_id)
-    assert result.message == "Script deleted successfully"
-    assert len(storage.deleted_objects) == 1
-    assert len(chunk_store.deleted_chunk_ids) == len(chunks)
+    uploaded = await service.finalize_presigned_script_upload(
+        library.id,
+        FinalizeScriptUploadRequest(upload_id=presigned.upload_id, filename="play.txt"),
+    )
 
+    script = await repository.find_by_id(uploaded.id)
+    assert script.original_name == "play.txt"
+    assert script.content_type == "text/plain"
+    assert script.content_hash == hashlib.sha256(data).hexdigest()
+    assert storage.copied_objects == [(staged_object_name, script.storage_path)]
+    assert storage._objects[script.storage_path] == data
+    assert staged_object_name not in storage._objects
+
+    upload_id = await _stage_presigned_upload(service, storage, library.id, "copy.txt", data)
+    duplicate = await service.finalize_presigned_script_upload(
+        library.id,
+        FinalizeScriptUploadRequest(upload_id=upload_id, filename="copy.txt"),
+    )
+    assert (await repository.find_by_id(duplicate.id)).storage_path == script.storage_path
+    assert len(storage.copied_objects) == 1
 
-def test_script_app_service_delete_script_from_library():
-    asyncio.run(_test_script_app_service_delete_script_from_library())
 
+def test_script_app_service_presigned_upload_registers_staged_object():
+    asyncio.run(_test_script_app_service_presigned_upload_registers_staged_object())
 
-async def _test_script_app_service_delete_script_from_library_keeps_db_consistent_on_storage_failure():
+
+async def _test_script_app_service_presigned_upload_rejects_invalid_uploads():
     storage = FakeStorageProvider()
-    chunk_store = FakeChunkStore()
-    service = _create_service(storage=storage, chunk_store=chunk_store)
+    service = _create_service(storage=storage, upload_max_text_length=5, presigned_url_ttl=timedelta(minutes=15))
+    library = await service.create_library(CreateScriptLibraryRequest(name="校验", description=None))
 
-    library_id, script_id, _ = await _prepare_library_with_script(
-        service,
-        filename="demo.txt",
-        data="删除测试".encode("utf-8"),
-    )
-    await service.get_script_chunks(library_id, script_id)
-    object_name = next(iter(storage._objects.keys()))
-    storage.fail_on_delete.add(object_name)
+    with pytest.raises(ValidationException):
+        await service.presign_script_upload(
+            library.id,
+            PresignScriptUploadRequest(filename="huge.txt", file_size=1024 * 1024 + 1),
+        )
+    with pytest.raises(ValidationException):
+        await service.finalize_presigned_script_upload(
+            library.id,
+            FinalizeScriptUploadRequest(upload_id=uuid4(), filename="missing.txt"),
+        )
 
-    with pytest.raises(StorageCleanupError):
-        await service.delete_script_from_library(library_id, script_id)
-    assert await service.list_library_scripts(library_id) == []
+    upload_id = await _stage_presigned_upload(service, storage, library.id, "long.txt", "超过五个字的文本".encode("utf-8"))
+    with pytest.raises(ScriptTextTooLongError):
+        await service.finalize_presigned_script_upload(
+            library.id,
+            FinalizeScriptUploadRequest(upload_id=upload_id, filename="long.txt"),
+        )
+    assert storage._objects == {}
+    assert await service.list_library_scripts(library.id) == []
 
 
-def test_script_app_service_delete_script_from_library_keeps_db_consistent_on_storage_failure():
-    asyncio.run(_test_script_app_service_delete_script_from_library_keeps_db_consistent_on_storage_failure())
+def test_script_app_service_presigned_upload_rejects_invalid_uploads():
+    asyncio.run(_test_script_app_service_presigned_upload_rejects_invalid_uploads())
 
 
-async def _test_script_app_service_delete_library_with_scripts():
+async def _test_script_app_service_presigned_downloads():
     storage = FakeStorageProvider()
-    chunk_store = FakeChunkStore()
-    service = _create_service(storage=storage, chunk_store=chunk_store)
+    service = _create_service(storage=storage, presigned_url_ttl=timedelta(minutes=5))
+    library_id, script_id, _ = await _prepare_library_with_script(service, "剧本.txt", "内容".encode("utf-8"))
+    await service.upload_library_avatar(library_id, UploadFile(file=BytesIO(b"avatar"), filename="avatar.png"))
 
-    library = await service.create_library(CreateScriptLibraryRequest(name="可删除剧本库", description=None))
-    for index in range(2):
-        upload_file = UploadFile(
-            file=BytesIO(f"内容{index}".encode("utf-8")),
-            filename=f"demo{index}.txt",
+    download = await service.presign_script_download(library_id, script_id)
+    query = parse_qs(urlparse(download.url).query)
+    assert query["expires"] == ["300"]
+    assert query["response-content-disposition"] == ["attachment; filename*=UTF-8''%E5%89%A7%E6%9C%AC.txt"]
+
+    avatar = await service.presign_library_avatar_download(library_id, size=64)
+    assert urlparse(avatar.url).path == f"/{library_id}/image/avatar.png"
+    assert parse_qs(urlparse(avatar.url).query)["response-content-type"] == ["image/png"]
+
+    disabled = _create_service(storage=storage)
+    with pytest.raises(PresignedTransferUnavailableError):
+        await disabled.presign_script_download(library_id, script_id)
+    with pytest.raises(PresignedTransferUnavailableError):
+        await disabled.presign_script_upload(library_id, PresignScriptUploadRequest(filename="a.txt", file_size=1))
+
+
+def test_script_app_service_presigned_downloads():
+    asyncio.run(_test_script_app_service_presigned_downloads())
+
+
+def _docx_bytes(paragraphs: list[str]) -> bytes:
+    from docx import Document
+
+    document = Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _text_sidecar_names(storage: FakeStorageProvider) -> list[str]:
+    return [name for name in storage._objects if name.endswith(".txt") and ".text-v" in name]
+
+
+async def _test_script_app_service_upload_docx_stores_text_sidecar_used_by_chunking(monkeypatch):
+    storage = FakeStorageProvider()
+    repository = FakeScriptRepository()
+    service = _create_service(repository=repository, storage=storage)
+    paragraphs = ["第一场。", "张三：你好。", "李四：再见。"]
+    library_id, script_id, _ = await _prepare_library_with_script(service, "play.docx", _docx_bytes(paragraphs))
+
+    sidecar_names = _text_sidecar_names(storage)
+    assert len(sidecar_names) == 1
+    script = await repository.find_by_id(script_id)
+    assert sidecar_names[0].startswith(f"{script.storage_path}.{script.content_hash[:32]}.")
+    assert storage._objects[sidecar_names[0]].decode("utf-8") == "".join(f"{text}\n" for text in paragraphs)
+
+    def _fail_extract(*args, **kwargs):
+        raise AssertionError("chunking should read the text sidecar instead of re-parsing the DOCX")
+
+    monkeypatch.setattr(service._file_text_extractor, "iter_text_segments_from_stream", _fail_extract)
+    chunks = await service.execute_script_chunks(library_id, script_id)
+
+    assert [chunk.content for chunk in chunks] == ["第一场。\n张三：你好。\n李四：再见。"]
+
+
+def test_script_app_service_upload_docx_stores_text_sidecar_used_by_chunking(monkeypatch):
+    asyncio.run(_test_script_app_service_upload_docx_stores_text_sidecar_used_by_chunking(monkeypatch))
+
+
+async def _test_script_app_service_chunking_rebuilds_missing_text_sidecar():
+    storage = FakeStorageProvider()
+    service = _create_service(storage=storage)
+    library_id, script_id, _ = await _prepare_library_with_script(service, "play.docx", _docx_bytes(["第一句。", "第二句。"]))
+    sidecar_name = _text_sidecar_names(storage)[0]
+    del storage._objects[sidecar_name]
+
+    first = await service.execute_script_chunks(library_id, script_id)
+    assert storage._objects[sidecar_name].decode("utf-8") == "第一句。\n第二句。\n"
+
+    process_pool = InProcessChunkProcessPool()
+    service._chunk_process_pool = process_pool
+    del storage._objects[sidecar_name]
+    second = await service.execute_script_chunks(library_id, script_id, use_process_pool=True)
+    assert storage._objects[sidecar_name].decode("utf-8") == "第一句。\n第二句。\n"
+    assert process_pool.calls == [("docx", 500, 50)]
+
+    third = await service.execute_script_chunks(library_id, script_id, use_process_pool=True)
+    assert process_pool.calls == [("docx", 500, 50)]
+    assert [chunk.content for chunk in first] == [chunk.content for chunk in second] == [chunk.content for chunk in third]
+
+
+def test_script_app_service_chunking_rebuilds_missing_text_sidecar():
+    asyncio.run(_test_script_app_service_chunking_rebuilds_missing_text_sidecar())
+
+
+async def _test_script_app_service_delete_script_removes_text_sidecar():
+    storage = FakeStorageProvider()
+    service = _create_service(storage=storage)
+    library_id, script_id, _ = await _prepare_library_with_script(service, "play.docx", _docx_bytes(["内容。"]))
+    sidecar_name = _text_sidecar_names(storage)[0]
+
+    await service.delete_script_from_library(library_id, script_id)
+
+    assert sidecar_name in storage.deleted_objects
+    assert storage._objects == {}
+
+
+def test_script_app_service_delete_script_removes_text_sidecar():
+    asyncio.run(_test_script_app_service_delete_script_removes_text_sidecar())
+
+
+async def _test_script_app_service_list_library_scripts_requires_library():
+    service = _create_service()
+    with pytest.raises(ScriptLibraryNotFoundException):
+        await service.list_library_scripts(UUID("00000000-0000-0000-0000-000000000001"))
+
+
+def test_script_app_service_list_library_scripts_requires_library():
+    asyncio.run(_test_script_app_service_list_library_scripts_requires_library())
+
+
+async def _test_script_app_service_delete_script_from_library():
+    storage = FakeStorageProvider()
+    chunk_store = FakeChunkStore()
+    service = _create_service(storage=storage, chunk_store=chunk_store)
+
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        filename="demo.txt",
+        data="删除测试".encode("utf-8"),
+    )
+    chunks = await service.get_script_chunks(library_id, script_id)
+
+    result = await service.delete_script_from_library(library_id, script_id)
+    assert result.message == "Script deleted successfully"
+    assert len(storage.deleted_objects) == 1
+    assert len(chunk_store.deleted_chunk_ids) == len(chunks)
+
+
+def test_script_app_service_delete_script_from_library():
+    asyncio.run(_test_script_app_service_delete_script_from_library())
+
+
+async def _test_script_app_service_delete_script_from_library_keeps_db_consistent_on_storage_failure():
+    storage = FakeStorageProvider()
+    chunk_store = FakeChunkStore()
+    service = _create_service(storage=storage, chunk_store=chunk_store)
+
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        filename="demo.txt",
+        data="删除测试".encode("utf-8"),
+    )
+    await service.get_script_chunks(library_id, script_id)
+    object_name = next(iter(storage._objects.keys()))
+    storage.fail_on_delete.add(object_name)
+
+    with pytest.raises(StorageCleanupError):
+        await service.delete_script_from_library(library_id, script_id)
+    assert await service.list_library_scripts(library_id) == []
+
+
+def test_script_app_service_delete_script_from_library_keeps_db_consistent_on_storage_failure():
+    asyncio.run(_test_script_app_service_delete_script_from_library_keeps_db_consistent_on_storage_failure())
+
+
+async def _test_script_app_service_delete_library_with_scripts():
+    storage = FakeStorageProvider()
+    chunk_store = FakeChunkStore()
+    service = _create_service(storage=storage, chunk_store=chunk_store)
+
+    library = await service.create_library(CreateScriptLibraryRequest(name="可删除剧本库", description=None))
+    for index in range(2):
+        upload_file = UploadFile(
+            file=BytesIO(f"内容{index}".encode("utf-8")),
+            filename=f"demo{index}.txt",
         )
         uploaded = await service.upload_script(library.id, upload_file)
         await service.get_script_chunks(library.id, uploaded.id)
@@ -559,6 +1376,512 @@ def test_script_app_service_delete_library_with_scripts():
     asyncio.run(_test_script_app_service_delete_library_with_scripts())
 
 
+async def _test_script_app_service_execute_script_chunks_keeps_unchanged_chunk_documents():
+    repository = FakeScriptRepository()
+    chunk_store = FakeChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        "same.txt",
+        ("不变的内容。" * 300).encode("utf-8"),
+    )
+    await service.execute_script_chunks(library_id, script_id)
+    old_refs = await repository.list_chunks(script_id, library_id)
+    chunk_store.indexed_chunk_ids.clear()
+
+    await service.execute_script_chunks(library_id, script_id)
+
+    new_refs = await repository.list_chunks(script_id, library_id)
+    assert [chunk.id for chunk in new_refs] == [chunk.id for chunk in old_refs]
+    assert chunk_store.indexed_chunk_ids == []
+    assert chunk_store.delete_calls == []
+
+
+def test_script_app_service_execute_script_chunks_keeps_unchanged_chunk_documents():
+    asyncio.run(_test_script_app_service_execute_script_chunks_keeps_unchanged_chunk_documents())
+
+
+async def _test_script_app_service_execute_script_chunks_only_touches_changed_tail():
+    repository = FakeScriptRepository()
+    storage = FakeStorageProvider()
+    chunk_store = FakeChunkStore()
+    service = _create_service(repository=repository, storage=storage, chunk_store=chunk_store)
+    library = await service.create_library(CreateScriptLibraryRequest(name="增量", description=None))
+    await service.update_library_config(library.id, request=UpdateScriptLibraryConfigRequest(chunk_size=50, overlap=0))
+    sentences = [f"第{index:03d}句内容。" for index in range(200)]
+    uploaded = await service.upload_script(
+        library.id,
+        UploadFile(file=BytesIO("".join(sentences).encode("utf-8")), filename="tail.txt"),
+    )
+    await service.execute_script_chunks(library.id, uploaded.id)
+    old_refs = await repository.list_chunks(uploaded.id, library.id)
+    chunk_store.indexed_chunk_ids.clear()
+
+    script = await repository.find_by_id(uploaded.id)
+    storage._objects[script.storage_path] = ("".join(sentences[:-10]) + "改写的结尾。").encode("utf-8")
+    await service.execute_script_chunks(library.id, uploaded.id)
+
+    new_refs = await repository.list_chunks(uploaded.id, library.id)
+    kept_ids = {chunk.id for chunk in old_refs} & {chunk.id for chunk in new_refs}
+    removed_ids = {chunk.id for chunk in old_refs} - kept_ids
+    assert len(kept_ids) >= len(old_refs) - 4
+    assert set(chunk_store.indexed_chunk_ids) == {chunk.id for chunk in new_refs} - kept_ids
+    assert set(chunk_store.deleted_chunk_ids) == removed_ids
+
+
+def test_script_app_service_execute_script_chunks_only_touches_changed_tail():
+    asyncio.run(_test_script_app_service_execute_script_chunks_only_touches_changed_tail())
+
+
+async def _test_script_app_service_execute_script_chunks_reindexes_missing_documents():
+    repository = FakeScriptRepository()
+    chunk_store = FakeChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        "lost.txt",
+        ("丢失的文档。" * 300).encode("utf-8"),
+    )
+    await service.execute_script_chunks(library_id, script_id)
+    old_refs = await repository.list_chunks(script_id, library_id)
+    lost_chunk_id = old_refs[1].id
+    chunk_store._documents.pop(lost_chunk_id)
+    chunk_store.indexed_chunk_ids.clear()
+
+    await service.get_script_chunks(library_id, script_id)
+
+    assert chunk_store.indexed_chunk_ids == [lost_chunk_id]
+    assert [chunk.id for chunk in await repository.list_chunks(script_id, library_id)] == [
+        chunk.id for chunk in old_refs
+    ]
+
+
+def test_script_app_service_execute_script_chunks_reindexes_missing_documents():
+    asyncio.run(_test_script_app_service_execute_script_chunks_reindexes_missing_documents())
+
+
+class ToggleFailingReplaceChunkRepository(FakeScriptRepository):
+    def __init__(self):
+        super().__init__()
+        self.fail_replace_chunks = False
+
+    async def replace_chunks(
+        self,
+        script_id: UUID,
+        library_id: UUID,
+        chunks: list[ScriptChunk],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+    ) -> None:
+        if self.fail_replace_chunks:
+            raise RuntimeError("replace chunk refs failed")
+        await super().replace_chunks(script_id, library_id, chunks, chunk_size, chunk_overlap)
+
+
+async def _test_script_app_service_execute_script_chunks_keeps_shifted_documents_on_rollback():
+    repository = ToggleFailingReplaceChunkRepository()
+    chunk_store = FakeChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        "shift.txt",
+        ("位移的内容。" * 300).encode("utf-8"),
+    )
+    await service.execute_script_chunks(library_id, script_id)
+    old_refs = await repository.list_chunks(script_id, library_id)
+    for chunk in old_refs:
+        chunk.index_id += 1
+    old_documents = {chunk.id: chunk_store._documents[chunk.id].index_id for chunk in old_refs}
+
+    repository.fail_replace_chunks = True
+    with pytest.raises(RuntimeError):
+        await service.execute_script_chunks(library_id, script_id)
+
+    assert {chunk_id: document.index_id for chunk_id, document in chunk_store._documents.items()} == old_documents
+    assert [chunk.id for chunk in await repository.list_chunks(script_id, library_id)] == [
+        chunk.id for chunk in old_refs
+    ]
+
+    repository.fail_replace_chunks = False
+    await service.execute_script_chunks(library_id, script_id)
+
+    new_refs = await repository.list_chunks(script_id, library_id)
+    assert {chunk.id for chunk in new_refs}.isdisjoint(old_documents)
+    assert {chunk_id: document.index_id for chunk_id, document in chunk_store._documents.items()} == {
+        chunk.id: chunk.index_id for chunk in new_refs
+    }
+
+
+def test_script_app_service_execute_script_chunks_keeps_shifted_documents_on_rollback():
+    asyncio.run(_test_script_app_service_execute_script_chunks_keeps_shifted_documents_on_rollback())
+
+
+async def _test_script_app_service_execute_script_chunks_deletes_old_documents_in_one_batch():
+    repository = FakeScriptRepository()
+    storage = FakeStorageProvider()
+    chunk_store = FakeChunkStore()
+    service = _create_service(repository=repository, storage=storage, chunk_store=chunk_store)
+
+    library = await service.create_library(CreateScriptLibraryRequest(name="批量删除", description=None))
+    uploaded = await service.upload_script(
+        library.id,
+        UploadFile(file=BytesIO(("旧内容。" * 260).encode("utf-8")), filename="batch.txt"),
+    )
+    await service.get_script_chunks(library.id, uploaded.id)
+    old_refs = await repository.list_chunks(uploaded.id, library.id)
+    assert len(old_refs) > 1
+    stuck_chunk_id = old_refs[0].id
+    chunk_store.fail_on_delete.add(stuck_chunk_id)
+    script = await repository.find_by_id(uploaded.id)
+    storage._objects[script.storage_path] = ("新内容。" * 260).encode("utf-8")
+
+    await service.execute_script_chunks(library.id, uploaded.id)
+
+    assert chunk_store.delete_calls[0] == [chunk.id for chunk in old_refs]
+    assert chunk_store.delete_calls[1:] == [[stuck_chunk_id], [stuck_chunk_id]]
+    assert set(chunk_store.deleted_chunk_ids) == {chunk.id for chunk in old_refs[1:]}
+
+
+def test_script_app_service_execute_script_chunks_deletes_old_documents_in_one_batch():
+    asyncio.run(_test_script_app_service_execute_script_chunks_deletes_old_documents_in_one_batch())
+
+
+async def _test_script_app_service_submit_script_chunk_job_runs_in_background():
+    repository = FakeScriptRepository()
+    chunk_store = FakeChunkStore()
+    job_repository = FakeScriptChunkJobRepository()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    runner = _attach_chunk_job_runner(service, job_repository)
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        "job.txt",
+        "第一句。第二句。第三句。".encode("utf-8"),
+    )
+
+    submitted = await service.submit_script_chunk_job(library_id, script_id)
+    assert submitted.status == "pending"
+
+    await runner.wait_idle()
+    job = await service.get_script_chunk_job(library_id, submitted.id)
+
+    assert job.status == "succeeded"
+    assert job.extracted_segments >= 1
+    assert job.total_chunks > 0
+    assert job.indexed_chunks == job.total_chunks
+    assert job.finished_at is not None
+    assert job_repository.saved_statuses[:2] == ["pending", "running"]
+    assert len(await repository.list_chunks(script_id, library_id)) == job.total_chunks
+    assert len(chunk_store._documents) == job.total_chunks
+
+
+def test_script_app_service_submit_script_chunk_job_runs_in_background():
+    asyncio.run(_test_script_app_service_submit_script_chunk_job_runs_in_background())
+
+
+class RecordingReplaceChunkRepository(FakeScriptRepository):
+    def __init__(self):
+        super().__init__()
+        self.replaced_chunks: list[ScriptChunk] = []
+
+    async def replace_chunks(
+        self,
+        script_id: UUID,
+        library_id: UUID,
+        chunks: list[ScriptChunk],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+    ) -> None:
+        self.replaced_chunks = list(chunks)
+        await super().replace_chunks(script_id, library_id, chunks, chunk_size, chunk_overlap)
+
+
+async def _test_script_app_service_rebuild_script_chunks_keeps_only_chunk_refs(monkeypatch):
+    monkeypatch.setattr(script_app_service_module, "CHUNK_PIPELINE_BATCH_SIZE", 4)
+    repository = RecordingReplaceChunkRepository()
+    chunk_store = CountingReadChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        "refs.txt",
+        ("只保留引用。" * 300).encode("utf-8"),
+    )
+    await service.update_library_config(library_id, UpdateScriptLibraryConfigRequest(chunk_size=50, overlap=0))
+
+    chunk_count = await service.rebuild_script_chunks(library_id, script_id)
+
+    assert chunk_count == len(repository.replaced_chunks) > 4
+    assert all(chunk.content == "" and chunk.embedding is None for chunk in repository.replaced_chunks)
+    assert [chunk.index_id for chunk in repository.replaced_chunks] == list(range(chunk_count))
+    assert len(chunk_store._documents) == chunk_count
+    assert chunk_store.get_calls == 0
+
+
+def test_script_app_service_rebuild_script_chunks_keeps_only_chunk_refs(monkeypatch):
+    asyncio.run(_test_script_app_service_rebuild_script_chunks_keeps_only_chunk_refs(monkeypatch))
+
+
+async def _test_script_app_service_script_chunk_job_records_failure():
+    repository = FailingReplaceChunkRepository()
+    job_repository = FakeScriptChunkJobRepository()
+    service = _create_service(repository=repository)
+    runner = _attach_chunk_job_runner(service, job_repository)
+    library_id, script_id, _ = await _prepare_library_with_script(
+        service,
+        "job.txt",
+        "第一句。第二句。".encode("utf-8"),
+    )
+
+    submitted = await service.submit_script_chunk_job(library_id, script_id)
+    await runner.wait_idle()
+    job = await service.get_script_chunk_job(library_id, submitted.id)
+
+    assert job.status == "failed"
+    assert job.error
+
+
+def test_script_app_service_script_chunk_job_records_failure():
+    asyncio.run(_test_script_app_service_script_chunk_job_records_failure())
+
+
+async def _test_script_app_service_get_script_chunk_job_requires_same_library():
+    service = _create_service()
+    runner = _attach_chunk_job_runner(service, FakeScriptChunkJobRepository())
+    library_id, script_id, _ = await _prepare_library_with_script(service, "job.txt", "内容。".encode("utf-8"))
+    other_library = await service.create_library(CreateScriptLibraryRequest(name="其他库", description=None))
+
+    submitted = await service.submit_script_chunk_job(library_id, script_id)
+    await runner.wait_idle()
+
+    with pytest.raises(ScriptChunkJobNotFoundException):
+        await service.get_script_chunk_job(other_library.id, submitted.id)
+
+
+def test_script_app_service_get_script_chunk_job_requires_same_library():
+    asyncio.run(_test_script_app_service_get_script_chunk_job_requires_same_library())
+
+
+async def _test_script_app_service_upload_script_auto_chunks_when_enabled():
+    repository = FakeScriptRepository()
+    chunk_store = FakeChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    runner = _attach_chunk_job_runner(service, FakeScriptChunkJobRepository())
+    library = await service.create_library(CreateScriptLibraryRequest(name="自动切片", description=None))
+    await service.update_library_config(
+        library.id,
+        request=UpdateScriptLibraryConfigRequest(chunk_size=500, overlap=50, auto_chunk_on_upload=True),
+    )
+
+    uploaded = await service.upload_script(
+        library.id,
+        UploadFile(file=BytesIO("第一句。第二句。".encode("utf-8")), filename="auto.txt"),
+    )
+    await runner.wait_idle()
+
+    job = await service.get_script_chunk_job(library.id, uploaded.chunk_job_id)
+    assert job.status == "succeeded"
+    assert await repository.list_chunks(uploaded.id, library.id)
+    assert chunk_store._documents
+
+
+def test_script_app_service_upload_script_auto_chunks_when_enabled():
+    asyncio.run(_test_script_app_service_upload_script_auto_chunks_when_enabled())
+
+
+async def _test_script_app_service_upload_script_skips_auto_chunk_by_default():
+    chunk_store = FakeChunkStore()
+    service = _create_service(chunk_store=chunk_store)
+    runner = _attach_chunk_job_runner(service, FakeScriptChunkJobRepository())
+    library_id, script_id, _ = await _prepare_library_with_script(service, "manual.txt", "内容。".encode("utf-8"))
+    await runner.wait_idle()
+
+    scripts = await service.list_library_scripts(library_id)
+    assert scripts[0].id == script_id
+    assert scripts[0].chunk_count == 0
+    assert chunk_store._documents == {}
+
+
+def test_script_app_service_upload_script_skips_auto_chunk_by_default():
+    asyncio.run(_test_script_app_service_upload_script_skips_auto_chunk_by_default())
+
+
+class InProcessChunkProcessPool:
+    def __init__(self):
+        self.calls: list[tuple[str, int, int]] = []
+
+    async def split_file(
+        self,
+        source_path: str,
+        file_extension: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        chunks_path: str,
+        text_path: str | None = None,
+    ) -> ScriptChunkSplitSummary:
+        self.calls.append((file_extension, chunk_size, chunk_overlap))
+        assert isinstance(source_path, str)
+        return split_script_file(source_path, file_extension, chunk_size, chunk_overlap, chunks_path, text_path)
+
+
+async def _test_script_app_service_rechunk_library_fans_out_jobs_to_process_pool():
+    repository = FakeScriptRepository()
+    chunk_store = FakeChunkStore()
+    job_repository = FakeScriptChunkJobRepository()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    runner = _attach_chunk_job_runner(service, job_repository)
+    process_pool = InProcessChunkProcessPool()
+    service._chunk_process_pool = process_pool
+    library = await service.create_library(CreateScriptLibraryRequest(name="重切库", description=None))
+    script_ids = []
+    for index in range(3):
+        uploaded = await service.upload_script(
+            library.id,
+            UploadFile(file=BytesIO(f"剧本{index}第一句。第二句。第三句。".encode("utf-8")), filename=f"s{index}.txt"),
+        )
+        script_ids.append(uploaded.id)
+    await service.update_library_config(
+        library.id,
+        request=UpdateScriptLibraryConfigRequest(chunk_size=8, overlap=2),
+    )
+
+    response = await service.rechunk_library(library.id)
+    assert len(runner._tasks) == 1
+    await runner.wait_idle()
+
+    assert response.library_id == library.id
+    assert sorted(job.script_id for job in response.jobs) == sorted(script_ids)
+    assert all(job.status == "pending" for job in response.jobs)
+    assert process_pool.calls == [("txt", 8, 2)] * 3
+    total_chunks = 0
+    for submitted in response.jobs:
+        job = await service.get_script_chunk_job(library.id, submitted.id)
+        chunks = await repository.list_chunks(job.script_id, library.id)
+        assert job.status == "succeeded"
+        assert job.extracted_segments >= 1
+        assert job.total_chunks == len(chunks) > 1
+        total_chunks += job.total_chunks
+    assert len(chunk_store._documents) == total_chunks
+
+
+def test_script_app_service_rechunk_library_fans_out_jobs_to_process_pool():
+    asyncio.run(_test_script_app_service_rechunk_library_fans_out_jobs_to_process_pool())
+
+
+class ConcurrencyRecordingService:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.rebuilt_script_ids: list[UUID] = []
+
+    async def rebuild_script_chunks(
+        self,
+        library_id: UUID,
+        script_id: UUID,
+        on_progress=None,
+        use_process_pool: bool = False,
+    ) -> int:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        self.rebuilt_script_ids.append(script_id)
+        return 1
+
+
+async def _test_script_chunk_job_runner_drains_many_jobs_through_bounded_workers():
+    service = ConcurrencyRecordingService()
+    job_repository = FakeScriptChunkJobRepository()
+
+    @asynccontextmanager
+    async def _service_factory() -> AsyncIterator[ConcurrencyRecordingService]:
+        yield service
+
+    runner = ScriptChunkJobRunner(
+        job_repository=job_repository,
+        service_factory=_service_factory,
+        max_concurrency=1,
+        process_pool_max_concurrency=2,
+    )
+    library_id = uuid4()
+    script_ids = [uuid4() for _ in range(10)]
+
+    jobs = await runner.submit_many(library_id, script_ids, use_process_pool=True)
+    assert len(runner._tasks) == 1
+    await runner.wait_idle()
+
+    assert [job.script_id for job in jobs] == script_ids
+    assert sorted(service.rebuilt_script_ids) == sorted(script_ids)
+    assert service.max_active == 2
+    assert [(await job_repository.find_by_id(job.id)).status.value for job in jobs] == ["succeeded"] * len(jobs)
+
+
+def test_script_chunk_job_runner_drains_many_jobs_through_bounded_workers():
+    asyncio.run(_test_script_chunk_job_runner_drains_many_jobs_through_bounded_workers())
+
+
+async def _test_script_app_service_rechunk_library_requires_job_runner():
+    service = _create_service()
+    library = await service.create_library(CreateScriptLibraryRequest(name="无任务库", description=None))
+
+    with pytest.raises(ChunkingError):
+        await service.rechunk_library(library.id)
+
+
+def test_script_app_service_rechunk_library_requires_job_runner():
+    asyncio.run(_test_script_app_service_rechunk_library_requires_job_runner())
+
+
+async def _test_script_app_service_execute_script_chunks_cleans_up_when_pipelined_index_fails():
+    repository = FakeScriptRepository()
+    chunk_store = FailingSecondIndexChunkStore()
+    service = _create_service(repository=repository, chunk_store=chunk_store)
+    library = await service.create_library(CreateScriptLibraryRequest(name="流水线", description=None))
+    await service.update_library_config(
+        library.id,
+        request=UpdateScriptLibraryConfigRequest(chunk_size=10, overlap=0),
+    )
+    text = "".join(f"第{index}句。" for index in range(600))
+    uploaded = await service.upload_script(
+        library.id,
+        UploadFile(file=BytesIO(text.encode("utf-8")), filename="long.txt"),
+    )
+
+    with pytest.raises(ChunkingError):
+        await service.execute_script_chunks(library.id, uploaded.id)
+
+    assert chunk_store.index_calls == 2
+    assert chunk_store._documents == {}
+    assert await repository.list_chunks(uploaded.id, library.id) == []
+
+
+def test_script_app_service_execute_script_chunks_cleans_up_when_pipelined_index_fails():
+    asyncio.run(_test_script_app_service_execute_script_chunks_cleans_up_when_pipelined_index_fails())
+
+
+async def _test_script_app_service_delete_library_removes_chunk_documents_by_library():
+    chunk_store = FakeChunkStore()
+    service = _create_service(chunk_store=chunk_store)
+
+    library = await service.create_library(CreateScriptLibraryRequest(name="按库删除", description=None))
+    other_library = await service.create_library(CreateScriptLibraryRequest(name="保留库", description=None))
+    for library_id in (library.id, other_library.id):
+        uploaded = await service.upload_script(
+            library_id,
+            UploadFile(file=BytesIO("内容。".encode("utf-8")), filename="demo.txt"),
+        )
+        await service.get_script_chunks(library_id, uploaded.id)
+
+    await service.delete_library(library.id)
+
+    remaining = list(chunk_store._documents.values())
+    assert remaining
+    assert all(chunk.library_id == other_library.id for chunk in remaining)
+    assert chunk_store.delete_calls == []
+
+
+def test_script_app_service_delete_library_removes_chunk_documents_by_library():
+    asyncio.run(_test_script_app_service_delete_library_removes_chunk_documents_by_library())
+
+
 async def _test_script_app_service_delete_library_keeps_db_consistent_on_storage_failure():
     storage = FakeStorageProvider()
     chunk_store = FakeChunkStore()
@@ -612,6 +1935,300 @@ def test_script_app_service_get_script_chunks():
     asyncio.run(_test_script_app_service_get_script_chunks())
 
 
+async def _test_script_app_service_get_script_chunks_reads_through_cache():
+    chunk_store = FakeChunkStore()
+    chunk_cache = FakeScriptChunkCache()
+    service = _create_service(chunk_store=chunk_store, chunk_cache=chunk_cache)
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "cached.txt", text_data)
+
+    chunks = await service.get_script_chunks(library_id, script_id)
+    assert chunk_cache.has_current_entry(script_id)
+    chunk_store._documents.clear()
+    cached_chunks = await service.get_script_chunks(library_id, script_id)
+
+    assert cached_chunks == chunks
+    assert chunk_cache.hits == 1
+    assert len(chunk_store.indexed_chunk_ids) == len(chunks)
+
+
+def test_script_app_service_get_script_chunks_reads_through_cache():
+    asyncio.run(_test_script_app_service_get_script_chunks_reads_through_cache())
+
+
+async def _test_script_app_service_get_script_chunks_paginates_by_index():
+    repository = FakeScriptRepository()
+    service = _create_service(repository=repository)
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "paged.txt", text_data)
+    all_chunks = await service.get_script_chunks(library_id, script_id)
+    repository.list_chunks_calls.clear()
+
+    first_page = await service.get_script_chunks(library_id, script_id, limit=2)
+    second_page = await service.get_script_chunks(
+        library_id,
+        script_id,
+        after_index=first_page[-1].chunk_index,
+        limit=2,
+    )
+    past_end = await service.get_script_chunks(library_id, script_id, after_index=all_chunks[-1].chunk_index)
+
+    assert first_page + second_page == all_chunks[:4]
+    assert past_end == []
+    assert repository.list_chunks_calls == [(None, 2), (1, 2), (all_chunks[-1].chunk_index, None)]
+
+
+def test_script_app_service_get_script_chunks_paginates_by_index():
+    asyncio.run(_test_script_app_service_get_script_chunks_paginates_by_index())
+
+
+async def _test_script_app_service_get_script_chunks_paginates_cached_chunks():
+    repository = FakeScriptRepository()
+    service = _create_service(repository=repository, chunk_cache=FakeScriptChunkCache())
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "cached-page.txt", text_data)
+    all_chunks = await service.get_script_chunks(library_id, script_id)
+    repository.list_chunks_calls.clear()
+
+    page = await service.get_script_chunks(library_id, script_id, after_index=0, limit=2)
+
+    assert page == all_chunks[1:3]
+    assert repository.list_chunks_calls == []
+
+
+def test_script_app_service_get_script_chunks_paginates_cached_chunks():
+    asyncio.run(_test_script_app_service_get_script_chunks_paginates_cached_chunks())
+
+
+async def _test_script_app_service_stream_script_chunks_yields_batches(monkeypatch):
+    monkeypatch.setattr(script_app_service_module, "CHUNK_STREAM_BATCH_SIZE", 2)
+    repository = FakeScriptRepository()
+    service = _create_service(repository=repository)
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "stream.txt", text_data)
+
+    batches = [batch async for batch in await service.stream_script_chunks(library_id, script_id)]
+    all_chunks = await service.get_script_chunks(library_id, script_id)
+
+    assert all(len(batch) <= 2 for batch in batches)
+    assert [chunk for batch in batches for chunk in batch] == all_chunks
+    assert (1, 2) in repository.list_chunks_calls
+
+
+def test_script_app_service_stream_script_chunks_yields_batches(monkeypatch):
+    asyncio.run(_test_script_app_service_stream_script_chunks_yields_batches(monkeypatch))
+
+
+async def _test_script_app_service_stream_script_chunks_validates_before_streaming():
+    service = _create_service()
+    library = await service.create_library(CreateScriptLibraryRequest(name="流式", description=None))
+
+    with pytest.raises(ScriptNotFoundException):
+        await service.stream_script_chunks(library.id, UUID(int=1))
+
+
+def test_script_app_service_stream_script_chunks_validates_before_streaming():
+    asyncio.run(_test_script_app_service_stream_script_chunks_validates_before_streaming())
+
+
+async def _test_script_app_service_search_library_chunks_pages_with_cursor():
+    chunk_store = FakeChunkStore()
+    service = _create_service(chunk_store=chunk_store)
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "search.txt", text_data)
+    await service.get_script_chunks(library_id, script_id)
+
+    first_page = await service.search_library_chunks(library_id, " 第二句 ", size=2, script_id=script_id)
+    second_page = await service.search_library_chunks(library_id, "第二句", size=2, cursor=first_page.next_cursor)
+
+    assert [hit.chunk_index for hit in first_page.hits] == [0, 1]
+    assert [hit.chunk_index for hit in second_page.hits] == [2, 3]
+    assert chunk_store.search_calls[0][1] == "第二句"
+    assert chunk_store.search_calls[1][4] == [str(script_id), 1]
+
+
+def test_script_app_service_search_library_chunks_pages_with_cursor():
+    asyncio.run(_test_script_app_service_search_library_chunks_pages_with_cursor())
+
+
+async def _test_script_app_service_search_library_chunks_validates_input():
+    service = _create_service()
+    library = await service.create_library(CreateScriptLibraryRequest(name="检索", description=None))
+
+    with pytest.raises(ValidationException):
+        await service.search_library_chunks(library.id, "   ")
+    with pytest.raises(ValidationException):
+        await service.search_library_chunks(library.id, "雨夜", cursor="not-a-cursor!")
+    with pytest.raises(ScriptNotFoundException):
+        await service.search_library_chunks(library.id, "雨夜", script_id=UUID(int=1))
+
+
+def test_script_app_service_search_library_chunks_validates_input():
+    asyncio.run(_test_script_app_service_search_library_chunks_validates_input())
+
+
+async def _test_script_app_service_chunking_embeds_in_batches(monkeypatch):
+    monkeypatch.setattr(script_app_service_module, "CHUNK_EMBEDDING_BATCH_SIZE", 2)
+    chunk_store = FakeChunkStore()
+    embedder = CountingChunkEmbedder()
+    service = _create_service(chunk_store=chunk_store, chunk_embedder=embedder)
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "embed.txt", text_data)
+
+    chunks = await service.execute_script_chunks(library_id, script_id)
+
+    assert all(len(texts) <= 2 for texts in embedder.embedded_texts)
+    assert sum(len(texts) for texts in embedder.embedded_texts) == len(chunks)
+    assert all(len(chunk.embedding) == 16 for chunk in chunk_store._documents.values())
+
+
+def test_script_app_service_chunking_embeds_in_batches(monkeypatch):
+    asyncio.run(_test_script_app_service_chunking_embeds_in_batches(monkeypatch))
+
+
+async def _test_script_app_service_rechunk_reuses_stored_embeddings():
+    repository = FakeScriptRepository()
+    storage = FakeStorageProvider()
+    chunk_store = FakeChunkStore()
+    embedder = CountingChunkEmbedder()
+    service = _create_service(repository=repository, storage=storage, chunk_store=chunk_store, chunk_embedder=embedder)
+    body = "这是第一句。这里继续第二句。" * 180
+    library_id, script_id, _ = await _prepare_library_with_script(service, "reuse.txt", body.encode("utf-8"))
+    await service.execute_script_chunks(library_id, script_id)
+    first_run_texts = sum(len(texts) for texts in embedder.embedded_texts)
+    embedder.embedded_texts.clear()
+
+    script = await repository.find_by_id(script_id)
+    storage._objects[script.storage_path] = (body + "新增的结尾。").encode("utf-8")
+    chunks = await service.execute_script_chunks(library_id, script_id)
+
+    embedded_texts = [text for texts in embedder.embedded_texts for text in texts]
+    assert 0 < len(embedded_texts) < first_run_texts
+    assert embedded_texts[-1] == chunks[-1].content
+    assert all(chunk.embedding is not None for chunk in chunk_store._documents.values())
+
+
+def test_script_app_service_rechunk_reuses_stored_embeddings():
+    asyncio.run(_test_script_app_service_rechunk_reuses_stored_embeddings())
+
+
+async def _test_script_app_service_duplicate_script_reuses_donor_embeddings():
+    embedder = CountingChunkEmbedder()
+    service = _create_service(chunk_embedder=embedder)
+    text_data = ("这是第一句。这里继续第二句。" * 60).encode("utf-8")
+    library_id, first_id, _ = await _prepare_library_with_script(service, "first.txt", text_data)
+    await service.execute_script_chunks(library_id, first_id)
+    embedder.embedded_texts.clear()
+
+    second = await service.upload_script(library_id, UploadFile(file=BytesIO(text_data), filename="second.txt"))
+    await service.execute_script_chunks(library_id, second.id)
+
+    assert embedder.embedded_texts == []
+
+
+def test_script_app_service_duplicate_script_reuses_donor_embeddings():
+    asyncio.run(_test_script_app_service_duplicate_script_reuses_donor_embeddings())
+
+
+async def _test_script_app_service_semantic_search_library_chunks():
+    service = _create_service(chunk_embedder=CountingChunkEmbedder(dimensions=64))
+    text_data = "雨夜里两人在车站重逢。清晨他们各自出发去了远方的城市。".encode("utf-8")
+    library = await service.create_library(CreateScriptLibraryRequest(name="语义", description=None))
+    uploaded = await service.upload_script(library.id, UploadFile(file=BytesIO(text_data), filename="scene.txt"))
+    await service.update_library_config(
+        library.id,
+        UpdateScriptLibraryConfigRequest(chunk_size=20, overlap=0),
+    )
+    await service.execute_script_chunks(library.id, uploaded.id)
+
+    result = await service.semantic_search_library_chunks(library.id, "车站重逢", size=1)
+
+    assert len(result.hits) == 1
+    assert "重逢" in result.hits[0].content
+    assert result.next_cursor is None
+
+
+def test_script_app_service_semantic_search_library_chunks():
+    asyncio.run(_test_script_app_service_semantic_search_library_chunks())
+
+
+async def _test_script_app_service_semantic_search_requires_embedder():
+    service = _create_service()
+    library = await service.create_library(CreateScriptLibraryRequest(name="语义", description=None))
+
+    with pytest.raises(SemanticSearchUnavailableError):
+        await service.semantic_search_library_chunks(library.id, "重逢")
+
+
+def test_script_app_service_semantic_search_requires_embedder():
+    asyncio.run(_test_script_app_service_semantic_search_requires_embedder())
+
+
+async def _test_script_app_service_hybrid_search_library_chunks():
+    service = _create_service(chunk_embedder=CountingChunkEmbedder(dimensions=64))
+    text_data = "雨夜里两人在车站重逢。清晨他们各自出发去了远方的城市。".encode("utf-8")
+    library = await service.create_library(CreateScriptLibraryRequest(name="混合", description=None))
+    uploaded = await service.upload_script(library.id, UploadFile(file=BytesIO(text_data), filename="scene.txt"))
+    await service.update_library_config(library.id, UpdateScriptLibraryConfigRequest(chunk_size=20, overlap=0))
+    await service.execute_script_chunks(library.id, uploaded.id)
+
+    result = await service.hybrid_search_library_chunks(library.id, "重逢", size=3, script_id=uploaded.id)
+
+    assert "重逢" in result.hits[0].content
+    assert result.hits[0].lexical_rank == 1
+    assert result.hits[0].vector_rank is not None
+    assert result.hits[0].score == pytest.approx(1 / 61 + 1 / (60 + result.hits[0].vector_rank))
+
+
+def test_script_app_service_hybrid_search_library_chunks():
+    asyncio.run(_test_script_app_service_hybrid_search_library_chunks())
+
+
+async def _test_script_app_service_rechunk_invalidates_cached_chunks():
+    repository = FakeScriptRepository()
+    storage = FakeStorageProvider()
+    chunk_cache = FakeScriptChunkCache()
+    service = _create_service(repository=repository, storage=storage, chunk_cache=chunk_cache)
+    text_data = ("这是第一句。这里继续第二句。" * 180).encode("utf-8")
+    library_id, script_id, _ = await _prepare_library_with_script(service, "rechunk.txt", text_data)
+    await service.get_script_chunks(library_id, script_id)
+
+    script = await repository.find_by_id(script_id)
+    storage._objects[script.storage_path] = ("全新的内容。" * 200).encode("utf-8")
+    await service.execute_script_chunks(library_id, script_id)
+    chunks = await service.get_script_chunks(library_id, script_id)
+
+    assert chunks[0].content.startswith("全新的内容。")
+    assert chunk_cache._generations[script_id] == 2
+
+
+def test_script_app_service_rechunk_invalidates_cached_chunks():
+    asyncio.run(_test_script_app_service_rechunk_invalidates_cached_chunks())
+
+
+async def _test_script_app_service_delete_invalidates_cached_chunks():
+    chunk_cache = FakeScriptChunkCache()
+    service = _create_service(chunk_cache=chunk_cache)
+    library_id, first_id, _ = await _prepare_library_with_script(service, "first.txt", "第一句。".encode("utf-8"))
+    second = await service.upload_script(
+        library_id,
+        UploadFile(file=BytesIO("第二句。".encode("utf-8")), filename="second.txt"),
+    )
+    await service.get_script_chunks(library_id, first_id)
+    await service.get_script_chunks(library_id, second.id)
+
+    await service.delete_script_from_library(library_id, first_id)
+    assert not chunk_cache.has_current_entry(first_id)
+    assert chunk_cache.has_current_entry(second.id)
+
+    await service.delete_library(library_id)
+    assert not chunk_cache.has_current_entry(second.id)
+
+
+def test_script_app_service_delete_invalidates_cached_chunks():
+    asyncio.run(_test_script_app_service_delete_invalidates_cached_chunks())
+
+
 async def _test_script_app_service_get_and_update_library_config():
     service = _create_service()
     library = await service.create_library(CreateScriptLibraryRequest(name="配置库", description=None))
@@ -626,6 +2243,18 @@ async def _test_script_app_service_get_and_update_library_config():
     )
     assert updated.chunk_size == 320
     assert updated.overlap == 40
+    assert updated.auto_chunk_on_upload is False
+
+    enabled = await service.update_library_config(
+        library.id,
+        request=UpdateScriptLibraryConfigRequest(chunk_size=320, overlap=40, auto_chunk_on_upload=True),
+    )
+    kept = await service.update_library_config(
+        library.id,
+        request=UpdateScriptLibraryConfigRequest(chunk_size=300, overlap=30),
+    )
+    assert enabled.auto_chunk_on_upload is True
+    assert kept.auto_chunk_on_upload is True
 
 
 def test_script_app_service_get_and_update_library_config():
@@ -796,3 +2425,71 @@ async def _test_script_app_service_get_script_text_content_rejects_non_text_file
 
 def test_script_app_service_get_script_text_content_rejects_non_text_file():
     asyncio.run(_test_script_app_service_get_script_text_content_rejects_non_text_file())
+
+
+async def _collect_script_text(service: ScriptAppService, text_stream) -> bytes:
+    return b"".join([part async for part in service.iter_script_text(text_stream)])
+
+
+async def _test_script_app_service_streams_script_text_as_utf8():
+    service = _create_service()
+    content = "第一场 日 内\n张三：你好。\n" * 600
+    library_id, script_id, _ = await _prepare_library_with_script(service, "play.txt", content.encode("gb18030"))
+
+    text_stream = await service.open_script_text_stream(library_id, script_id)
+    again = await service.open_script_text_stream(library_id, script_id)
+
+    assert text_stream.etag == again.etag
+    assert text_stream.etag.startswith('"') and text_stream.etag.endswith('"')
+    assert await _collect_script_text(service, text_stream) == content.encode("utf-8")
+
+
+def test_script_app_service_streams_script_text_as_utf8():
+    asyncio.run(_test_script_app_service_streams_script_text_as_utf8())
+
+
+async def _test_script_app_service_reads_script_text_ranges():
+    service = _create_service()
+    content = "张三：你好。Hello!" * 800
+    library_id, script_id, _ = await _prepare_library_with_script(service, "play.txt", content.encode("utf-8"))
+    text_stream = await service.open_script_text_stream(library_id, script_id)
+    encoded = content.encode("utf-8")
+
+    chars = await service.read_script_text_range(text_stream, ScriptTextRange(unit="chars", start=3, end=9))
+    assert chars.content == content[3:10].encode("utf-8")
+    assert (chars.start, chars.end, chars.total) == (3, 9, None)
+
+    byte_range = await service.read_script_text_range(text_stream, ScriptTextRange(unit="bytes", start=10000, end=10099))
+    assert byte_range.content == encoded[10000:10100]
+    assert (byte_range.start, byte_range.end, byte_range.total) == (10000, 10099, None)
+
+    tail = await service.read_script_text_range(text_stream, ScriptTextRange(unit="chars", start=len(content) - 5))
+    assert tail.content == content[-5:].encode("utf-8")
+    assert (tail.end, tail.total) == (len(content) - 1, len(content))
+
+    with pytest.raises(ScriptTextRangeNotSatisfiableError) as exc_info:
+        await service.read_script_text_range(text_stream, ScriptTextRange(unit="bytes", start=len(encoded)))
+    assert (exc_info.value.unit, exc_info.value.total) == ("bytes", len(encoded))
+
+
+def test_script_app_service_reads_script_text_ranges():
+    asyncio.run(_test_script_app_service_reads_script_text_ranges())
+
+
+async def _test_script_app_service_streams_docx_text_from_sidecar(monkeypatch):
+    storage = FakeStorageProvider()
+    service = _create_service(storage=storage)
+    library_id, script_id, _ = await _prepare_library_with_script(service, "play.docx", _docx_bytes(["第一场。", "张三：你好。"]))
+
+    text_stream = await service.open_script_text_stream(library_id, script_id)
+    assert text_stream.object_name == _text_sidecar_names(storage)[0]
+
+    def _fail_extract(*args, **kwargs):
+        raise AssertionError("the text stream should read the sidecar instead of re-parsing the DOCX")
+
+    monkeypatch.setattr(service._file_text_extractor, "iter_text_segments_from_stream", _fail_extract)
+    assert await _collect_script_text(service, text_stream) == "第一场。\n张三：你好。\n".encode("utf-8")
+
+
+def test_script_app_service_streams_docx_text_from_sidecar(monkeypatch):
+    asyncio.run(_test_script_app_service_streams_docx_text_from_sidecar(monkeypatch))
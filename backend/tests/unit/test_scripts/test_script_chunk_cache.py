@@ -0,0 +1,122 @@
+import asyncio
+import uuid
+
+from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+from src.modules.scripts.infrastructure.repositories.script_chunk_cache import ScriptChunkCache
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands.clear()
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self._commands.append(("setex", (key, ttl, value)))
+
+    def expire(self, key: str, ttl: int) -> None:
+        self._commands.append(("expire", (key, ttl)))
+
+    def incr(self, key: str) -> None:
+        self._commands.append(("incr", (key,)))
+
+    async def execute(self) -> list[object]:
+        self._redis.pipelines += 1
+        return [await getattr(self._redis, name)(*args) for name, args in self._commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.pipelines = 0
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        self.values[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        if key not in self.values:
+            return False
+        self.ttls[key] = ttl
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = str(int(self.values.get(key, "0")) + 1)
+        return int(self.values[key])
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+def _build_chunks(script_id: uuid.UUID) -> list[ScriptChunk]:
+    library_id = uuid.uuid4()
+    return [
+        ScriptChunk.create(script_id, library_id, index, f"第{index}句。", index * 4, index * 4 + 4)
+        for index in range(3)
+    ]
+
+
+def test_script_chunk_cache_round_trips_compact_payload():
+    redis = FakeRedis()
+    cache = ScriptChunkCache(ttl_seconds=60, max_bytes=4096, redis=redis)
+    script_id = uuid.uuid4()
+    chunks = _build_chunks(script_id)
+
+    async def _run():
+        generation = await cache.get_generation(script_id)
+        stored = await cache.set(script_id, generation, chunks)
+        return generation, stored, await cache.get(script_id, generation)
+
+    generation, stored, cached = asyncio.run(_run())
+
+    assert generation == 0
+    assert stored is True
+    assert [(chunk.id, chunk.index_id, chunk.content, chunk.start_index, chunk.end_index) for chunk in cached] == [
+        (chunk.id, chunk.index_id, chunk.content, chunk.start_index, chunk.end_index) for chunk in chunks
+    ]
+    assert all(chunk.script_id == script_id and chunk.chunk_size == len(chunk.content) for chunk in cached)
+    payload = redis.values[ScriptChunkCache.build_chunks_key(script_id, 0)]
+    assert "第0句" in payload
+    assert redis.ttls[ScriptChunkCache.build_chunks_key(script_id, 0)] == 60
+
+
+def test_script_chunk_cache_invalidate_moves_to_new_generation():
+    redis = FakeRedis()
+    cache = ScriptChunkCache(ttl_seconds=60, max_bytes=4096, redis=redis)
+    first_id = uuid.uuid4()
+    second_id = uuid.uuid4()
+
+    async def _run():
+        await cache.set(first_id, 0, _build_chunks(first_id))
+        await cache.invalidate([first_id, second_id])
+        generation = await cache.get_generation(first_id)
+        return generation, await cache.get(first_id, generation)
+
+    generation, cached = asyncio.run(_run())
+
+    assert generation == 1
+    assert cached is None
+    assert redis.pipelines == 2
+    generation_key = ScriptChunkCache.build_generation_key(first_id)
+    assert redis.ttls[generation_key] > redis.ttls[ScriptChunkCache.build_chunks_key(first_id, 0)]
+
+
+def test_script_chunk_cache_skips_payloads_over_size_cap():
+    redis = FakeRedis()
+    cache = ScriptChunkCache(ttl_seconds=60, max_bytes=16, redis=redis)
+    script_id = uuid.uuid4()
+
+    stored = asyncio.run(cache.set(script_id, 0, _build_chunks(script_id)))
+
+    assert stored is False
+    assert redis.values == {}
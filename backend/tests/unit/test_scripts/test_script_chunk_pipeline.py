@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from contextlib import aclosing
+
+import pytest
+
+from src.modules.scripts.infrastructure.services.script_chunk_pipeline import iter_batches_in_thread
+
+
+async def _test_iter_batches_in_thread_yields_batches_in_order():
+    batches = [
+        batch
+        async for batch in iter_batches_in_thread(lambda: range(7), batch_size=3, max_pending_batches=1)
+    ]
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_iter_batches_in_thread_yields_batches_in_order():
+    asyncio.run(_test_iter_batches_in_thread_yields_batches_in_order())
+
+
+async def _test_iter_batches_in_thread_applies_backpressure():
+    produced: list[int] = []
+    lock = threading.Lock()
+
+    def _items():
+        for item in range(100):
+            with lock:
+                produced.append(item)
+            yield item
+
+    batches = iter_batches_in_thread(_items, batch_size=10, max_pending_batches=2)
+    async with aclosing(batches):
+        first = await anext(batches)
+        await asyncio.sleep(0.2)
+        with lock:
+            produced_before_resume = len(produced)
+
+    assert first == list(range(10))
+    assert produced_before_resume <= 10 * 4
+    assert len(produced) < 100
+
+
+def test_iter_batches_in_thread_applies_backpressure():
+    asyncio.run(_test_iter_batches_in_thread_applies_backpressure())
+
+
+async def _test_iter_batches_in_thread_propagates_producer_errors():
+    def _items():
+        yield 1
+        raise ValueError("broken source")
+
+    with pytest.raises(ValueError, match="broken source"):
+        async for _ in iter_batches_in_thread(_items, batch_size=5, max_pending_batches=1):
+            pass
+
+
+def test_iter_batches_in_thread_propagates_producer_errors():
+    asyncio.run(_test_iter_batches_in_thread_propagates_producer_errors())
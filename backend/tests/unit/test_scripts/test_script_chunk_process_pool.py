@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from src.modules.scripts.domain.exceptions import TextExtractError
+from src.modules.scripts.infrastructure.services import script_chunk_process_pool as process_pool_module
+from src.modules.scripts.infrastructure.services.script_chunk_process_pool import (
+    ScriptChunkProcessPool,
+    iter_split_chunks,
+    split_script_file,
+)
+from src.modules.scripts.infrastructure.services.script_chunker import ScriptSentenceWindowTextSplitter
+
+
+def test_split_script_file_matches_in_process_splitter(monkeypatch, tmp_path):
+    monkeypatch.setattr(process_pool_module, "SPLIT_CHUNK_BATCH_SIZE", 4)
+    text = "第一句。第二句！第三句？" * 50
+    source_path = tmp_path / "source.txt"
+    source_path.write_bytes(text.encode("utf-8"))
+    splitter = ScriptSentenceWindowTextSplitter(chunk_size=40, chunk_overlap=8)
+
+    summary = split_script_file(
+        str(source_path),
+        "txt",
+        40,
+        8,
+        str(tmp_path / "chunks.pickle"),
+        str(tmp_path / "text.txt"),
+    )
+    chunks = list(iter_split_chunks(str(tmp_path / "chunks.pickle")))
+
+    assert summary.extracted_segments >= 1
+    assert summary.chunk_count == len(chunks) > 4
+    assert [(chunk.content, chunk.start_index, chunk.end_index) for chunk in chunks] == splitter._split_with_indices(text)
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+    assert (tmp_path / "text.txt").read_text(encoding="utf-8") == text
+
+
+async def _test_script_chunk_process_pool_splits_in_worker_process(tmp_path):
+    first_path = tmp_path / "first.txt"
+    first_path.write_bytes("第一句。第二句。".encode("utf-8") * 20)
+    second_path = tmp_path / "second.md"
+    second_path.write_bytes(b"First. Second. Third. " * 20)
+    unsupported_path = tmp_path / "data.exe"
+    unsupported_path.write_bytes(b"data")
+
+    pool = ScriptChunkProcessPool(max_workers=1)
+    try:
+        summaries = await asyncio.gather(
+            pool.split_file(str(first_path), "txt", 20, 4, str(tmp_path / "first.pickle")),
+            pool.split_file(str(second_path), "md", 30, 5, str(tmp_path / "second.pickle")),
+        )
+        with pytest.raises(TextExtractError):
+            await pool.split_file(str(unsupported_path), "exe", 20, 4, str(tmp_path / "data.pickle"))
+    finally:
+        pool.shutdown()
+
+    expected_first = split_script_file(str(first_path), "txt", 20, 4, str(tmp_path / "expected-first.pickle"))
+    expected_second = split_script_file(str(second_path), "md", 30, 5, str(tmp_path / "expected-second.pickle"))
+    assert summaries == [expected_first, expected_second]
+    assert list(iter_split_chunks(str(tmp_path / "first.pickle"))) == list(
+        iter_split_chunks(str(tmp_path / "expected-first.pickle"))
+    )
+    assert list(iter_split_chunks(str(tmp_path / "second.pickle"))) == list(
+        iter_split_chunks(str(tmp_path / "expected-second.pickle"))
+    )
+
+
+def test_script_chunk_process_pool_splits_in_worker_process(tmp_path):
+    asyncio.run(_test_script_chunk_process_pool_splits_in_worker_process(tmp_path))
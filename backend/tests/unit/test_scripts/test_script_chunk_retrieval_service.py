@@ -0,0 +1,87 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.modules.scripts.application.services.script_chunk_retrieval_service import ScriptChunkRetrievalService
+from src.modules.scripts.domain.entities.script_chunk_search_entity import ScriptChunkSearchHit
+from src.modules.scripts.infrastructure.services.hashing_chunk_embedder import HashingChunkEmbedder
+
+LIBRARY_ID = uuid.uuid4()
+SCRIPT_ID = uuid.uuid4()
+
+
+def _hit(chunk_index: int, score: float, chunk_id: uuid.UUID | None = None) -> ScriptChunkSearchHit:
+    return ScriptChunkSearchHit(
+        chunk_id=chunk_id or uuid.uuid4(),
+        script_id=SCRIPT_ID,
+        library_id=LIBRARY_ID,
+        chunk_index=chunk_index,
+        start_index=chunk_index * 10,
+        end_index=chunk_index * 10 + 10,
+        score=score,
+    )
+
+
+class ConcurrentChunkStore:
+    def __init__(self, lexical_hits, vector_hits):
+        self._lexical_hits = lexical_hits
+        self._vector_hits = vector_hits
+        self._lexical_started = asyncio.Event()
+        self._vector_started = asyncio.Event()
+        self.fail_lexical = False
+        self.requested_sizes: list[int] = []
+
+    async def search_chunks(self, library_id, query, size, script_id=None, search_after=None):
+        self.requested_sizes.append(size)
+        self._lexical_started.set()
+        # Only completes if the kNN query was issued before this one finished.
+        await asyncio.wait_for(self._vector_started.wait(), timeout=1)
+        if self.fail_lexical:
+            raise RuntimeError("search unavailable")
+        return self._lexical_hits
+
+    async def knn_search_chunks(self, library_id, query_vector, size, script_id=None):
+        self.requested_sizes.append(size)
+        self._vector_started.set()
+        await asyncio.wait_for(self._lexical_started.wait(), timeout=1)
+        return self._vector_hits
+
+
+def test_hybrid_search_runs_both_queries_concurrently_and_fuses_with_rrf():
+    shared_id = uuid.uuid4()
+    lexical_hits = [_hit(0, 9.0), _hit(1, 7.5, chunk_id=shared_id)]
+    vector_hits = [_hit(1, 0.93, chunk_id=shared_id), _hit(2, 0.81)]
+    store = ConcurrentChunkStore(lexical_hits, vector_hits)
+    service = ScriptChunkRetrievalService(store, HashingChunkEmbedder(dimensions=8))
+
+    hits = asyncio.run(service.hybrid_search(LIBRARY_ID, "重逢", size=2))
+
+    assert [hit.hit.chunk_id for hit in hits] == [shared_id, lexical_hits[0].chunk_id]
+    assert hits[0].score == pytest.approx(1 / 62 + 1 / 61)
+    assert (hits[0].lexical_rank, hits[0].vector_rank) == (2, 1)
+    assert (hits[0].lexical_score, hits[0].vector_score) == (7.5, 0.93)
+    assert hits[1].vector_rank is None
+    assert store.requested_sizes == [20, 20]
+
+
+def test_hybrid_search_falls_back_to_remaining_signal_when_one_query_fails():
+    vector_hits = [_hit(3, 0.7)]
+    store = ConcurrentChunkStore([], vector_hits)
+    store.fail_lexical = True
+    service = ScriptChunkRetrievalService(store, HashingChunkEmbedder(dimensions=8))
+
+    hits = asyncio.run(service.hybrid_search(LIBRARY_ID, "重逢", size=5))
+
+    assert [hit.hit.chunk_id for hit in hits] == [vector_hits[0].chunk_id]
+    assert hits[0].lexical_rank is None
+
+
+def test_fuse_without_embedder_keeps_lexical_order():
+    lexical_hits = [_hit(4, 3.0), _hit(2, 2.0)]
+    service = ScriptChunkRetrievalService(script_chunk_store=None)
+
+    hits = service.fuse(lexical_hits, [], size=5)
+
+    assert [hit.hit.chunk_index for hit in hits] == [4, 2]
+    assert asyncio.run(service.vector_search(LIBRARY_ID, "重逢", size=5)) == []
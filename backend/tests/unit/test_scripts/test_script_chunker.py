@@ -1,3 +1,4 @@
+import random
 from io import BytesIO
 
 from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
@@ -68,3 +69,62 @@ def test_script_chunker_streaming_segments_matches_full_text():
         assert docs_from_text[index].page_content == docs_from_segments[index].page_content
         assert docs_from_text[index].metadata["start_index"] == docs_from_segments[index].metadata["start_index"]
         assert docs_from_text[index].metadata["end_index"] == docs_from_segments[index].metadata["end_index"]
+
+
+def test_script_chunker_iter_documents_matches_batch_documents():
+    splitter = ScriptSentenceWindowTextSplitter(chunk_size=300, chunk_overlap=50)
+    text = "第一句。" * 300
+    segments = [text[index:index + 97] for index in range(0, len(text), 97)]
+
+    batch_docs = splitter.create_documents_from_text_segments(segments, metadata={"script_id": "s"})
+    streamed_docs = list(splitter.iter_documents_from_text_segments(iter(segments), metadata={"script_id": "s"}))
+
+    assert [doc.page_content for doc in streamed_docs] == [doc.page_content for doc in batch_docs]
+    assert [doc.metadata for doc in streamed_docs] == [doc.metadata for doc in batch_docs]
+
+
+def test_script_chunker_find_split_end_ignores_endings_outside_window():
+    splitter = ScriptSentenceWindowTextSplitter(chunk_size=4, chunk_overlap=1)
+    text = "。abcdef。"
+
+    assert splitter._find_split_end(text, 1, 5) == 5
+    assert splitter._find_split_end(text, 0, 5) == 1
+    assert splitter._find_split_end(text, 3, 8) == 8
+
+
+def test_script_chunker_streaming_matches_whole_text_for_any_segmentation():
+    rng = random.Random(3)
+    text = "".join(rng.choice("剧本。台词！ ab.\n") for _ in range(5000))
+    splitter = ScriptSentenceWindowTextSplitter(chunk_size=120, chunk_overlap=30)
+    expected = splitter._split_with_indices(text)
+
+    for max_segment in (1, 7, 119, 121, 4000, 6000):
+        segments = []
+        position = 0
+        while position < len(text):
+            size = rng.randint(0, max_segment)
+            segments.append(text[position:position + size])
+            position += size
+
+        assert splitter._split_streaming_with_indices(segments) == expected
+
+
+def test_script_chunker_iter_chunks_matches_documents():
+    text = "第一句。第二句！第三句？" * 40
+    segments = [text[i:i + 13] for i in range(0, len(text), 13)]
+    splitter = ScriptSentenceWindowTextSplitter(chunk_size=50, chunk_overlap=10)
+
+    documents = splitter.create_documents_from_text_segments(segments)
+    chunks = splitter.iter_chunks_from_text_segments(iter(segments))
+
+    assert [
+        (chunk.index, chunk.content, chunk.start_index, chunk.end_index) for chunk in chunks
+    ] == [
+        (
+            document.metadata["chunk_index"],
+            document.page_content,
+            document.metadata["start_index"],
+            document.metadata["end_index"],
+        )
+        for document in documents
+    ]
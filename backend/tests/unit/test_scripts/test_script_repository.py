@@ -0,0 +1,255 @@
+import asyncio
+import uuid
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from src.modules.scripts.infrastructure.models.script_model import ScriptModel
+from src.modules.scripts.infrastructure.repositories.script_repository import ScriptRepository
+
+
+class _RowsResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _RecordingSession:
+    def __init__(self, rows):
+        self._rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _RowsResult(self._rows)
+
+
+def _script_model(name: str) -> ScriptModel:
+    now = datetime.utcnow()
+    return ScriptModel(
+        id=uuid.uuid4(),
+        original_name=name,
+        storage_path=f"path/{name}",
+        file_extension="txt",
+        content_type="text/plain",
+        file_size=10,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_list_all_with_chunk_counts_uses_single_grouped_query():
+    library_id = uuid.uuid4()
+    first = _script_model("first.txt")
+    second = _script_model("second.txt")
+    session = _RecordingSession([(first, library_id, 3), (second, library_id, 0)])
+    repository = ScriptRepository(session)
+
+    result = asyncio.run(repository.list_all_with_chunk_counts(library_id))
+
+    assert [(script.id, count) for script, count in result] == [(first.id, 3), (second.id, 0)]
+    assert all(script.library_id == library_id for script, _ in result)
+    assert len(session.statements) == 1
+    compiled = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "GROUP BY script_chunks.script_id" in compiled
+    assert "LEFT OUTER JOIN" in compiled
+
+
+class _OneRowResult:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _StatsSession:
+    def __init__(self, row):
+        self._row = row
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _OneRowResult(self._row)
+
+
+def test_get_library_stats_aggregates_in_single_query():
+    library_id = uuid.uuid4()
+    last_updated = datetime.utcnow()
+    session = _StatsSession((2, 2048, last_updated, 17))
+    repository = ScriptRepository(session)
+
+    stats = asyncio.run(repository.get_library_stats(library_id))
+
+    assert stats.library_id == library_id
+    assert stats.script_count == 2
+    assert stats.total_file_size == 2048
+    assert stats.chunk_count == 17
+    assert stats.last_script_updated_at == last_updated
+    assert len(session.statements) == 1
+    compiled = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "count(scripts.id)" in compiled
+    assert "sum(scripts.file_size)" in compiled
+    assert "count(script_chunks.id)" in compiled
+
+
+def test_get_library_stats_defaults_empty_library_to_zero():
+    session = _StatsSession((0, 0, None, 0))
+    repository = ScriptRepository(session)
+
+    stats = asyncio.run(repository.get_library_stats(uuid.uuid4()))
+
+    assert stats.script_count == 0
+    assert stats.chunk_count == 0
+    assert stats.last_script_updated_at is None
+
+
+class _BlobRow:
+    def __init__(self, **values):
+        self._values = values
+
+    def _asdict(self):
+        return dict(self._values)
+
+
+class _BlobResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def one(self):
+        return self._rows[0]
+
+    def all(self):
+        return self._rows
+
+
+class _BlobSession:
+    def __init__(self, rows):
+        self._rows = rows
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _BlobResult(self._rows)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _blob_row(ref_count: int) -> _BlobRow:
+    now = datetime.utcnow()
+    return _BlobRow(
+        content_hash="a" * 64,
+        storage_path=f"blobs/aa/{'a' * 64}.txt",
+        file_size=10,
+        ref_count=ref_count,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_acquire_blob_increments_reference_count_with_upsert():
+    session = _BlobSession([_blob_row(2)])
+    repository = ScriptRepository(session)
+
+    blob = asyncio.run(repository.acquire_blob("a" * 64, f"blobs/aa/{'a' * 64}.txt", 10))
+
+    assert blob.ref_count == 2
+    assert session.commits == 1
+    compiled = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (content_hash) DO UPDATE" in compiled
+    assert "ref_count = (script_blobs.ref_count + " in compiled
+
+
+def test_release_blobs_decrements_once_per_hash_and_deletes_unreferenced():
+    session = _BlobSession([_blob_row(0)])
+    repository = ScriptRepository(session)
+
+    released = asyncio.run(repository.release_blobs(["a" * 64, "a" * 64, "b" * 64]))
+
+    assert [blob.content_hash for blob in released] == ["a" * 64]
+    assert len(session.statements) == 2
+    update_sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    delete_sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+    assert "CASE script_blobs.content_hash" in update_sql
+    assert "DELETE FROM script_blobs" in delete_sql
+    assert "script_blobs.ref_count <= " in delete_sql
+
+
+class _ScalarRowsResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _ChunkSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _ScalarRowsResult([])
+
+
+def test_list_chunks_pushes_cursor_and_limit_into_query():
+    session = _ChunkSession()
+    repository = ScriptRepository(session)
+
+    asyncio.run(repository.list_chunks(uuid.uuid4(), uuid.uuid4(), after_index=9, limit=50))
+
+    compiled = session.statements[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "script_chunks.index_id > " in sql
+    assert "ORDER BY script_chunks.index_id ASC" in sql
+    assert "LIMIT" in sql
+    assert 9 in compiled.params.values()
+    assert 50 in compiled.params.values()
+
+
+class _ReplaceSession:
+    def __init__(self):
+        self.calls = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None):
+        self.calls.append((stmt, params))
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_replace_chunks_inserts_rows_in_bounded_batches(monkeypatch):
+    from src.modules.scripts.domain.entities.script_chunk_entity import ScriptChunk
+    from src.modules.scripts.infrastructure.repositories import script_repository
+
+    monkeypatch.setattr(script_repository, "CHUNK_INSERT_BATCH_SIZE", 2)
+    script_id = uuid.uuid4()
+    library_id = uuid.uuid4()
+    chunks = [
+        ScriptChunk.create(
+            script_id=script_id,
+            library_id=library_id,
+            index_id=index,
+            content=f"chunk {index}",
+            start_index=index * 10,
+            end_index=index * 10 + 7,
+        )
+        for index in range(5)
+    ]
+    session = _ReplaceSession()
+    repository = ScriptRepository(session)
+
+    asyncio.run(repository.replace_chunks(script_id, library_id, chunks, chunk_size=10, chunk_overlap=2))
+
+    insert_batches = [params for _, params in session.calls if params is not None]
+    assert [len(batch) for batch in insert_batches] == [2, 2, 1]
+    assert [row["index_id"] for batch in insert_batches for row in batch] == [0, 1, 2, 3, 4]
+    assert session.commits == 1
@@ -0,0 +1,93 @@
+import asyncio
+from io import BytesIO
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import UploadFile
+
+from src.modules.scripts.api.dependencies import get_script_app_service
+from src.modules.scripts.api.router import router
+from src.modules.scripts.application.dto.script_dto import CreateScriptLibraryRequest
+from src.modules.scripts.application.services.script_app_service import ScriptAppService
+from src.shared.common.dependencies import get_current_user_id
+from tests.unit.test_scripts.test_script_app_service import _create_service, _prepare_library_with_script
+
+
+def _create_app_client(service: ScriptAppService) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_script_app_service] = lambda: service
+    app.dependency_overrides[get_current_user_id] = lambda: "user"
+    return TestClient(app)
+
+
+def _create_client(content: str) -> tuple[TestClient, str]:
+    service = _create_service()
+    library_id, script_id, _ = asyncio.run(_prepare_library_with_script(service, "play.txt", content.encode("utf-8")))
+    return _create_app_client(service), f"/api/v1/scripts/libraries/{library_id}/files/{script_id}/content/raw"
+
+
+def test_script_text_route_streams_text_with_validators():
+    content = "张三：你好。\n" * 100
+    client, url = _create_client(content)
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["accept-ranges"] == "bytes, chars"
+    assert response.text == content
+
+    etag = response.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": f"W/{etag}, \"other\""}).status_code == 304
+    assert client.get(url, headers={"If-Modified-Since": response.headers["last-modified"]}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_script_text_route_serves_ranges():
+    content = "张三：你好。\n" * 100
+    client, url = _create_client(content)
+    etag = client.get(url).headers["etag"]
+
+    chars = client.get(url, headers={"Range": "chars=7-13"})
+    assert chars.status_code == 206
+    assert chars.headers["content-range"] == "chars 7-13/*"
+    assert chars.text == content[7:14]
+
+    tail = client.get(url, headers={"Range": "bytes=1000-"})
+    encoded = content.encode("utf-8")
+    assert tail.status_code == 206
+    assert tail.headers["content-range"] == f"bytes 1000-{len(encoded) - 1}/{len(encoded)}"
+    assert tail.content == encoded[1000:]
+
+    unsatisfiable = client.get(url, headers={"Range": f"bytes={len(encoded)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(encoded)}"
+
+    assert client.get(url, headers={"Range": "bytes=-10"}).status_code == 200
+    assert client.get(url, headers={"Range": "chars=0-9", "If-Range": '"stale"'}).status_code == 200
+    assert client.get(url, headers={"Range": "chars=0-9", "If-Range": etag}).status_code == 206
+
+
+def test_script_library_avatar_route_revalidates_with_etag():
+    service = _create_service()
+
+    async def _upload_avatar():
+        library = await service.create_library(CreateScriptLibraryRequest(name="头像库", description=None))
+        await service.upload_library_avatar(library.id, UploadFile(file=BytesIO(b"avatar-bytes"), filename="avatar.png"))
+        return library.id
+
+    library_id = asyncio.run(_upload_avatar())
+    client = _create_app_client(service)
+    url = f"/api/v1/scripts/libraries/{library_id}/avatar"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"avatar-bytes"
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    not_modified = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
@@ -0,0 +1,95 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from src.modules.scripts.domain.exceptions import ScriptTextTooLongError
+from src.modules.scripts.infrastructure.services.file_text_extractor import FileTextExtractor
+from src.modules.scripts.infrastructure.services.script_upload_stream import (
+    ENCODING_SAMPLE_SIZE,
+    ScriptUploadStream,
+    TextLengthCounter,
+)
+
+
+def test_text_length_counter_matches_stripped_length():
+    text = "  \n第一句。 第二句。\n\n  "
+    counter = TextLengthCounter(max_text_length=100)
+
+    for segment in ["  ", "\n第一句。", " ", "第二句。\n", "\n  "]:
+        counter.feed(segment)
+
+    assert counter.length == len(text.strip())
+
+
+def test_text_length_counter_ignores_trailing_whitespace_at_limit():
+    counter = TextLengthCounter(max_text_length=3)
+
+    counter.feed("abc")
+    counter.feed("   \n")
+
+    assert counter.length == 3
+
+
+def test_text_length_counter_raises_when_limit_exceeded():
+    counter = TextLengthCounter(max_text_length=3)
+    counter.feed("ab")
+
+    with pytest.raises(ScriptTextTooLongError):
+        counter.feed("cd")
+
+
+def test_script_upload_stream_hashes_and_counts_in_small_reads():
+    data = "  第一句。第二句。  ".encode("utf-8")
+    stream = ScriptUploadStream(BytesIO(data), max_text_length=100)
+
+    uploaded = b""
+    while chunk := stream.read(5):
+        uploaded += chunk
+    stream.finish()
+
+    assert uploaded == data
+    assert stream.content_hash == hashlib.sha256(data).hexdigest()
+    assert stream.text_length == len("第一句。第二句。")
+
+
+def test_script_upload_stream_detects_gb18030_text():
+    data = "中文内容".encode("gb18030")
+    stream = ScriptUploadStream(BytesIO(data), max_text_length=100)
+
+    stream.finish()
+
+    assert stream.text_length == 4
+
+
+def test_detect_plain_text_encoding_keeps_utf8_when_sample_splits_a_character():
+    data = ("中" * 2000).encode("utf-8")
+    sample = data[:ENCODING_SAMPLE_SIZE]
+    assert len(sample) % 3 != 0
+
+    assert FileTextExtractor.detect_plain_text_encoding(sample) == "utf-8"
+
+    stream = ScriptUploadStream(BytesIO(data), max_text_length=10000)
+    stream.finish()
+    assert stream.text_length == 2000
+
+
+def test_script_upload_stream_aborts_before_reading_whole_source():
+    source = BytesIO(b"a" * 1000)
+    stream = ScriptUploadStream(source, max_text_length=10)
+
+    with pytest.raises(ScriptTextTooLongError):
+        while stream.read(16):
+            pass
+
+    assert source.tell() == 16
+
+
+def test_script_upload_stream_skips_text_counting_without_limit():
+    data = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+    stream = ScriptUploadStream(BytesIO(data))
+
+    stream.finish()
+
+    assert stream.text_length is None
+    assert stream.content_hash == hashlib.sha256(data).hexdigest()